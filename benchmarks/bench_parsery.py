@@ -0,0 +1,143 @@
+"""
+Benchmark backendów parsera HTML na korpusie zapisanych stron (benchmarks/fixtures).
+
+Uruchomienie z katalogu głównego repozytorium:
+    python benchmarks/bench_parsery.py [--powtorzenia 20]
+
+Dla każdego zainstalowanego backendu z PARSERY_HTML mierzy czas parsowania
+i ekstrakcji na stronę (GoogleScraper.parse_article oraz
+przetworz_tresc_artykulu) i sprawdza, czy wynik jest identyczny z html.parser. Sprawdza też, czy
+GoogleScraper._extract_content nie powtarza tych samych bloków tekstu
+(zagnieżdżone <p>/<li>/<table>) ani nie skleja akapitów <p> w jeden blok
+(tabela układu strony, kilka <p> w <li>) i nie gubi tekstu leżącego
+bezpośrednio w <td>/<li> obok bloków. Kod wyjścia 1 oznacza różnicę między
+backendami, powtórzony, sklejony albo zgubiony blok.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+KATALOG = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(KATALOG))
+
+from bs4.builder import builder_registry  # noqa: E402
+
+import osint_covid_report as osint  # noqa: E402
+
+
+def wczytaj_korpus():
+    korpus = {}
+    for sciezka in sorted(glob.glob(os.path.join(KATALOG, 'fixtures', '*.html'))):
+        with open(sciezka, encoding='utf-8') as f:
+            korpus[os.path.basename(sciezka)] = f.read()
+    return korpus
+
+
+def zmierz(funkcja, powtorzenia):
+    """Zwraca (wynik, mediana czasu w ms)"""
+    czasy = []
+    wynik = None
+    for _ in range(powtorzenia):
+        start = time.perf_counter()
+        wynik = funkcja()
+        czasy.append((time.perf_counter() - start) * 1000)
+    czasy.sort()
+    return wynik, czasy[len(czasy) // 2]
+
+
+def powtorzone_bloki(content):
+    """Zwraca bloki tekstu, które występują w treści więcej niż raz"""
+    bloki = [linia.strip() for linia in content.split('\n') if linia.strip()]
+    return sorted({blok for blok in bloki if bloki.count(blok) > 1})
+
+
+def sklejone_akapity(html, content):
+    """Zwraca akapity <p>, które trafiły do treści, ale nie jako osobny blok
+    (sklejone z sąsiednimi albo spłaszczone do wiersza tabeli)"""
+    bloki = {linia.strip() for linia in content.split('\n')}
+    splaszczona = ' '.join(content.replace('|', ' ').split())
+    akapity = (p.get_text(' ', strip=True) for p in osint.parsuj_html(html, 'html.parser').find_all('p'))
+    return [akapit for akapit in akapity if len(akapit) > 20 and akapit not in bloki and akapit in splaszczona]
+
+
+def zgubiony_luzny_tekst(html, content):
+    """Zwraca tekst leżący bezpośrednio w <td>/<li> artykułu (poza <p> i innymi
+    blokami), którego brakuje w treści"""
+    from bs4.element import NavigableString
+
+    splaszczona = ' '.join(content.split())
+    soup = osint.parsuj_html(html, 'html.parser')
+    zgubione = []
+    for element in soup.select('article td, article li, main td, main li'):
+        for fragment in element.children:
+            tekst = ' '.join(str(fragment).split()) if type(fragment) is NavigableString else ''
+            if len(tekst) > 20 and tekst not in splaszczona:
+                zgubione.append(tekst)
+    return zgubione
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--powtorzenia', type=int, default=20)
+    args = parser.parse_args()
+
+    korpus = wczytaj_korpus()
+    backendy = [nazwa for nazwa in osint.PARSERY_HTML if builder_registry.lookup(nazwa)]
+    # Scraper bez cache - mierzymy wyłącznie parsowanie
+    scrapery = {
+        nazwa: osint.GoogleScraper(http_client=osint.HTTPClient(), parser=nazwa)
+        for nazwa in backendy
+    }
+
+    print(f"{'strona':<22} {'KB':>6} " + ''.join(f"{nazwa:>14}" for nazwa in backendy) + "  zgodność")
+    roznice = 0
+    sumy = dict.fromkeys(backendy, 0.0)
+    for nazwa_pliku, html in korpus.items():
+        wzorzec = None
+        czasy = {}
+        zgodnosc = []
+        for backend in reversed(backendy):  # html.parser (ostatni) jest wzorcem
+            scraper = scrapery[backend]
+            wynik, czasy[backend] = zmierz(
+                lambda: (
+                    scraper.parse_article('http://fixture/' + nazwa_pliku, html),
+                    osint.przetworz_tresc_artykulu(html, backend)
+                ),
+                args.powtorzenia
+            )
+            sumy[backend] += czasy[backend]
+            if wzorzec is None:
+                wzorzec = wynik
+            elif wynik != wzorzec:
+                zgodnosc.append(backend)
+                roznice += 1
+        (_, content), _ = wzorzec
+        powtorzone = powtorzone_bloki(content)
+        if powtorzone:
+            zgodnosc.append(f"{len(powtorzone)} powtórzonych bloków")
+            roznice += 1
+        sklejone = sklejone_akapity(html, content)
+        if sklejone:
+            zgodnosc.append(f"{len(sklejone)} sklejonych akapitów")
+            roznice += 1
+        zgubione = zgubiony_luzny_tekst(html, content)
+        if zgubione:
+            zgodnosc.append(f"{len(zgubione)} zgubionych tekstów z <td>/<li>")
+            roznice += 1
+        print(
+            f"{nazwa_pliku:<22} {len(html.encode('utf-8')) // 1024:>6} "
+            + ''.join(f"{czasy[b]:>11.1f} ms" for b in backendy)
+            + ("  OK" if not zgodnosc else "  RÓŻNICE: " + ", ".join(zgodnosc))
+        )
+
+    print(f"{'średnio na stronę':<29} " + ''.join(
+        f"{sumy[b] / max(len(korpus), 1):>11.1f} ms" for b in backendy
+    ))
+    return 1 if roznice else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
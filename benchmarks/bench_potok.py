@@ -0,0 +1,271 @@
+"""
+Benchmark całego potoku GoogleScraper bez sieci i bez limitu SerpApi.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python benchmarks/bench_potok.py [--zapytania 4] [--wyniki 10] [--opoznienie 50]
+        [--bledy 0.05] [--rozmiar-kb 0] [--domeny 4] [--powtorzenia 3]
+    python benchmarks/bench_potok.py --serwer [...]   - sam serwer, np. dla GUI
+        (OSINT_SERPAPI_URL=<adres serpapi> python osint_covid_report.py)
+
+Lokalny serwer (osobny proces, żeby szczytowe RSS dotyczyło tylko potoku)
+udaje SerpApi pod /search - organic_results są stałe dla danego q - i serwuje
+strony z korpusu benchmarks/fixtures pod /artykul/<n>, z zadanym opóźnieniem,
+odsetkiem błędów HTTP 500 i opcjonalnym wypełnieniem do zadanego rozmiaru.
+Każda domena to osobny adres 127.0.0.x (na macOS adresy inne niż 127.0.0.1
+wymagają aliasów interfejsu lo0 - wtedy --domeny 1).
+
+Mierzone są: artykuły/s całego scrape_topic (wyszukiwanie, pobieranie,
+parsowanie, archiwum, deduplikacja), czas parse na stronę ze spanów tracera
+i szczytowe RSS procesu. Limit żądań na domenę jest domyślny dla aplikacji
+(--bez-limitu go wyłącza). Cache HTTP i archiwum trafiają do katalogu
+tymczasowego. Kod wyjścia 1 oznacza, że liczba udanych i nieudanych pobrań
+nie zgadza się z wstrzykniętymi błędami.
+"""
+
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+KATALOG = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(KATALOG))
+
+# Parametry przekazywane do procesu serwera
+PARAMETRY_SERWERA = ('opoznienie', 'rozrzut', 'opoznienie_wyszukiwania', 'bledy', 'rozmiar_kb', 'domeny')
+
+AKAPIT_WYPELNIENIA = (
+    "<p>Komentarz czytelnika {}: nie zgadzam się z autorem, dane z ostatniego "
+    "tygodnia pokazują zupełnie inny obraz sytuacji w regionie.</p>\n"
+)
+
+
+def numery_artykulow(zapytanie, liczba):
+    """Numery artykułów zwracanych dla zapytania (te same w serwerze i kliencie)"""
+    baza = zlib.crc32(zapytanie.encode('utf-8')) % 100000 * 100
+    return [baza + i for i in range(min(liczba, 100))]
+
+
+def czy_blad(numer, odsetek):
+    """Czy artykuł o danym numerze ma zwracać HTTP 500"""
+    return random.Random(numer).random() < odsetek
+
+
+def wczytaj_korpus(rozmiar_kb=0):
+    """Strony z fixtures jako bajty, opcjonalnie wypełnione do rozmiar_kb"""
+    korpus = []
+    for sciezka in sorted(glob.glob(os.path.join(KATALOG, 'fixtures', '*.html'))):
+        with open(sciezka, encoding='utf-8') as f:
+            html = f.read()
+        brakuje = rozmiar_kb * 1024 - len(html.encode('utf-8'))
+        if brakuje > 0:
+            ile = brakuje // len(AKAPIT_WYPELNIENIA) + 1
+            komentarze = '<div class="komentarze">\n' + ''.join(
+                AKAPIT_WYPELNIENIA.format(i) for i in range(ile)
+            ) + '</div>\n'
+            pozycja = html.rfind('</body>')
+            pozycja = len(html) if pozycja < 0 else pozycja
+            html = html[:pozycja] + komentarze + html[pozycja:]
+        korpus.append(html.encode('utf-8'))
+    return korpus
+
+
+class ObslugaZadan(BaseHTTPRequestHandler):
+    """Zamiennik SerpApi i serwisów informacyjnych; konfiguracja w self.server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        adres = urlparse(self.path)
+        if adres.path == '/search':
+            self.wyszukiwanie(parse_qs(adres.query))
+        elif adres.path.startswith('/artykul/'):
+            self.artykul(adres.path.rsplit('/', 1)[-1])
+        else:
+            self.odpowiedz(404, b'', 'text/plain')
+
+    def odpowiedz(self, status, tresc, typ):
+        self.send_response(status)
+        self.send_header('Content-Type', typ)
+        self.send_header('Content-Length', str(len(tresc)))
+        self.end_headers()
+        self.wfile.write(tresc)
+
+    def wyszukiwanie(self, parametry):
+        cfg = self.server.konfiguracja
+        time.sleep(cfg['opoznienie_wyszukiwania'] / 1000)
+        zapytanie = parametry.get('q', [''])[0]
+        liczba = int(parametry.get('num', ['10'])[0])
+        domeny = cfg['adresy_domen']
+        wyniki = [
+            {
+                'position': pozycja,
+                'title': f"Artykuł {numer} - {zapytanie}",
+                'link': f"{domeny[numer % len(domeny)]}/artykul/{numer}",
+                'snippet': f"Fragment artykułu {numer} dla zapytania {zapytanie}."
+            }
+            for pozycja, numer in enumerate(numery_artykulow(zapytanie, liczba), 1)
+        ]
+        tresc = json.dumps({
+            'search_metadata': {'status': 'Success'},
+            'search_parameters': {'q': zapytanie, 'num': liczba},
+            'organic_results': wyniki
+        }).encode('utf-8')
+        self.odpowiedz(200, tresc, 'application/json; charset=utf-8')
+
+    def artykul(self, numer):
+        cfg = self.server.konfiguracja
+        try:
+            numer = int(numer)
+        except ValueError:
+            return self.odpowiedz(404, b'', 'text/plain')
+        opoznienie = cfg['opoznienie'] + random.uniform(-cfg['rozrzut'], cfg['rozrzut'])
+        time.sleep(max(0.0, opoznienie) / 1000)
+        if czy_blad(numer, cfg['bledy']):
+            return self.odpowiedz(500, b'Internal Server Error', 'text/plain')
+        korpus = cfg['korpus']
+        self.odpowiedz(200, korpus[numer % len(korpus)], 'text/html; charset=utf-8')
+
+
+def uruchom_serwery(args):
+    """Startuje po jednym serwerze na domenę; zwraca adresy bazowe"""
+    konfiguracja = {nazwa: getattr(args, nazwa) for nazwa in PARAMETRY_SERWERA}
+    konfiguracja['korpus'] = wczytaj_korpus(args.rozmiar_kb)
+    serwery = []
+    for i in range(args.domeny):
+        serwer = ThreadingHTTPServer((f'127.0.0.{i + 1}', 0), ObslugaZadan)
+        serwer.daemon_threads = True
+        serwer.konfiguracja = konfiguracja
+        threading.Thread(target=serwer.serve_forever, daemon=True).start()
+        serwery.append(serwer)
+    konfiguracja['adresy_domen'] = [
+        f"http://{serwer.server_address[0]}:{serwer.server_address[1]}" for serwer in serwery
+    ]
+    return {'serpapi': konfiguracja['adresy_domen'][0], 'domeny': konfiguracja['adresy_domen']}
+
+
+def tryb_serwera(args):
+    adresy = uruchom_serwery(args)
+    print(json.dumps(adresy), flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def szczytowe_rss_mb():
+    """Szczytowe RSS procesu w MB (None, gdy system nie udostępnia modułu resource)"""
+    if importlib.util.find_spec('resource') is None:
+        return None
+    import resource
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux podaje kilobajty, macOS bajty
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def mediana(wartosci):
+    wartosci = sorted(wartosci)
+    return wartosci[len(wartosci) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--serwer', action='store_true', help='uruchom tylko lokalny serwer')
+    parser.add_argument('--zapytania', type=int, default=4, help='zapytań w temacie')
+    parser.add_argument('--wyniki', type=int, default=10, help='wyników na zapytanie (num)')
+    parser.add_argument('--opoznienie', type=float, default=50, help='opóźnienie artykułu w ms')
+    parser.add_argument('--rozrzut', type=float, default=20, help='losowy rozrzut opóźnienia w ms')
+    parser.add_argument('--opoznienie-wyszukiwania', type=float, default=300, help='opóźnienie /search w ms')
+    parser.add_argument('--bledy', type=float, default=0.05, help='odsetek artykułów z HTTP 500')
+    parser.add_argument('--rozmiar-kb', type=int, default=0, help='wypełnij strony do tylu KB')
+    parser.add_argument('--domeny', type=int, default=4, help='liczba domen (adresów 127.0.0.x)')
+    parser.add_argument('--watki', type=int, default=8, help='max_workers scrapera')
+    parser.add_argument('--na-domene', type=int, default=2, help='max_per_domain scrapera')
+    parser.add_argument('--bez-limitu', action='store_true', help='wyłącz limit żądań na domenę')
+    parser.add_argument('--powtorzenia', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.serwer:
+        return tryb_serwera(args)
+
+    polecenie = [sys.executable, os.path.abspath(__file__), '--serwer']
+    for nazwa in PARAMETRY_SERWERA:
+        polecenie += ['--' + nazwa.replace('_', '-'), str(getattr(args, nazwa))]
+    serwer = subprocess.Popen(polecenie, stdout=subprocess.PIPE, text=True)
+    try:
+        adresy = json.loads(serwer.stdout.readline())
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as katalog:
+            # Moduł czyta te zmienne przy imporcie
+            os.environ['OSINT_SERPAPI_URL'] = adresy['serpapi']
+            os.environ['OSINT_CACHE_DIR'] = os.environ['OSINT_DATA_DIR'] = katalog
+            return zmierz_potok(args)
+    finally:
+        serwer.terminate()
+        serwer.wait()
+
+
+def zmierz_potok(args):
+    import osint_covid_report as osint
+
+    zapytania = [f"benchmark potoku {i}" for i in range(args.zapytania)]
+    numery = {n for zapytanie in zapytania for n in numery_artykulow(zapytanie, args.wyniki)}
+    oczekiwane_bledy = sum(czy_blad(n, args.bledy) for n in numery)
+    # Bez cache; limit żądań na domenę jak w aplikacji (OSINT_RATE_LIMIT/OSINT_RATE_BURST),
+    # chyba że wyłączono go przez --bez-limitu
+    limiter = osint.DomainRateLimiter(default_rate=1e9, default_burst=1e9) if args.bez_limitu else None
+    http = osint.HTTPClient(rate_limiter=limiter)
+    tracer = osint.get_tracer()
+
+    print(f"{len(zapytania)} zapytań x {args.wyniki} wyników, {len(numery)} artykułów "
+          f"na {args.domeny} domenach, oczekiwane błędy: {oczekiwane_bledy}, limit domeny: "
+          + ("brak" if args.bez_limitu else f"{http.rate_limiter.default_rate:g}/s, seria {http.rate_limiter.default_burst}"))
+    print(f"{'przebieg':<10} {'czas s':>8} {'udane':>6} {'błędy':>6} {'duplikaty':>10} "
+          f"{'art/s':>8} {'parse ms':>9} {'RSS MB':>8}")
+    niezgodnosci = 0
+    pomiary = []
+    for przebieg in range(1, args.powtorzenia + 1):
+        scraper = osint.GoogleScraper(
+            max_workers=args.watki, max_per_domain=args.na_domene,
+            http_client=http, api_key='benchmark'
+        )
+        start = time.perf_counter()
+        scraper.scrape_topic(zapytania, num_results=args.wyniki, force_refresh=True)
+        czas = time.perf_counter() - start
+
+        statystyki = scraper.get_statistics().values()
+        udane = sum(s['udane'] for s in statystyki)
+        nieudane = sum(s['nieudane'] for s in statystyki)
+        parse = tracer.summary(scraper.last_run_id).get('parse')
+        parse_ms = parse['suma'] / parse['liczba'] * 1000 if parse else 0.0
+        rss = szczytowe_rss_mb()
+        pomiary.append((udane / czas, parse_ms))
+        zgodnosc = ""
+        if udane != len(numery) - oczekiwane_bledy or nieudane != oczekiwane_bledy:
+            zgodnosc = "  NIEZGODNOŚĆ"
+            niezgodnosci += 1
+        print(f"{przebieg:<10} {czas:>8.2f} {udane:>6} {nieudane:>6} {scraper.duplicates_removed:>10} "
+              f"{udane / czas:>8.1f} {parse_ms:>9.1f} {'-' if rss is None else f'{rss:.0f}':>8}{zgodnosc}")
+
+    print(f"mediana: {mediana([p[0] for p in pomiary]):.1f} artykułów/s, "
+          f"parse {mediana([p[1] for p in pomiary]):.1f} ms/stronę")
+    print()
+    print(tracer.summary_table(scraper.last_run_id))
+    return 1 if niezgodnosci else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark czasu startu: import modułu i czas do pokazania okna OSINTUI.
+
+Uruchomienie z katalogu głównego repozytorium:
+    python benchmarks/bench_start.py [--powtorzenia 5]
+
+Każdy pomiar to osobny proces Pythona (zimny import). Sprawdzane jest też,
+czy import nie ładuje ciężkich zależności (tkinter, openai, bs4, requests,
+serpapi). Pomiar okna wymaga wyświetlacza - bez niego jest pomijany.
+Kod wyjścia 1 oznacza przekroczenie budżetu albo zbyt wczesny import.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+KATALOG_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CIEZKIE_MODULY = ('tkinter', 'openai', 'bs4', 'requests', 'serpapi')
+
+# Budżety w sekundach (mediana z powtórzeń)
+BUDZET_IMPORTU = 0.25
+BUDZET_OKNA = 1.5
+
+SKRYPT_IMPORTU = """
+import json, sys, time
+start = time.perf_counter()
+import osint_covid_report
+czas = time.perf_counter() - start
+print(json.dumps({"czas": czas, "zaladowane": [m for m in %r if m in sys.modules]}))
+""" % (CIEZKIE_MODULY,)
+
+SKRYPT_OKNA = """
+import json, time
+start = time.perf_counter()
+import osint_covid_report as osint
+osint._zaladuj_tkinter()
+try:
+    root = osint.tk.Tk()
+except osint.tk.TclError as e:
+    print(json.dumps({"blad": str(e)}))
+    raise SystemExit(0)
+app = osint.OSINTUI(root)
+root.update()
+czas = time.perf_counter() - start
+root.destroy()
+print(json.dumps({"czas": czas}))
+"""
+
+
+def uruchom(skrypt):
+    wynik = subprocess.run(
+        [sys.executable, '-c', skrypt],
+        cwd=KATALOG_REPO, capture_output=True, text=True, check=True
+    )
+    return json.loads(wynik.stdout.strip().splitlines()[-1])
+
+
+def mediana(wartosci):
+    wartosci = sorted(wartosci)
+    return wartosci[len(wartosci) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--powtorzenia', type=int, default=5)
+    parser.add_argument('--budzet-importu', type=float, default=BUDZET_IMPORTU)
+    parser.add_argument('--budzet-okna', type=float, default=BUDZET_OKNA)
+    args = parser.parse_args()
+    bledy = 0
+
+    importy = [uruchom(SKRYPT_IMPORTU) for _ in range(args.powtorzenia)]
+    czas_importu = mediana([p['czas'] for p in importy])
+    zaladowane = sorted({m for p in importy for m in p['zaladowane']})
+    print(f"import osint_covid_report: {czas_importu * 1000:.0f} ms (budżet {args.budzet_importu * 1000:.0f} ms)")
+    if czas_importu > args.budzet_importu:
+        print("  PRZEKROCZONO BUDŻET IMPORTU")
+        bledy += 1
+    if zaladowane:
+        print(f"  import ładuje ciężkie moduły: {', '.join(zaladowane)}")
+        bledy += 1
+
+    okno = uruchom(SKRYPT_OKNA)
+    if 'blad' in okno:
+        print(f"czas do okna OSINTUI: pominięto (brak wyświetlacza: {okno['blad']})")
+    else:
+        czasy = [okno['czas']] + [uruchom(SKRYPT_OKNA)['czas'] for _ in range(args.powtorzenia - 1)]
+        czas_okna = mediana(czasy)
+        print(f"czas do okna OSINTUI: {czas_okna * 1000:.0f} ms (budżet {args.budzet_okna * 1000:.0f} ms)")
+        if czas_okna > args.budzet_okna:
+            print("  PRZEKROCZONO BUDŻET STARTU OKNA")
+            bledy += 1
+
+    return 1 if bledy else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
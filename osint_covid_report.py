@@ -1,1404 +1,3791 @@
-"""
-UWAGA: Przed uruchomieniem aplikacji należy:
-1. Uzyskać klucz API OpenAI: https://platform.openai.com/account/api-keys
-2. Uzyskać klucz API SerpApi: https://serpapi.com/
-3. Zastąpić placeholdery 'TWÓJ_KLUCZ_API_*' własnymi kluczami
-"""
-
-import json
-from serpapi.google_search import GoogleSearch
-import requests
-from datetime import datetime
-from bs4 import BeautifulSoup
-import time
-import logging
-from urllib.parse import urlparse
-import csv
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-from threading import Thread
-from tkinter import font as tkfont
-import queue
-from openai import OpenAI
-import threading
-import serpapi
-import re
-import os
-
-# Konfiguracja loggera
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('osint_scraping.log'),
-        logging.StreamHandler()
-    ]
-)
-
-def zapisz_statystyki(statystyki, nazwa_pliku='statystyki_scrapingu.csv'):
-    with open(nazwa_pliku, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['domena', 'udane', 'nieudane', 'całkowity_czas'])
-        writer.writeheader()
-        for domena, stats in statystyki.items():
-            writer.writerow({
-                'domena': domena,
-                'udane': stats['udane'],
-                'nieudane': stats['nieudane'],
-                'całkowity_czas': f"{stats['czas_calkowity']:.2f}s"
-            })
-
-def pobierz_tresc_artykulu(url):
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer']):
-            element.decompose()
-        
-        content = soup.find('article') or soup.find('main') or soup.find('div', class_='content')
-        
-        if content:
-            # Zbieramy paragrafy zachowując strukturę tekstu
-            paragraphs = []
-            for p in content.find_all(['p', 'h1', 'h2', 'h3']):
-                text = p.get_text(strip=True)
-                if text:  # Pomijamy puste paragrafy
-                    # Jeśli to nagłówek, dodaj dodatkowy odstęp
-                    if p.name in ['h1', 'h2', 'h3']:
-                        paragraphs.append('\n' + text.upper() + '\n')
-                    else:
-                        paragraphs.append(text)
-            
-            # Łączymy paragrafy z odpowiednimi odstępami
-            text = '\n\n'.join(paragraphs)
-            
-            # Dodatkowe czyszczenie tekstu
-            text = text.replace('..', '.')  # Usuń podwójne kropki
-            text = ' '.join(text.split())  # Normalizuj spacje
-            text = text.replace(' .', '.')  # Popraw spacje przed kropkami
-            
-            # Dodaj odstępy po kropkach jeśli ich nie ma
-            text = '. '.join(segment.strip() for segment in text.split('.') if segment.strip())
-            text += '.'
-        else:
-            text = ' '.join([p.get_text(strip=True) for p in soup.find_all('p')])
-        
-        time.sleep(2)
-        return {
-            'tekst': text,
-            'data_publikacji': None,
-            'autorzy': []
-        }
-    except Exception as e:
-        logging.error(f"Nie udało się pobrać treści z {url}: {e}")
-        return None
-
-def wykonaj_wyszukiwanie(zapytanie, api_key):
-    parametry_wyszukiwania = {
-        "q": zapytanie,
-        "hl": "pl",
-        "gl": "pl",
-        "api_key": "TWÓJ_KLUCZ_API_SERPAPI",  # Zastąp swoim kluczem API SerpApi
-        "num": 3
-    }
-    
-    try:
-        logging.info(f"Wykonuję zapytanie: {zapytanie}")
-        wyniki = GoogleSearch(parametry_wyszukiwania).get_dict()
-        return wyniki.get('organic_results', [])[:3]  # dodatkowo zabezpieczamy limit
-    except Exception as e:
-        logging.error(f"Błąd podczas wyszukiwania: {e}")
-        return []
-
-def zapisz_raport(wyniki, nazwa_pliku, statystyki):
-    with open(nazwa_pliku, 'w', encoding='utf-8') as plik:
-        plik.write(f"Szczegółowy Raport OSINT - COVID-19 Impact\n")
-        plik.write(f"Data wygenerowania: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        plik.write("=" * 100 + "\n\n")
-        
-        # Dodanie podsumowania na początku raportu
-        plik.write("PODSUMOWANIE SCRAPINGU:\n")
-        plik.write("-" * 50 + "\n")
-        for domena, stats in statystyki.items():
-            plik.write(f"Domena: {domena}\n")
-            plik.write(f"Udane pobrania: {stats['udane']}\n")
-            plik.write(f"Nieudane pobrania: {stats['nieudane']}\n")
-            plik.write(f"Całkowity czas: {stats['czas_calkowity']:.2f}s\n")
-            plik.write("-" * 30 + "\n")
-        plik.write("\nSZCZEGÓŁOWE WYNIKI:\n")
-        plik.write("=" * 100 + "\n\n")
-        
-        for i, wynik in enumerate(wyniki, 1):
-            plik.write(f"ARTYKUŁ #{i}\n")
-            plik.write("=" * 50 + "\n")
-            plik.write(f"Tytuł: {wynik.get('title', 'Brak tytułu')}\n")
-            plik.write(f"Link: {wynik.get('link', 'Brak linku')}\n\n")
-            
-            # Pobieramy pełną treść artykułu
-            tresc = pobierz_tresc_artykulu(wynik.get('link', ''))
-            if tresc:
-                if tresc['data_publikacji']:
-                    plik.write(f"Data publikacji: {tresc['data_publikacji']}\n")
-                plik.write("\nSTRESZCZENIE Z WYSZUKIWARKI:\n")
-                plik.write(f"{wynik.get('snippet', 'Brak opisu')}\n\n")
-                plik.write("PEŁNA TREŚĆ ARTYKUŁU:\n")
-                plik.write(f"{tresc['tekst']}\n")
-            else:
-                plik.write("\nSTRESZCZENIE Z WYSZUKIWARKI:\n")
-                plik.write(f"{wynik.get('snippet', 'Brak opisu')}\n")
-                plik.write("\nNie udało się pobrać pełnej treści artykułu.\n")
-            
-            plik.write("\n" + "=" * 100 + "\n\n")
-
-class GPTReportGenerator:
-    def __init__(self):
-        self.api_key = "TWÓJ_KLUCZ_API_OPENAI"  # Zastąp swoim kluczem API OpenAI
-        try:
-            self.client = OpenAI(
-                api_key=self.api_key,
-                timeout=30.0  # Zwiększamy timeout
-            )
-            logging.info("Klient OpenAI zainicjalizowany")
-        except Exception as e:
-            logging.error(f"Błąd inicjalizacji klienta OpenAI: {str(e)}")
-            raise
-
-    def generate_ai_report(self):
-        try:
-            if not self.openai_client:
-                self.log_message("Klient OpenAI nie jest zainicjalizowany. Sprawdź klucz API.", 'ERROR')
-                return
-            
-            self.log_message("Inicjalizacja generowania raportu AI...", 'PROCESS')
-            
-            system_prompt = getattr(self, 'current_template', self.default_template)
-            template_name = getattr(self, 'current_template_name', 'Domyślny szablon')
-            self.log_message(f"Używam szablonu: {template_name}", 'INFO')
-            
-            self.status_var.set("Generowanie raportu AI...")
-            
-            # Pobierz tekst i ogranicz jego długość
-            scraped_content = self.scraping_text.get("1.0", tk.END)
-            max_chars = 4000  # Zmniejszamy maksymalną długość tekstu
-            if len(scraped_content) > max_chars:
-                scraped_content = scraped_content[:max_chars] + "...[treść skrócona]"
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": scraped_content}
-                ],
-                temperature=0.7,
-                max_tokens=4000,
-                presence_penalty=0.3,
-                frequency_penalty=0.3
-            )
-
-            if response.choices and response.choices[0].message.content:
-                report = response.choices[0].message.content
-                self.display_ai_report(report)
-                self.log_message("Raport AI wygenerowany pomyślnie", 'SUCCESS')
-            else:
-                self.log_message("Nie udało się wygenerować raportu", 'ERROR')
-
-        except Exception as e:
-            self.log_message(f"Błąd podczas generowania raportu: {str(e)}", 'ERROR')
-            self.display_ai_report("Wystąpił błąd podczas generowania raportu.")
-
-    def test_api(self):
-        """Metoda do testowania połączenia z API"""
-        try:
-            logging.info("Test połączenia z API...")
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": "Test."}],
-                max_tokens=1
-            )
-            logging.info("Test API udany")
-            return True, "Połączenie z API działa poprawnie"
-        except Exception as e:
-            logging.error(f"Test API nieudany: {str(e)}")
-            return False, f"Błąd połączenia: {str(e)}"
-
-class GoogleScraper:
-    def __init__(self):
-        self.api_key = ":)"
-        self.statystyki = {}
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-    def scrape_article(self, url):
-        """Ulepszona funkcja scrapowania artykułu z metadanymi"""
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Metadane
-            metadata = {
-                "url": url,
-                "title": self._extract_title(soup),
-                "date": self._extract_date(soup),
-                "author": self._extract_author(soup),
-                "keywords": self._extract_keywords(soup),
-                "description": self._extract_description(soup),
-                "language": self._detect_language(soup),
-                "word_count": 0,
-                "scraping_success": True,
-                "error": None
-            }
-            
-            # Treść
-            content = self._extract_content(soup)
-            if not content:
-                metadata["scraping_success"] = False
-                metadata["error"] = "Nie udało się pobrać treści"
-                return metadata, ""
-            
-            metadata["word_count"] = len(content.split())
-            
-            return metadata, content
-            
-        except Exception as e:
-            return {
-                "url": url,
-                "scraping_success": False,
-                "error": str(e)
-            }, ""
-
-    def _extract_title(self, soup):
-        """Ekstrakcja tytułu"""
-        title = soup.title.string if soup.title else ""
-        og_title = soup.find("meta", property="og:title")
-        if og_title:
-            title = og_title["content"]
-        return title.strip() if title else ""
-
-    def _extract_date(self, soup):
-        """Ekstrakcja daty"""
-        date = soup.find("meta", property="article:published_time")
-        if date:
-            return date["content"]
-        return None
-
-    def _extract_author(self, soup):
-        """Ekstrakcja autora"""
-        author = soup.find("meta", property="article:author")
-        if author:
-            return author["content"]
-        return None
-
-    def _extract_keywords(self, soup):
-        """Ekstrakcja słów kluczowych"""
-        keywords = soup.find("meta", property="keywords")
-        if keywords:
-            return keywords["content"].split(",")
-        return []
-
-    def _extract_description(self, soup):
-        """Ekstrakcja opisu"""
-        description = soup.find("meta", property="description")
-        if description:
-            return description["content"]
-        return None
-
-    def _detect_language(self, soup):
-        """Ekstrakcja języka"""
-        lang = soup.find("meta", property="og:locale")
-        if lang:
-            return lang["content"].split("-")[0]
-        return None
-
-    def _extract_content(self, soup):
-        """Ekstrakcja treści artykułu"""
-        content = ""
-        
-        # Próbujemy różne selektory dla różnych stron
-        main_content = soup.find('article') or \
-                      soup.find('main') or \
-                      soup.find(class_=['content', 'article-content', 'post-content']) or \
-                      soup.find(id=['content', 'main-content', 'article-content'])
-        
-        if main_content:
-            # Pobieramy wszystkie paragrafy i nagłówki
-            for element in main_content.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'li', 'table']):
-                text = element.get_text(strip=True)
-                if text and len(text) > 20:  # Filtrujemy krótkie fragmenty
-                    if element.name.startswith('h'):
-                        content += f"\n### {text}\n"
-                    elif element.name == 'table':
-                        # Próba sformatowania tabeli
-                        content += "\n| " + " | ".join(text.split()) + " |\n"
-                    else:
-                        content += f"{text}\n\n"
-        
-        # Jeśli nie znaleźliśmy głównej treści, próbujemy pobrać wszystkie znaczące fragmenty
-        if not content:
-            for element in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'li']):
-                text = element.get_text(strip=True)
-                if text and len(text) > 30:  # Dłuższy próg dla tekstu bez kontekstu
-                    content += f"{text}\n\n"
-        
-        return content.strip()
-
-    def scrape(self, query, num_results=3):
-        try:
-            logging.info(f"Rozpoczynam wyszukiwanie dla: {query}")
-            
-            search = GoogleSearch({
-                "q": query,
-                "hl": "pl",
-                "gl": "pl",
-                "api_key": self.api_key,
-                "num": num_results,
-                "engine": "google"
-            })
-            
-            wyniki = search.get_dict()
-            organic_results = wyniki.get('organic_results', [])
-            
-            processed_results = []
-            for result in organic_results:
-                url = result.get('link')
-                if url:
-                    # Pobierz pełną treść artykułu
-                    metadata, full_content = self.scrape_article(url)
-                    
-                    processed_results.append({
-                        'title': result.get('title', ''),
-                        'link': url,
-                        'snippet': result.get('snippet', ''),
-                        'content': full_content,
-                        'metadata': metadata
-                    })
-            
-            return processed_results
-            
-        except Exception as e:
-            logging.error(f"Błąd podczas scrapowania: {str(e)}")
-            raise e
-
-    def get_statistics(self):
-        """Zwraca zebrane statystyki"""
-        return self.statystyki
-
-class OSINTUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("OSINT Report Generator")
-        self.root.geometry("1200x900")
-        
-        # Inicjalizacja klienta OpenAI z hardcodowanym kluczem
-        try:
-            self.openai_client = OpenAI(
-                api_key=":)
-            )
-            self.log_message("Klient OpenAI zainicjalizowany pomyślnie", 'SUCCESS')
-        except Exception as e:
-            self.log_message(f"Błąd inicjalizacji klienta OpenAI: {str(e)}", 'ERROR')
-            self.openai_client = None
-            
-        # Dodajemy konfigurację
-        self.CONFIG = {
-            'MAX_RETRIES': 3,
-            'RETRY_DELAY': 2,
-            'MAX_TOKENS': 2000,  # Zmniejszamy z 4000 na 2000
-            'MAX_INPUT_LENGTH': 4000,  # Zmniejszamy z 12000 na 4000
-            'QUEUE_CHECK_INTERVAL': 100
-        }
-        
-        # Rozbudowane predefiniowane tematy OSINT
-        self.OSINT_TOPICS = {
-            "COVID-19 Biznes": {
-                "queries": [
-                    "Tomasz Biernacki Dino Polska pandemia COVID-19 rozwój",
-                    "Dino Polska wyniki finansowe 2020 2021 2022",
-                    "Tomasz Biernacki majątek wzrost pandemia",
-                    "Dino Polska strategia rozwój COVID-19",
-                    "Tomasz Biernacki wywiad pandemia biznes"
-                ],
-                "sources": ["biznes", "finanse", "gospodarka"]
-            },
-            "Blockchain Startupy": {
-                "queries": [
-                    "blockchain startupy Polska rozwój inwestycje",
-                    "polski blockchain innowacje technologie",
-                    "kryptowaluty startupy finansowanie Polska",
-                    "blockchain inwestorzy venture capital Polska",
-                    "polska technologia blockchain rozwój projekty"
-                ],
-                "sources": ["technologia", "biznes", "startupy"]
-            },
-            "Elon Musk Relacje": {
-                "queries": [
-                    "Elon Musk SpaceX Tesla współpraca partnerstwa",
-                    "Musk inwestycje projekty technologiczne",
-                    "Tesla SpaceX partnerzy strategiczni",
-                    "Elon Musk relacje biznesowe technologia",
-                    "Musk współpraca firmy technologiczne"
-                ],
-                "sources": ["technologia", "biznes", "innowacje"]
-            },
-            "E-sport Polska": {
-                "queries": [
-                    "e-sport Polska rozwój turnieje gaming",
-                    "polski e-sport inwestycje sponsoring",
-                    "e-sport organizacje turnieje Polska",
-                    "gaming zawodowy rozwój Polska",
-                    "e-sport polska liga profesjonalna"
-                ],
-                "sources": ["gaming", "sport", "technologia"]
-            },
-            "Jack Ma Aktywność": {
-                "queries": [
-                    "Jack Ma działalność publiczna Chiny",
-                    "Alibaba Jack Ma zarządzanie zmiany",
-                    "Jack Ma konflikt rząd chiński biznes",
-                    "Jack Ma obecność medialna aktywność",
-                    "Alibaba Group kierownictwo zmiany"
-                ],
-                "sources": ["biznes", "polityka", "technologia"]
-            },
-            "5G Dezinformacja": {
-                "queries": [
-                    "5G Polska dezinformacja fake news",
-                    "technologia 5G mity Polska",
-                    "5G zagrożenia prawda fałsz",
-                    "dezinformacja 5G źródła Polska",
-                    "5G teorie spiskowe analiza"
-                ],
-                "sources": ["technologia", "media", "bezpieczeństwo"]
-            },
-            "Fintech Cyberbezpieczeństwo": {
-                "queries": [
-                    "fintech cyberbezpieczeństwo zagrożenia Polska",
-                    "sektor finansowy cyberataki trendy",
-                    "fintech bezpieczeństwo technologie",
-                    "cyberbezpieczeństwo bankowość cyfrowa",
-                    "fintech ryzyko cyberzagrożenia"
-                ],
-                "sources": ["technologia", "finanse", "bezpieczeństwo"]
-            },
-            "AI Healthcare": {
-                "queries": [
-                    "sztuczna inteligencja medycyna Polska rozwój",
-                    "AI healthcare startupy innowacje",
-                    "medtech sztuczna inteligencja projekty",
-                    "AI służba zdrowia technologie",
-                    "healthcare innowacje technologiczne Polska"
-                ],
-                "sources": ["medycyna", "technologia", "innowacje"]
-            }
-        }
-        
-        # Style
-        self.style = ttk.Style()
-        self.style.configure('Header.TLabel', font=('Segoe UI', 12, 'bold'))
-        self.style.configure('Info.TLabel', font=('Segoe UI', 10))
-        self.style.configure('Action.TButton', padding=8)
-        
-        # Inicjalizacja zmiennych
-        self.topic_var = tk.StringVar()
-        self.custom_search_var = tk.StringVar()  # do przechowywania wartości
-        self.search_mode = tk.StringVar(value="preset")
-        self.status_var = tk.StringVar(value="Gotowy do rozpoczęcia")
-        self.articles_var = tk.StringVar(value="3")
-        self.queue = queue.Queue()
-        
-        # Dodaj domyślny szablon
-        self.default_template = """Jesteś doświadczonym analitykiem OSINT specjalizującym się w szczegółowych analizach. 
-Twoim zadaniem jest stworzenie bardzo szczegółowego raportu zawierającego:
-
-1. PODSUMOWANIE WYKONAWCZE (min. 500 słów)
-   - Kluczowe ustalenia z analizy
-   - Najważniejsze wnioski i implikacje
-   - Krytyczne punkty wymagające uwagi
-
-2. SZCZEGÓŁOWA ANALIZA (min. 1000 słów)
-   - Dogłębna analiza głównych tematów
-   - Szczegółowe omówienie trendów i wzorców
-   - Analiza kluczowych podmiotów i ich roli
-   - Analiza danych ilościowych i jakościowych
-
-3. KONTEKST I POWIĄZANIA (min. 500 słów)
-   - Szeroki kontekst geopolityczny i ekonomiczny
-   - Szczegółowe powiązania między informacjami
-   - Analiza historyczna i prognozy
-
-4. WNIOSKI I REKOMENDACJE (min. 500 słów)
-   - Szczegółowe wnioski z analizy
-   - Konkretne rekomendacje działań
-   - Analiza potencjalnych ryzyk i szans
-   - Plan działania i następne kroki
-
-Używaj konkretnych danych, liczb i przykładów. Twórz szczegółowe podpunkty i rozbudowane wyjaśnienia."""
-        
-        # Tworzenie menu
-        self.create_menu()
-        
-        # Tworzenie interfejsu
-        self.create_main_interface()
-        
-        # Inicjalizacja loggera
-        self.logger = Logger(self.log_text)
-        
-        # Dodaj w __init__:
-        self.search_mode.trace('w', lambda *args: self.toggle_search_mode())
-
-    def create_menu(self):
-        """Tworzy menu główne aplikacji"""
-        menubar = tk.Menu(self.root)
-        self.root.config(menu=menubar)
-        
-        # Menu Plik
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Plik", menu=file_menu)
-        file_menu.add_command(label="Zapisz raport", command=self.save_report)
-        file_menu.add_command(label="Eksportuj logi", command=self.export_logs)
-        file_menu.add_separator()
-        file_menu.add_command(label="Wyjście", command=self.root.quit)
-        
-        # Menu Narzędzia
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Narzędzia", menu=tools_menu)
-        tools_menu.add_command(label="Ustawienia", command=self.show_settings)
-        tools_menu.add_command(label="Test API", command=self.test_api_connection)
-        
-        # Menu Pomoc
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Pomoc", menu=help_menu)
-        help_menu.add_command(label="Dokumentacja", command=self.show_docs)
-        help_menu.add_command(label="O programie", command=self.show_about)
-    
-    def create_main_interface(self):
-        """Tworzy główny interfejs aplikacji"""
-        # Notebook (zakładki)
-        self.notebook = ttk.Notebook(self.root)
-        self.notebook.pack(fill='both', expand=True, padx=10, pady=5)
-        
-        # Panel główny
-        main_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(main_frame, text="Panel główny")
-        
-        # Panel wyszukiwania
-        search_frame = ttk.LabelFrame(main_frame, text="Opcje wyszukiwania", padding="10")
-        search_frame.pack(fill='x', pady=(0, 10))
-        
-        # Wybór tematu
-        ttk.Label(
-            search_frame,
-            text="Wybierz predefiniowany temat:",
-            style='Info.TLabel'
-        ).pack(anchor='w', pady=(0, 5))
-        
-        self.topic_combo = ttk.Combobox(
-            search_frame,
-            textvariable=self.topic_var,
-            values=list(self.OSINT_TOPICS.keys()),
-            state='readonly',
-            width=50
-        )
-        self.topic_combo.pack(fill='x', pady=(0, 10))
-        
-        # Własne wyszukiwanie
-        ttk.Label(
-            search_frame,
-            text="Lub wprowadź własne zapytanie:",
-            style='Info.TLabel'
-        ).pack(anchor='w', pady=(0, 5))
-        
-        ttk.Entry(
-            search_frame,
-            textvariable=self.custom_search_var,
-            width=50
-        ).pack(fill='x', pady=(0, 10))
-        
-        # Opcje scrapowania
-        options_frame = ttk.LabelFrame(main_frame, text="Opcje scrapowania", padding="10")
-        options_frame.pack(fill='x', pady=(0, 10))
-        
-        ttk.Label(
-            options_frame,
-            text="Liczba artykułów:",
-            style='Info.TLabel'
-        ).pack(side='left', padx=(0, 10))
-        
-        ttk.Spinbox(
-            options_frame,
-            from_=1,
-            to=10,
-            width=5,
-            textvariable=self.articles_var
-        ).pack(side='left')
-        
-        # Przyciski akcji
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill='x', pady=(0, 10))
-        
-        ttk.Button(
-            button_frame,
-            text="Rozpocznij scrapowanie",
-            command=self.start_scraping,
-            style='Action.TButton'
-        ).pack(side='left', padx=5)
-        
-        ttk.Button(
-            button_frame,
-            text="Generuj raport AI",
-            command=self.generate_ai_report,
-            style='Action.TButton'
-        ).pack(side='left', padx=5)
-        
-        # Dodaj po przycisku "Generuj raport AI"
-        ttk.Button(
-            button_frame,
-            text="Wybierz szablon raportu",
-            command=self.show_template_window
-        ).pack(side='left', padx=5)
-        
-        # Obszar wyników
-        results_frame = ttk.Frame(main_frame)
-        results_frame.pack(fill='both', expand=True)
-        
-        # Logi
-        self.log_text = scrolledtext.ScrolledText(
-            results_frame,
-            height=10,
-            font=('Consolas', 9)
-        )
-        self.log_text.pack(fill='x', pady=(0, 10))
-        
-        # Wyniki scrapowania
-        self.scraping_text = scrolledtext.ScrolledText(
-            results_frame,
-            height=20,
-            font=('Segoe UI', 10)
-        )
-        self.scraping_text.pack(fill='both', expand=True)
-
-        # Dodajemy zakładkę dla raportu AI
-        self.ai_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(self.ai_frame, text="Raport AI")
-        
-        # Dodajemy pole tekstowe dla raportu AI
-        self.ai_text = scrolledtext.ScrolledText(
-            self.ai_frame,
-            height=30,
-            font=('Segoe UI', 10),
-            wrap=tk.WORD
-        )
-        self.ai_text.pack(fill='both', expand=True)
-
-        # Dodaj po utworzeniu search_frame:
-        search_mode_frame = ttk.Frame(search_frame)
-        search_mode_frame.pack(fill='x', pady=(0, 10))
-
-        ttk.Radiobutton(
-            search_mode_frame,
-            text="Predefiniowany temat",
-            variable=self.search_mode,
-            value="preset"
-        ).pack(side='left', padx=(0, 10))
-
-        ttk.Radiobutton(
-            search_mode_frame,
-            text="Własne zapytanie",
-            variable=self.search_mode,
-            value="custom"
-        ).pack(side='left')
-
-    def check_queue(self):
-        try:
-            msg_type, data = self.queue.get_nowait()
-            self.handle_queue_message(msg_type, data)
-        except queue.Empty:
-            if self.status_var.get() == "Scrapowanie w toku...":
-                self.root.after(self.CONFIG['QUEUE_CHECK_INTERVAL'], self.check_queue)
-    
-    def handle_queue_message(self, msg_type, data):
-        """Obsługa wiadomości z kolejki"""
-        if msg_type == "results":
-            self.log_message(f"Znaleziono {len(data)} wyników", 'SUCCESS')
-            self.display_results(data)
-            self.status_var.set("Scrapowanie zakończone")
-            # Zapisz do cache'u
-            self.results_cache[self.custom_search_var.get()] = data
-        elif msg_type == "error":
-            error_msg = f"Błąd: {data}"
-            self.log_message(error_msg, 'ERROR')
-            self.status_var.set(error_msg)
-
-    def start_scraping(self):
-        try:
-            if not self.validate_input():
-                self.log_message("Nieprawidłowe dane wejściowe", 'ERROR')
-                return
-                
-            # Czyszczenie poprzednich wyników
-            self.log_message("Czyszczenie poprzednich wyników...", 'PROCESS')
-            self.scraping_text.delete(1.0, tk.END)
-            self.ai_text.delete(1.0, tk.END)
-            
-            # Wybór zapytania na podstawie trybu
-            if self.search_mode.get() == "custom":
-                query = self.custom_search_var.get().strip()
-                if not query:
-                    self.log_message("Wprowadź własne zapytanie", 'WARNING')
-                    return
-            else:
-                selected_topic = self.topic_var.get()
-                if not selected_topic:
-                    self.log_message("Wybierz predefiniowany temat", 'WARNING')
-                    return
-                query = self.OSINT_TOPICS[selected_topic]["queries"][0]
-            
-            self.log_message(f"Rozpoczynam proces OSINT dla zapytania: {query}", 'PROCESS')
-            num_articles = int(self.articles_var.get())
-            
-            self.log_message(f"Liczba artykułów do pobrania: {num_articles}", 'INFO')
-            self.status_var.set("Scrapowanie w toku...")
-            
-            def scrape_thread():
-                try:
-                    scraper = GoogleScraper()
-                    self.log_message("Inicjalizacja scrapera...", 'INFO')
-                    self.log_message("Łączenie z API SerpApi...", 'INFO')
-                    results = scraper.scrape(query, num_results=num_articles)
-                    
-                    if results:
-                        self.log_message(f"Pobrano {len(results)} artykułów pomyślnie", 'SUCCESS')
-                        self.log_message("Rozpoczynam przetwarzanie artykułów...", 'PROCESS')
-                        self.queue.put(("results", results))
-                    else:
-                        self.log_message("Nie znaleziono żadnych wyników", 'WARNING')
-                        
-                except Exception as e:
-                    error_msg = str(e)
-                    self.log_message(f"Błąd podczas scrapowania: {error_msg}", 'ERROR')
-                    self.queue.put(("error", error_msg))
-
-            def check_queue():
-                try:
-                    msg_type, data = self.queue.get_nowait()
-                    
-                    if msg_type == "results":
-                        self.log_message(f"Znaleziono {len(data)} wyników", 'SUCCESS')
-                        self.log_message("Rozpoczynam formatowanie wyników...", 'PROCESS')
-                        self.display_results(data)
-                        self.status_var.set("Scrapowanie zakończone")
-                        self.log_message("Formatowanie wyników zakończone", 'SUCCESS')
-                        
-                    elif msg_type == "error":
-                        self.status_var.set(f"Błąd: {data}")
-                        self.log_message(f"Błąd podczas scrapowania: {data}", 'ERROR')
-                        
-                except queue.Empty:
-                    if self.status_var.get() == "Scrapowanie w toku...":
-                        self.root.after(100, check_queue)
-            
-            # Uruchom scrapowanie w osobnym wątku
-            self.log_message("Uruchamiam wątek scrapowania...", 'INFO')
-            threading.Thread(target=scrape_thread, daemon=True).start()
-            check_queue()
-            
-        except Exception as e:
-            error_msg = str(e)
-            self.log_message(f"Błąd podczas inicjalizacji scrapowania: {error_msg}", 'ERROR')
-            self.status_var.set("Błąd podczas scrapowania")
-
-    def validate_input(self):
-        try:
-            num_articles = int(self.articles_var.get())
-            if num_articles < 1 or num_articles > 10:
-                self.log_message("Liczba artykułów musi być między 1 a 10", 'WARNING')
-                return False
-                
-            # Sprawdzanie odpowiedniego pola w zależności od trybu
-            if self.search_mode.get() == "custom":
-                if not self.custom_search_var.get().strip():
-                    self.log_message("Wprowadź własne zapytanie", 'WARNING')
-                    return False
-            else:
-                if not self.topic_var.get():
-                    self.log_message("Wybierz predefiniowany temat", 'WARNING')
-                    return False
-                
-            return True
-        except ValueError:
-            self.log_message("Nieprawidłowa wartość liczby artykułów", 'ERROR')
-            return False
-
-    def display_results(self, results):
-        """Wyświetla wyniki scrapowania"""
-        try:
-            self.log_message("Rozpoczynam wyświetlanie wyników...", 'PROCESS')
-            
-            # Wyczyść oba pola tekstowe
-            self.scraping_text.delete(1.0, tk.END)
-            self.ai_text.delete(1.0, tk.END)
-            
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Pobierz aktualny temat lub własne zapytanie
-            if self.search_mode.get() == "custom":
-                current_query = self.custom_search_var.get().strip()
-                header = f"Szczegółowy Raport OSINT - Własne zapytanie: {current_query}\n"
-            else:
-                current_topic = self.topic_var.get()
-                header = f"Szczegółowy Raport OSINT - {current_topic}\n"
-            
-            header += f"Data wygenerowania: {current_time}\n"
-            header += "=" * 100 + "\n\n"
-            
-            self.scraping_text.insert(tk.END, header)
-            
-            if not results:
-                self.scraping_text.insert(tk.END, "Nie znaleziono wyników\n")
-                self.log_message("Brak wyników do wyświetlenia", 'WARNING')
-                return
-            
-            for i, result in enumerate(results, 1):
-                self.log_message(f"Przetwarzanie artykułu {i}/{len(results)}", 'INFO')
-                
-                article_text = f"""ARTYKUŁ #{i}
-{'=' * 50}
-Tytuł: {result.get('title', 'Brak tytułu')}
-Link: {result.get('link', 'Brak linku')}\n
-STRESZCZENIE Z WYSZUKIWARKI:
-{result.get('snippet', 'Brak streszczenia')}\n
-PEŁNA TREŚĆ:
-{result.get('content', 'Brak treści')}\n
-{'=' * 100}\n\n"""
-                
-                self.scraping_text.insert(tk.END, article_text)
-                self.scraping_text.update()
-            
-            self.log_message("Wyświetlanie wyników zakończone pomyślnie", 'SUCCESS')
-            
-        except Exception as e:
-            error_msg = f"Błąd podczas wyświetlania wyników: {str(e)}"
-            self.log_message(error_msg, 'ERROR')
-            self.scraping_text.insert(tk.END, f"\nBŁĄD: {error_msg}\n")
-
-    def log_message(self, message, level='INFO'):
-        """Wrapper dla loggera"""
-        if hasattr(self, 'logger'):
-            self.logger.log(message, level)
-        else:
-            print(f"[{level}] {message}")
-            
-    def generate_ai_report(self):
-        try:
-            if not self.openai_client:
-                self.log_message("Klient OpenAI nie jest zainicjalizowany. Sprawdź klucz API.", 'ERROR')
-                return
-                
-            self.log_message("Inicjalizacja generowania raportu AI...", 'PROCESS')
-            
-            system_prompt = getattr(self, 'current_template', self.default_template)
-            template_name = getattr(self, 'current_template_name', 'Domyślny szablon')
-            self.log_message(f"Używam szablonu: {template_name}", 'INFO')
-            
-            self.status_var.set("Generowanie raportu AI...")
-            
-            # Pobierz tekst i ogranicz jego długość
-            scraped_content = self.scraping_text.get("1.0", tk.END)
-            max_chars = 4000  # Zmniejszamy maksymalną długość tekstu
-            if len(scraped_content) > max_chars:
-                scraped_content = scraped_content[:max_chars] + "...[treść skrócona]"
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": scraped_content}
-                ],
-                temperature=0.7,
-                max_tokens=4000,
-                presence_penalty=0.3,
-                frequency_penalty=0.3
-            )
-            
-            if response and response.choices:
-                report = response.choices[0].message.content
-                self.ai_text.delete(1.0, tk.END)
-                self.ai_text.insert(tk.END, report)
-                self.log_message("Raport AI wygenerowany pomyślnie", 'SUCCESS')
-            else:
-                self.log_message("Nie udało się wygenerować raportu", 'ERROR')
-                
-        except Exception as e:
-            error_msg = str(e)
-            self.log_message(f"Błąd podczas generowania raportu: {error_msg}", 'ERROR')
-            self.status_var.set(f"Błąd generowania raportu AI: {error_msg}")
-
-    def display_report(self, report_content):
-        """Wyświetla wygenerowany raport AI"""
-        self.ai_text.delete(1.0, tk.END)
-        self.ai_text.insert(tk.END, report_content)
-        self.notebook.select(self.ai_frame)
-
-    def update_topic_description(self, event=None):
-        """Aktualizuje opis wybranego tematu"""
-        selected = self.topic_var.get()
-        if selected in self.OSINT_TOPICS:
-            self.topic_description.config(
-                text=f"Zapytania: {', '.join(self.OSINT_TOPICS[selected]['queries'])}"
-            )
-
-    def save_report(self):
-        """Zapisuje raport do pliku"""
-        # Implementacja zapisu raportu
-        pass
-
-    def export_logs(self):
-        """Eksportuje logi do pliku"""
-        # Implementacja eksportu logów
-        pass
-
-    def show_settings(self):
-        """Pokazuje okno ustawień"""
-        # Implementacja okna ustawień
-        pass
-
-    def test_api_connection(self):
-        """Testuje połączenie z API"""
-        # Implementacja testu API
-        pass
-
-    def show_docs(self):
-        """Pokazuje dokumentację"""
-        # Implementacja wyświetlania dokumentacji
-        pass
-
-    def show_about(self):
-        """Pokazuje informacje o programie"""
-        # Implementacja okna "O programie"
-        pass
-
-    def toggle_search_mode(self, event=None):
-        """Przełącza tryb wyszukiwania"""
-        mode = self.search_mode.get()
-        
-        # Znajdź widget Entry w interfejsie
-        entry_widget = None
-        for widget in self.root.winfo_children():
-            if isinstance(widget, ttk.Entry):
-                entry_widget = widget
-                break
-            
-        if mode == "preset":
-            self.topic_combo.config(state='readonly')
-            if entry_widget:
-                entry_widget.config(state='disabled')
-        else:
-            self.topic_combo.config(state='disabled')
-            if entry_widget:
-                entry_widget.config(state='normal')
-
-    def show_template_window(self):
-        template_window = ReportTemplateWindow(self.root)
-        template_window.callback = self.apply_template
-        
-    def apply_template(self, template_content, template_name):
-        """Aplikuje wybrany szablon"""
-        self.current_template = template_content
-        self.current_template_name = template_name
-        self.log_message(f"Aktywowano szablon: {template_name}", 'SUCCESS')
-
-    def save_custom_instructions(self):
-        custom_text = self.template_editor.get("1.0", tk.END).strip()
-        if custom_text:
-            self.templates["Własny szablon"]["prompt"] = custom_text
-            messagebox.showinfo(
-                "Sukces",
-                "Własne instrukcje zostały zapisane jako szablon"
-            )
-            # Aktualizuj podgląd
-            self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(tk.END, custom_text)
-        else:
-            messagebox.showwarning(
-                "Pusty szablon",
-                "Proszę wprowadzić treść własnych instrukcji"
-            )
-
-    def use_template(self):
-        selected = self.template_var.get()
-        if selected == "Własny szablon":
-            custom_text = self.template_editor.get("1.0", tk.END).strip()
-            if not custom_text or custom_text == "Wprowadź własne instrukcje dla AI...":
-                messagebox.showwarning(
-                    "Pusty szablon",
-                    "Proszę wprowadzić własne instrukcje przed zatwierdzeniem"
-                )
-                return
-            template_content = custom_text
-        else:
-            template_content = self.templates[selected]["prompt"]
-        
-        # Przekaż szablon do głównego okna
-        self.callback(template_content, selected)
-        self.log_message(f"Załadowano szablon: {selected}", 'SUCCESS')
-        self.window.destroy()
-
-    def perform_search(self, topic):
-        """Wykonuje wyszukiwanie OSINT dla wybranego tematu"""
-        if topic in self.OSINT_TOPICS:
-            queries = self.OSINT_TOPICS[topic]["queries"]
-            sources = self.OSINT_TOPICS[topic]["sources"]
-            
-            all_results = []
-            for query in queries:
-                self.log_message(f"Wyszukiwanie: {query}", 'INFO')
-                results = self.search_api.search(
-                    query, 
-                    num_results=self.num_results,
-                    source_filter=sources
-                )
-                all_results.extend(results)
-            
-            # Deduplikacja i sortowanie wyników
-            unique_results = self.deduplicate_results(all_results)
-            return self.sort_results_by_relevance(unique_results)
-        else:
-            return self.search_api.search(topic, num_results=self.num_results)
-
-class Logger:
-    def __init__(self, text_widget):
-        self.text_widget = text_widget
-        self.colors = {
-            'INFO': '#0066cc',      # Niebieski
-            'SUCCESS': '#00cc66',   # Zielony
-            'WARNING': '#ff9900',   # Pomarańczowy
-            'ERROR': '#cc0000',     # Czerwony
-            'PROCESS': '#6600cc'    # Fioletowy
-        }
-
-    def log(self, message, level='INFO'):
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        icon = {
-            'INFO': '🔵',
-            'SUCCESS': '✅',
-            'WARNING': '⚠️',
-            'ERROR': '❌',
-            'PROCESS': '⚙️'
-        }.get(level, '📝')
-        
-        log_message = f"[{timestamp}] {icon} {message}\n"
-        
-        # Dodaj tekst z odpowiednim tagiem koloru
-        start_index = self.text_widget.index("end-1c")
-        self.text_widget.insert(tk.END, log_message)
-        end_index = self.text_widget.index("end-1c")
-        
-        # Zastosuj kolor do całej linii
-        self.text_widget.tag_add(level, start_index, end_index)
-        
-        # Przewiń do najnowszego logu
-        self.text_widget.see(tk.END)
-        self.text_widget.update()
-
-class ReportTemplateWindow:
-    def __init__(self, parent):
-        self.window = tk.Toplevel(parent)
-        self.window.title("Szablony Raportów OSINT")
-        # Zwiększamy rozmiar okna z 800x600 na 1000x800
-        self.window.geometry("1000x800")
-        
-        # Dodajemy minimalny rozmiar okna, żeby nie można było go za bardzo zmniejszyć
-        self.window.minsize(900, 700)
-        
-        # Opcjonalnie: wyśrodkowanie okna na ekranie
-        self.window.update_idletasks()
-        width = self.window.winfo_width()
-        height = self.window.winfo_height()
-        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.window.winfo_screenheight() // 2) - (height // 2)
-        self.window.geometry(f'+{x}+{y}')
-        
-        # Ulepszone szablony OSINT
-        self.templates = {
-            "Własny szablon": {
-                "prompt": "Wprowadź własne instrukcje dla AI..."
-            },
-            "Analiza Biznesowa OSINT": {
-                "prompt": """Jesteś ekspertem OSINT (Open Source Intelligence) specjalizującym się w analizie biznesowej. 
-Przeanalizuj dostarczone dane i stwórz szczegółowy raport zawierający:
-
-1. PODSUMOWANIE WYKONAWCZE
-   - Kluczowe ustalenia i wnioski
-   - Najważniejsze trendy i wzorce
-   - Krytyczne informacje biznesowe
-
-2. ANALIZA PODMIOTU
-   - Struktura organizacyjna i własność
-   - Historia i rozwój
-   - Kluczowe osoby (zarząd, kierownictwo)
-   - Lokalizacje i zasięg działania
-
-3. ANALIZA RYNKOWA
-   - Pozycja rynkowa i udział w rynku
-   - Główni konkurenci i ich działania
-   - Przewagi konkurencyjne
-   - Trendy rynkowe wpływające na podmiot
-
-4. ANALIZA FINANSOWA
-   - Źródła finansowania
-   - Inwestycje i przejęcia
-   - Wskaźniki finansowe
-   - Potencjalne ryzyka finansowe
-
-5. RELACJE I POWIĄZANIA
-   - Kluczowi partnerzy biznesowi
-   - Powiązania kapitałowe
-   - Relacje z interesariuszami
-   - Sieci wpływów
-
-6. REPUTACJA I WIZERUNEK
-   - Obecność w mediach
-   - Opinie klientów i partnerów
-   - Kontrowersje i problemy wizerunkowe
-   - Działania CSR i PR
-
-7. ANALIZA RYZYK
-   - Ryzyka operacyjne
-   - Ryzyka prawne i regulacyjne
-   - Ryzyka reputacyjne
-   - Potencjalne zagrożenia
-
-8. REKOMENDACJE
-   - Kluczowe obszary wymagające uwagi
-   - Sugerowane działania
-   - Możliwości rozwoju
-   - Strategie minimalizacji ryzyk
-
-Użyj konkretnych danych i przykładów z dostarczonych materiałów. Zachowaj obiektywizm i profesjonalizm w analizie."""
-            },
-            "Analiza Technologiczna OSINT": {
-                "prompt": """Jesteś ekspertem OSINT specjalizującym się w analizie technologicznej.
-Przeanalizuj dostarczone dane i stwórz szczegółowy raport technologiczny zawierający:
-
-1. PODSUMOWANIE TECHNICZNE
-   - Główne odkrycia technologiczne
-   - Kluczowe technologie i rozwiązania
-   - Krytyczne aspekty techniczne
-
-2. INFRASTRUKTURA TECHNICZNA
-   - Architektura systemów
-   - Używane technologie i narzędzia
-   - Infrastruktura sieciowa
-   - Centra danych i hostingi
-
-3. ROZWÓJ TECHNOLOGICZNY
-   - Roadmapa technologiczna
-   - Innowacje i patenty
-   - Projekty R&D
-   - Kierunki rozwoju technologicznego
-
-4. BEZPIECZEŃSTWO
-   - Polityki bezpieczeństwa
-   - Certyfikacje i zgodność
-   - Potencjalne luki i zagrożenia
-   - Incydenty bezpieczeństwa
-
-5. ZESPÓŁ TECHNICZNY
-   - Struktura zespołów
-   - Kluczowe kompetencje
-   - Rekrutacje i trendy zatrudnienia
-   - Współpraca z zewnętrznymi ekspertami
-
-6. ANALIZA KONKURENCYJNA
-   - Porównanie technologii konkurencji
-   - Przewagi technologiczne
-   - Luki technologiczne
-   - Trendy rynkowe
-
-7. RYZYKA TECHNOLOGICZNE
-   - Długoterminowa stabilność
-   - Skalowalność rozwiązań
-   - Zależności technologiczne
-   - Przestarzałe technologie
-
-8. REKOMENDACJE TECHNICZNE
-   - Sugerowane ulepszenia
-   - Priorytety rozwojowe
-   - Strategia modernizacji
-   - Plan minimalizacji ryzyk
-
-Wykorzystaj konkretne informacje z dostarczonych materiałów. Zachowaj techniczny profesjonalizm."""
-            },
-            "Analiza Zagrożeń OSINT": {
-                "prompt": """Jesteś ekspertem OSINT specjalizującym się w analizie zagrożeń i bezpieczeństwa.
-Przeanalizuj dostarczone dane i stwórz szczegółowy raport bezpieczeństwa zawierający:
-
-1. PODSUMOWANIE ZAGROŻEŃ
-   - Krytyczne zagrożenia
-   - Poziomy ryzyka
-   - Priorytety bezpieczeństwa
-
-2. ANALIZA ŚRODOWISKA ZAGROŻEŃ
-   - Aktualne zagrożenia
-   - Trendy w cyberbezpieczeństwie
-   - Geopolityczne czynniki ryzyka
-   - Zagrożenia sektorowe
-
-3. PODATNOŚCI I SŁABE PUNKTY
-   - Zidentyfikowane podatności
-   - Potencjalne wektory ataku
-   - Luki w zabezpieczeniach
-   - Słabości organizacyjne
-
-4. ANALIZA INCYDENTÓW
-   - Historia incydentów
-   - Wzorce ataków
-   - Skuteczność odpowiedzi
-   - Wyciągnięte wnioski
-
-5. OCENA ZABEZPIECZEŃ
-   - Istniejące kontrole
-   - Skuteczność zabezpieczeń
-   - Zgodność z regulacjami
-   - Luki w ochronie
-
-6. ANALIZA WPŁYWU
-   - Potencjalne skutki ataków
-   - Wpływ na działalność
-   - Straty finansowe
-   - Szkody reputacyjne
-
-7. PRZECIWDZIAŁANIE ZAGROŻENIOM
-   - Strategie obronne
-   - Plany reagowania
-   - Procedury bezpieczeństwa
-   - Szkolenia i świadomość
-
-8. REKOMENDACJE BEZPIECZEŃSTWA
-   - Priorytetowe działania
-   - Ulepszenia zabezpieczeń
-   - Plan wdrożenia
-   - Monitoring i ewaluacja
-
-Wykorzystaj konkretne przykłady z dostarczonych materiałów. Zachowaj profesjonalizm w analizie bezpieczeństwa."""
-            }
-        }
-        
-        # Zmienna do przechowywania wybranego szablonu
-        self.template_var = tk.StringVar(value="Własny szablon")
-        self.template_var.trace('w', lambda *args: self.update_preview())
-        
-        self.create_widgets()
-        
-    def create_widgets(self):
-        # Panel wyboru szablonu
-        template_frame = ttk.LabelFrame(self.window, text="Wybierz szablon raportu", padding=10)
-        template_frame.pack(fill='x', padx=10, pady=5)
-        
-        # Przyciski - przenosimy na górę
-        button_frame = ttk.Frame(self.window)
-        button_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Button(
-            button_frame,
-            text="Zatwierdź własny szablon",
-            command=self.save_and_use_template,
-            style='Action.TButton'
-        ).pack(side='right', padx=5)
-        
-        ttk.Button(
-            button_frame,
-            text="Anuluj",
-            command=self.window.destroy,
-            style='Secondary.TButton'
-        ).pack(side='right')
-        
-        # Dodanie variable do RadioButton
-        for template_name in self.templates.keys():
-            ttk.Radiobutton(
-                template_frame,
-                text=template_name,
-                value=template_name,
-                variable=self.template_var,
-                command=self.update_preview
-            ).pack(anchor='w', pady=2)
-            
-        # Panel podglądu
-        preview_frame = ttk.LabelFrame(self.window, text="Podgląd szablonu", padding=10)
-        preview_frame.pack(fill='both', expand=True, padx=10, pady=5)
-        
-        self.preview_text = scrolledtext.ScrolledText(
-            preview_frame,
-            wrap=tk.WORD,
-            font=('Segoe UI', 10)
-        )
-        self.preview_text.pack(fill='both', expand=True)
-        
-        # Panel edycji własnego szablonu
-        self.custom_template_frame = ttk.LabelFrame(self.window, text="Edycja własnego szablonu", padding=10)
-        self.custom_template_frame.pack(fill='both', expand=True, padx=10, pady=5)
-        
-        self.template_editor = scrolledtext.ScrolledText(
-            self.custom_template_frame,
-            wrap=tk.WORD,
-            font=('Segoe UI', 10),
-            height=10
-        )
-        self.template_editor.pack(fill='both', expand=True)
-
-    def update_preview(self):
-        selected = self.template_var.get()
-        if selected == "Własny szablon":
-            # Pokaż pole edycji
-            self.custom_template_frame.pack(fill='both', expand=True, padx=10, pady=5)
-            self.preview_text.delete(1.0, tk.END)
-            if "prompt" in self.templates["Własny szablon"] and self.templates["Własny szablon"]["prompt"] != "Wpisz własne instrukcje dla AI...":
-                self.preview_text.insert(tk.END, self.templates["Własny szablon"]["prompt"])
-                self.template_editor.delete(1.0, tk.END)
-                self.template_editor.insert(tk.END, self.templates["Własny szablon"]["prompt"])
-            else:
-                self.preview_text.insert(tk.END, "Wprowadź własny szablon poniżej i zatwierdź go...")
-        else:
-            # Ukryj pole edycji
-            self.custom_template_frame.pack_forget()
-            if selected in self.templates:
-                self.preview_text.delete(1.0, tk.END)
-                self.preview_text.insert(tk.END, self.templates[selected]["prompt"])
-
-    def save_and_use_template(self):
-        """Metoda łącząca zapisanie i użycie własnego szablonu"""
-        selected = self.template_var.get()
-        if selected == "Własny szablon":
-            custom_text = self.template_editor.get("1.0", tk.END).strip()
-            if custom_text:
-                self.templates["Własny szablon"]["prompt"] = custom_text
-                self.callback(custom_text, "Własny szablon")
-                self.window.destroy()
-            else:
-                messagebox.showwarning(
-                    "Pusty szablon",
-                    "Proszę wprowadzić treść własnego szablonu"
-                )
-        else:
-            self.callback(self.templates[selected]["prompt"], selected)
-            self.window.destroy()
-
-def main():
-    root = tk.Tk()
-    app = OSINTUI(root)
-    root.mainloop()
-
-if __name__ == "__main__":
+"""
+UWAGA: Przed uruchomieniem aplikacji należy:
+1. Uzyskać klucz API OpenAI: https://platform.openai.com/account/api-keys
+2. Uzyskać klucz API SerpApi: https://serpapi.com/
+3. Zastąpić placeholdery 'TWÓJ_KLUCZ_API_*' własnymi kluczami
+   (tryb wsadowy czyta je też ze zmiennych SERPAPI_API_KEY i OPENAI_API_KEY)
+
+Uruchomienie:
+    python osint_covid_report.py                          - interfejs graficzny
+    python osint_covid_report.py --batch zadanie.json     - tryb wsadowy, bez tkinter
+    python osint_covid_report.py --szukaj "fraza"         - wyszukiwanie w archiwum artykułów
+"""
+
+import json
+from datetime import datetime
+import time
+import logging
+import atexit
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
+from email.utils import parsedate_to_datetime
+import csv
+import argparse
+from threading import Thread
+import queue
+import threading
+import re
+import os
+import sqlite3
+import hashlib
+import functools
+import importlib.util
+import contextlib
+import contextvars
+import uuid
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Ciężkie zależności (requests, bs4, serpapi, openai, tkinter) są importowane
+# przy pierwszym użyciu, żeby import modułu i start aplikacji były szybkie.
+
+# tkinter ładujemy dopiero przy starcie interfejsu (tryb wsadowy działa bez wyświetlacza)
+tk = ttk = scrolledtext = messagebox = None
+
+def _zaladuj_tkinter():
+    """Importuje moduły tkinter do zmiennych globalnych modułu"""
+    global tk, ttk, scrolledtext, messagebox
+    import tkinter
+    from tkinter import ttk as _ttk, scrolledtext as _scrolledtext, messagebox as _messagebox
+    tk, ttk, scrolledtext, messagebox = tkinter, _ttk, _scrolledtext, _messagebox
+
+def skonfiguruj_logowanie(plik_logu='osint_scraping.log'):
+    """Konfiguracja loggera - wywoływana przez punkty wejścia, nie przy imporcie.
+
+    Wątki tylko wstawiają rekordy do kolejki; zapis do pliku i na konsolę
+    wykonuje osobny wątek (QueueListener), zatrzymywany przy wyjściu.
+    """
+    from logging.handlers import QueueHandler, QueueListener
+    
+    glowny = logging.getLogger()
+    if glowny.handlers:
+        return None
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlery = [logging.FileHandler(plik_logu), logging.StreamHandler()]
+    for handler in handlery:
+        handler.setFormatter(formatter)
+    
+    kolejka = queue.SimpleQueue()
+    listener = QueueListener(kolejka, *handlery)
+    listener.start()
+    atexit.register(listener.stop)
+    glowny.setLevel(logging.INFO)
+    glowny.addHandler(QueueHandler(kolejka))
+    return listener
+
+# Katalog na trwałe cache (odpowiedzi HTTP, wyniki wyszukiwania)
+CACHE_DIR = os.environ.get('OSINT_CACHE_DIR', 'cache')
+
+# Katalog na trwałe dane (archiwum artykułów)
+DATA_DIR = os.environ.get('OSINT_DATA_DIR', 'dane')
+
+# Zastępczy adres API SerpApi (np. lokalny serwer z benchmarks/bench_potok.py)
+SERPAPI_URL = os.environ.get('OSINT_SERPAPI_URL')
+
+# Domyślny limit żądań do jednej domeny (żądania/s i pojemność kubełka). Pobieranie
+# ogranicza też max_per_domain (2 naraz), więc limit jedynie przycina serie żądań
+LIMIT_ZADAN_DOMENY = float(os.environ.get('OSINT_RATE_LIMIT', '4'))
+SERIA_ZADAN_DOMENY = int(os.environ.get('OSINT_RATE_BURST', '8'))
+
+# Zmiana sposobu ekstrakcji treści unieważnia przetworzone wpisy w cache
+WERSJA_EKSTRAKCJI = 5
+
+# Brotli jest dekodowane przez urllib3 tylko, gdy zainstalowano brotli/brotlicffi
+if any(importlib.util.find_spec(modul) for modul in ('brotli', 'brotlicffi')):
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+else:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+class DomainRateLimiter:
+    """Limiter żądań typu token bucket, osobny dla każdej domeny.
+
+    Czekamy tylko wtedy, gdy kolejne żądania trafiają do tego samego hosta -
+    pobrania z różnych domen nie blokują się nawzajem.
+    """
+
+    def __init__(self, default_rate=LIMIT_ZADAN_DOMENY, default_burst=SERIA_ZADAN_DOMENY,
+                 domain_limits=None, honor_crawl_delay=False):
+        """
+        default_rate - żądania na sekundę dla nieznanych domen
+        default_burst - pojemność kubełka (ile żądań może pójść od razu)
+        domain_limits - słownik {domena: (rate, burst)}
+        honor_crawl_delay - czy respektować Crawl-delay z robots.txt
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.domain_limits = dict(domain_limits or {})
+        self.honor_crawl_delay = honor_crawl_delay
+        self._kubelki = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, domena, rate, burst=1):
+        """Ustawia limit dla domeny (np. z Crawl-delay)"""
+        with self._lock:
+            self.domain_limits[domena] = (rate, burst)
+            kubelek = self._kubelki.get(domena)
+            if kubelek:
+                kubelek['rate'] = rate
+                kubelek['burst'] = burst
+                kubelek['tokeny'] = min(kubelek['tokeny'], burst)
+
+    def _kubelek(self, domena):
+        kubelek = self._kubelki.get(domena)
+        if kubelek is None:
+            rate, burst = self.domain_limits.get(domena, (self.default_rate, self.default_burst))
+            kubelek = {
+                'rate': rate,
+                'burst': burst,
+                'tokeny': float(burst),
+                'ostatnio': time.monotonic(),
+                'blokada_do': 0.0
+            }
+            self._kubelki[domena] = kubelek
+        return kubelek
+
+    def acquire(self, url):
+        """Blokuje do momentu, aż można wysłać żądanie do domeny. Zwraca czas oczekiwania."""
+        domena = _domena(url)
+        czekano = 0.0
+        while True:
+            with self._lock:
+                kubelek = self._kubelek(domena)
+                teraz = time.monotonic()
+                kubelek['tokeny'] = min(
+                    kubelek['burst'],
+                    kubelek['tokeny'] + (teraz - kubelek['ostatnio']) * kubelek['rate']
+                )
+                kubelek['ostatnio'] = teraz
+                
+                if teraz < kubelek['blokada_do']:
+                    czekaj = kubelek['blokada_do'] - teraz
+                elif kubelek['tokeny'] >= 1:
+                    kubelek['tokeny'] -= 1
+                    return czekano
+                else:
+                    czekaj = (1 - kubelek['tokeny']) / kubelek['rate']
+            time.sleep(czekaj)
+            czekano += czekaj
+
+    def defer(self, url, sekundy):
+        """Wstrzymuje żądania do domeny (np. po Retry-After)"""
+        with self._lock:
+            kubelek = self._kubelek(_domena(url))
+            kubelek['blokada_do'] = max(kubelek['blokada_do'], time.monotonic() + sekundy)
+
+def _parsuj_retry_after(wartosc, maks=120):
+    """Zamienia nagłówek Retry-After (sekundy lub data HTTP) na liczbę sekund"""
+    if not wartosc:
+        return None
+    try:
+        sekundy = float(wartosc)
+    except ValueError:
+        try:
+            sekundy = (parsedate_to_datetime(wartosc) - datetime.now().astimezone()).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(sekundy, 0), maks)
+
+_PARAMETRY_SLEDZACE = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+def normalizuj_url(url):
+    """Normalizuje URL do postaci klucza cache.
+
+    Małe litery w schemacie i hoście, bez domyślnego portu, bez fragmentu,
+    bez parametrów śledzących i z posortowanym query.
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or '').lower()
+    if parsed.port and (scheme, parsed.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parsed.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith(_PARAMETRY_SLEDZACE)
+    )
+    return urlunparse((scheme, host, parsed.path or '/', parsed.params, urlencode(query), ''))
+
+def _usun_najstarsze(db, tabela, max_bytes):
+    """Usuwa z tabeli cache najdawniej używane wpisy (kolumna uzyto), dopóki
+    suma kolumny rozmiar przekracza max_bytes - wspólna polityka LRU cache"""
+    rozmiar = db.execute(f"SELECT COALESCE(SUM(rozmiar), 0) FROM {tabela}").fetchone()[0]
+    if rozmiar <= max_bytes:
+        return
+    for klucz, wpis_rozmiar in db.execute(f"SELECT klucz, rozmiar FROM {tabela} ORDER BY uzyto").fetchall():
+        db.execute(f"DELETE FROM {tabela} WHERE klucz = ?", (klucz,))
+        rozmiar -= wpis_rozmiar
+        if rozmiar <= max_bytes:
+            break
+
+class ResponseCache:
+    """Trwały cache odpowiedzi HTTP w SQLite.
+
+    Przechowuje treść razem z ETag/Last-Modified, dzięki czemu nieświeże
+    wpisy są rewalidowane żądaniem warunkowym. Po przekroczeniu max_bytes
+    usuwane są najdawniej używane wpisy (LRU). Obok surowej odpowiedzi można
+    zapisać wynik parsowania, żeby trafienie w cache omijało też BeautifulSoup.
+    """
+
+    def __init__(self, sciezka=None, ttl=6 * 3600, max_bytes=200 * 1024 * 1024):
+        """
+        sciezka - plik bazy (domyślnie CACHE_DIR/http_cache.sqlite)
+        ttl - po ilu sekundach wpis wymaga rewalidacji
+        max_bytes - maksymalny łączny rozmiar przechowywanych treści
+        """
+        if sciezka is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            sciezka = os.path.join(CACHE_DIR, 'http_cache.sqlite')
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(sciezka, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS odpowiedzi (
+                klucz TEXT PRIMARY KEY,
+                url TEXT,
+                tresc BLOB,
+                kodowanie TEXT,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                zapisano REAL,
+                uzyto REAL,
+                rozmiar INTEGER,
+                przetworzone TEXT
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_odpowiedzi_uzyto ON odpowiedzi(uzyto)")
+        self._db.commit()
+
+    def get(self, url):
+        """Zwraca wpis dla URL (słownik) albo None"""
+        klucz = normalizuj_url(url)
+        with self._lock:
+            wiersz = self._db.execute(
+                "SELECT url, tresc, kodowanie, content_type, etag, last_modified, zapisano "
+                "FROM odpowiedzi WHERE klucz = ?", (klucz,)
+            ).fetchone()
+            if wiersz is None:
+                return None
+            self._db.execute("UPDATE odpowiedzi SET uzyto = ? WHERE klucz = ?", (time.time(), klucz))
+            self._db.commit()
+        return dict(zip(
+            ('url', 'tresc', 'kodowanie', 'content_type', 'etag', 'last_modified', 'zapisano'),
+            wiersz
+        ))
+
+    def is_fresh(self, wpis):
+        return time.time() - wpis['zapisano'] < self.ttl
+
+    def put(self, url, response):
+        """Zapisuje odpowiedź 200; poprzedni wynik parsowania jest unieważniany"""
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+        tresc = response.content
+        teraz = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO odpowiedzi VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+                (
+                    normalizuj_url(url), url, tresc, response.encoding,
+                    response.headers.get('Content-Type'),
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    teraz, teraz, len(tresc)
+                )
+            )
+            _usun_najstarsze(self._db, 'odpowiedzi', self.max_bytes)
+            self._db.commit()
+
+    def touch(self, url):
+        """Odświeża wpis po odpowiedzi 304 Not Modified"""
+        with self._lock:
+            self._db.execute(
+                "UPDATE odpowiedzi SET zapisano = ?, uzyto = ? WHERE klucz = ?",
+                (time.time(), time.time(), normalizuj_url(url))
+            )
+            self._db.commit()
+
+    def get_parsed(self, url, rodzaj):
+        """Zwraca zapisany wynik parsowania danego rodzaju albo None"""
+        with self._lock:
+            wiersz = self._db.execute(
+                "SELECT przetworzone FROM odpowiedzi WHERE klucz = ?", (normalizuj_url(url),)
+            ).fetchone()
+        if not wiersz or not wiersz[0]:
+            return None
+        return json.loads(wiersz[0]).get(f"{rodzaj}:v{WERSJA_EKSTRAKCJI}")
+
+    def put_parsed(self, url, rodzaj, dane):
+        klucz = normalizuj_url(url)
+        with self._lock:
+            wiersz = self._db.execute(
+                "SELECT przetworzone FROM odpowiedzi WHERE klucz = ?", (klucz,)
+            ).fetchone()
+            if wiersz is None:
+                return
+            przetworzone = json.loads(wiersz[0]) if wiersz[0] else {}
+            przetworzone[f"{rodzaj}:v{WERSJA_EKSTRAKCJI}"] = dane
+            self._db.execute(
+                "UPDATE odpowiedzi SET przetworzone = ? WHERE klucz = ?",
+                (json.dumps(przetworzone, ensure_ascii=False), klucz)
+            )
+            self._db.commit()
+
+    @staticmethod
+    def to_response(wpis):
+        """Buduje obiekt requests.Response z wpisu cache"""
+        import requests
+        
+        response = requests.Response()
+        response.status_code = 200
+        response._content = wpis['tresc']
+        response.encoding = wpis['kodowanie']
+        response.url = wpis['url']
+        if wpis['content_type']:
+            response.headers['Content-Type'] = wpis['content_type']
+        response.from_cache = True
+        return response
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+class UnsupportedContentType(Exception):
+    """Serwer zwrócił treść, której nie parsujemy (np. PDF zamiast HTML)"""
+
+# Znaczniki, po których można bezpiecznie uciąć dokument
+_GRANICE_BLOKOW = (b'</p>', b'</div>', b'</li>', b'</section>', b'</article>', b'</table>')
+
+def _utnij_na_granicy_znacznika(tresc):
+    """Ucina HTML po ostatnim zamkniętym bloku (albo przynajmniej po '>')"""
+    pozycja = max(tresc.rfind(znacznik) + len(znacznik) for znacznik in _GRANICE_BLOKOW)
+    if pozycja < len(tresc) // 2:
+        pozycja = tresc.rfind(b'>') + 1
+    return tresc[:pozycja] if pozycja > 0 else tresc
+
+def _percentyl(wartosci, p):
+    """Percentyl metodą najbliższej rangi (None dla pustej listy)"""
+    if not wartosci:
+        return None
+    posortowane = sorted(wartosci)
+    return posortowane[max(0, -(-p * len(posortowane) // 100) - 1)]
+
+class FetchStatistics:
+    """Statystyki pobrań dla każdej domeny (bezpieczne wątkowo).
+
+    Liczy sukcesy, błędy wg klasy, bajty (po dekompresji) oraz czasy
+    connect, ttfb i total, z których podsumowanie wylicza p50/p95/p99.
+    Dla każdej metryki trzymamy ostatnie MAX_SAMPLES próbek. connect jest
+    mierzony tylko przy nowym połączeniu - żądania po keep-alive go nie mają.
+    """
+
+    METRICS = ('connect', 'ttfb', 'total')
+    PERCENTILES = (50, 95, 99)
+    MAX_SAMPLES = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._domeny = {}
+
+    def record(self, url, blad=None, z_cache=False, bajty=0, **czasy):
+        """Zapisuje jedno pobranie; czasy to connect/ttfb/total w sekundach"""
+        with self._lock:
+            domena = _domena(url)
+            stat = self._domeny.get(domena)
+            if stat is None:
+                stat = self._domeny[domena] = {
+                    'udane': 0, 'nieudane': 0, 'z_cache': 0, 'bajty': 0,
+                    'czas_calkowity': 0.0, 'bledy': defaultdict(int),
+                    'probki': {m: deque(maxlen=self.MAX_SAMPLES) for m in self.METRICS}
+                }
+            
+            if blad:
+                stat['nieudane'] += 1
+                stat['bledy'][blad] += 1
+            else:
+                stat['udane'] += 1
+                stat['z_cache'] += 1 if z_cache else 0
+            stat['bajty'] += bajty
+            stat['czas_calkowity'] += czasy.get('total') or 0.0
+            for metryka in self.METRICS:
+                if czasy.get(metryka) is not None:
+                    stat['probki'][metryka].append(czasy[metryka])
+
+    def podsumowanie(self):
+        """Słownik domena -> liczniki i percentyle czasów (w sekundach)"""
+        with self._lock:
+            wynik = {}
+            for domena, stat in sorted(self._domeny.items()):
+                wiersz = {k: stat[k] for k in ('udane', 'nieudane', 'z_cache', 'bajty', 'czas_calkowity')}
+                wiersz['bledy'] = dict(stat['bledy'])
+                for metryka in self.METRICS:
+                    for p in self.PERCENTILES:
+                        wiersz[f'{metryka}_p{p}'] = _percentyl(stat['probki'][metryka], p)
+                wynik[domena] = wiersz
+            return wynik
+
+# Bieżący przebieg dla spanów: (run_id, job_id); wątki robocze dostają kopię kontekstu
+_biezacy_przebieg = contextvars.ContextVar('osint_przebieg', default=(None, None))
+
+def w_kontekscie(funkcja):
+    """Opakowuje funkcję tak, by wykonała się w kopii bieżącego kontekstu (przebieg)"""
+    kontekst = contextvars.copy_context()
+    return lambda *args, **kwargs: kontekst.copy().run(funkcja, *args, **kwargs)
+
+class Tracer:
+    """Lekkie spany czasowe etapów potoku (wyszukiwanie, pobieranie, parsowanie, AI).
+
+    Span zapisuje nazwę, początek, czas trwania, wątek oraz run_id/job_id
+    bieżącego przebiegu. Zdarzenia można wyeksportować jako Chrome trace
+    (chrome://tracing, Perfetto) albo podsumować w tabeli. Etapy podane
+    w profile_stages (np. OSINT_PROFILE=parse) są dodatkowo profilowane
+    cProfile. Naraz działa co najwyżej jeden profiler: span, który zaczyna się,
+    gdy inny jest profilowany (zagnieżdżony etap albo równoległy w innym wątku),
+    jest tylko mierzony. Razem warto więc profilować etapy niezagnieżdżone
+    (search, fetch, decode, parse, metadata, extract, store, dedup, openai).
+    Profil obejmuje wyłącznie wątek spanu - etapy zbiorcze (scrape, fetch_all,
+    ai_report) pokażą w nim głównie czekanie na wątki robocze.
+    """
+
+    def __init__(self, max_events=100000, profile_stages=None):
+        self._lock = threading.Lock()
+        self._events = deque(maxlen=max_events)
+        if profile_stages is None:
+            profile_stages = os.environ.get('OSINT_PROFILE', '')
+        if isinstance(profile_stages, str):
+            profile_stages = [etap for etap in profile_stages.split(',') if etap]
+        self.profile_stages = frozenset(profile_stages)
+        self._profiles = defaultdict(list)
+        self._profile_lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def run(self, run_id=None, job_id=None):
+        """Oznacza spany w bloku (także w wątkach uruchomionych przez w_kontekscie).
+
+        Bez run_id wewnątrz trwającego przebiegu blok dołącza do niego.
+        """
+        biezacy_run, biezacy_job = _biezacy_przebieg.get()
+        if run_id is None and biezacy_run is not None:
+            yield biezacy_run
+            return
+        run_id = run_id or uuid.uuid4().hex[:8]
+        token = _biezacy_przebieg.set((run_id, job_id))
+        try:
+            yield run_id
+        finally:
+            _biezacy_przebieg.reset(token)
+
+    @contextlib.contextmanager
+    def span(self, nazwa, **args):
+        profil = None
+        # Bez czekania na profiler - czekanie zagnieżdżonego spanu na zewnętrzny
+        # (także z wątku roboczego) kończyło się zakleszczeniem
+        if nazwa in self.profile_stages and self._profile_lock.acquire(blocking=False):
+            import cProfile
+            profil = cProfile.Profile()
+            profil.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            koniec = time.perf_counter()
+            if profil is not None:
+                profil.disable()
+                self._profiles[nazwa].append(profil)
+                self._profile_lock.release()
+            run_id, job_id = _biezacy_przebieg.get()
+            with self._lock:
+                self._events.append((nazwa, start, koniec - start, threading.get_ident(), run_id, job_id, args))
+
+    def events(self, run_id=None):
+        with self._lock:
+            return [e for e in self._events if run_id is None or e[4] == run_id]
+
+    def export_chrome(self, sciezka, run_id=None):
+        """Zapisuje zdarzenia w formacie Chrome trace-event (JSON)"""
+        zdarzenia = [
+            {
+                'name': nazwa, 'cat': 'osint', 'ph': 'X',
+                'ts': round(start * 1e6), 'dur': round(czas * 1e6),
+                'pid': os.getpid(), 'tid': watek,
+                'args': dict(args, run=run, job=job)
+            }
+            for nazwa, start, czas, watek, run, job, args in self.events(run_id)
+        ]
+        with open(sciezka, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': zdarzenia, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False, default=str)
+
+    def summary(self, run_id=None):
+        """Etap -> liczba, suma, p50, p95 i maksimum czasu (w sekundach)"""
+        czasy = defaultdict(list)
+        for nazwa, start, czas, *_ in self.events(run_id):
+            czasy[nazwa].append(czas)
+        return {
+            nazwa: {
+                'liczba': len(wartosci), 'suma': sum(wartosci),
+                'p50': _percentyl(wartosci, 50), 'p95': _percentyl(wartosci, 95), 'max': max(wartosci)
+            }
+            for nazwa, wartosci in sorted(czasy.items(), key=lambda e: -sum(e[1]))
+        }
+
+    def summary_table(self, run_id=None):
+        """Podsumowanie etapów jako tabela tekstowa (czasy w ms)"""
+        wiersze = [f"{'etap':<20} {'liczba':>7} {'suma':>10} {'p50':>8} {'p95':>8} {'max':>8}"]
+        for nazwa, stat in self.summary(run_id).items():
+            wiersze.append(
+                f"{nazwa:<20} {stat['liczba']:>7} {_ms(stat['suma']):>10} {_ms(stat['p50']):>8} "
+                f"{_ms(stat['p95']):>8} {_ms(stat['max']):>8}"
+            )
+        return "\n".join(wiersze)
+
+    def dump_profile(self, sciezka, nazwa='parse'):
+        """Zapisuje zebrany profil etapu (pstats); False, jeśli go nie profilowano"""
+        import pstats
+        
+        with self._profile_lock:
+            profile = list(self._profiles.get(nazwa, []))
+        if not profile:
+            return False
+        statystyki = pstats.Stats(profile[0])
+        if len(profile) > 1:
+            statystyki.add(*profile[1:])
+        statystyki.dump_stats(sciezka)
+        return True
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+def get_tracer():
+    """Zwraca wspólny tracer etapów potoku"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer()
+    return _tracer
+
+# Czas connect() (TCP + TLS) ostatniego nowego połączenia w bieżącym wątku
+_pomiar_polaczenia = threading.local()
+
+@functools.lru_cache(maxsize=None)
+def _pule_z_pomiarem_polaczenia():
+    """Klasy pul urllib3, których połączenia zapisują czas connect() w _pomiar_polaczenia"""
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    
+    def z_pomiarem(klasa):
+        class Polaczenie(klasa):
+            def connect(self):
+                start = time.perf_counter()
+                try:
+                    super().connect()
+                finally:
+                    _pomiar_polaczenia.czas = time.perf_counter() - start
+        return Polaczenie
+    
+    class Pula(HTTPConnectionPool):
+        ConnectionCls = z_pomiarem(HTTPConnection)
+    
+    class PulaHTTPS(HTTPSConnectionPool):
+        ConnectionCls = z_pomiarem(HTTPSConnection)
+    
+    return {'http': Pula, 'https': PulaHTTPS}
+
+class HTTPClient:
+    """Współdzielony klient HTTP z pulą połączeń keep-alive.
+
+    Jedna sesja requests jest używana przez wszystkie wątki - pule połączeń
+    urllib3 są bezpieczne wątkowo, a sesja nie jest modyfikowana po utworzeniu.
+    """
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'pl-PL,pl;q=0.9,en;q=0.8',
+        'Accept-Encoding': _ACCEPT_ENCODING,
+        'Connection': 'keep-alive'
+    }
+
+    HTML_TYPES = ('text/html', 'application/xhtml+xml')
+
+    def __init__(self, pool_connections=32, pool_maxsize=4, timeout=(5, 15), headers=None,
+                 rate_limiter=None, cache=None, max_bytes=3 * 1024 * 1024):
+        """
+        pool_connections - liczba hostów, dla których trzymamy otwarte pule
+        pool_maxsize - maksymalna liczba połączeń na jeden host
+        timeout - (connect, read) w sekundach, domyślny dla wszystkich żądań
+        rate_limiter - DomainRateLimiter pilnujący odstępów między żądaniami do hosta
+        cache - opcjonalny ResponseCache dla odpowiedzi GET
+        max_bytes - limit (po dekompresji) treści pobieranej przez get_html
+        """
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.rate_limiter = rate_limiter or DomainRateLimiter()
+        self.cache = cache
+        # Statystyki wszystkich pobrań tego klienta
+        self.stats = FetchStatistics()
+        self._robots_sprawdzone = set()
+        self._robots_lock = threading.Lock()
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+        
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        adapter.poolmanager.pool_classes_by_scheme = _pule_z_pomiarem_polaczenia()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get_html(self, url, **kwargs):
+        """Pobiera stronę HTML strumieniowo, z limitem rozmiaru i kontrolą Content-Type"""
+        return self.get(url, max_bytes=self.max_bytes, accept_types=self.HTML_TYPES, **kwargs)
+
+    def get(self, url, headers=None, timeout=None, use_cache=True, max_bytes=None,
+            accept_types=None, stats=None, **kwargs):
+        """Wykonuje żądanie GET przez współdzieloną pulę połączeń.
+
+        Przy włączonym cache świeży wpis zwracany jest bez sieci (response.from_cache),
+        a nieświeży jest rewalidowany przez If-None-Match/If-Modified-Since.
+        Z max_bytes treść jest czytana strumieniowo i ucinana po przekroczeniu
+        limitu (response.truncated); accept_types odrzuca inne typy treści
+        na podstawie samych nagłówków, zanim pobierzemy ciało odpowiedzi.
+        Każde pobranie trafia do self.stats i opcjonalnie do stats (FetchStatistics).
+        """
+        wpis = None
+        if self.cache and use_cache:
+            wpis = self.cache.get(url)
+            if wpis and self.cache.is_fresh(wpis):
+                self._zapisz_pomiar(stats, url, z_cache=True)
+                return self.cache.to_response(wpis)
+            if wpis:
+                headers = dict(headers or {})
+                if wpis['etag']:
+                    headers['If-None-Match'] = wpis['etag']
+                if wpis['last_modified']:
+                    headers['If-Modified-Since'] = wpis['last_modified']
+        
+        if self.rate_limiter.honor_crawl_delay:
+            self._zastosuj_crawl_delay(url)
+        self.rate_limiter.acquire(url)
+        
+        _pomiar_polaczenia.czas = None
+        start = time.perf_counter()
+        try:
+            response = self.session.get(
+                url,
+                headers=headers,
+                timeout=timeout or self.timeout,
+                stream=max_bytes is not None or accept_types is not None,
+                **kwargs
+            )
+            response.truncated = False
+            if max_bytes is not None or accept_types is not None:
+                self._read_limited(response, max_bytes, accept_types)
+        except Exception as e:
+            self._zapisz_pomiar(stats, url, blad=type(e).__name__,
+                                connect=_pomiar_polaczenia.czas, total=time.perf_counter() - start)
+            raise
+        
+        self._zapisz_pomiar(
+            stats, url,
+            blad=f"HTTP {response.status_code}" if response.status_code >= 400 else None,
+            bajty=len(response.content or b''),
+            connect=_pomiar_polaczenia.czas,
+            ttfb=response.elapsed.total_seconds(),
+            total=time.perf_counter() - start
+        )
+        
+        if wpis and response.status_code == 304:
+            self.cache.touch(url)
+            return self.cache.to_response(wpis)
+        if self.cache and use_cache and response.status_code == 200:
+            self.cache.put(url, response)
+        response.from_cache = False
+        
+        if response.status_code in (429, 503):
+            opoznienie = _parsuj_retry_after(response.headers.get('Retry-After'))
+            if opoznienie:
+                logging.warning(f"{_domena(url)} prosi o przerwę {opoznienie:.0f}s (Retry-After)")
+                self.rate_limiter.defer(url, opoznienie)
+        return response
+
+    def _zapisz_pomiar(self, stats, url, **pomiar):
+        self.stats.record(url, **pomiar)
+        if stats is not None:
+            stats.record(url, **pomiar)
+
+    def _read_limited(self, response, max_bytes, accept_types):
+        """Wczytuje ciało odpowiedzi strumieniowo, najwyżej max_bytes bajtów"""
+        try:
+            if accept_types and response.status_code == 200:
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                if content_type and content_type not in accept_types:
+                    raise UnsupportedContentType(f"Pominięto treść typu {content_type}")
+            
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    response.truncated = True
+                    break
+            
+            content = b''.join(chunks)
+            if response.truncated:
+                content = _utnij_na_granicy_znacznika(content[:max_bytes])
+                logging.warning(f"Ucięto {response.url} do {len(content)} bajtów (limit {max_bytes})")
+            response._content = content
+        finally:
+            # Nieprzeczytana do końca odpowiedź zamyka połączenie zamiast oddać je do puli
+            response.close()
+
+    def _zastosuj_crawl_delay(self, url):
+        """Jednorazowo odczytuje robots.txt domeny i ustawia limit wg Crawl-delay"""
+        domena = _domena(url)
+        with self._robots_lock:
+            if domena in self._robots_sprawdzone:
+                return
+            self._robots_sprawdzone.add(domena)
+        
+        parsed = urlparse(url)
+        try:
+            response = self.session.get(f"{parsed.scheme}://{parsed.netloc}/robots.txt", timeout=self.timeout)
+            if response.status_code != 200:
+                return
+            robots = RobotFileParser()
+            robots.parse(response.text.splitlines())
+            crawl_delay = robots.crawl_delay(self.session.headers['User-Agent'])
+            if crawl_delay:
+                self.rate_limiter.set_limit(domena, 1.0 / float(crawl_delay), 1)
+                logging.info(f"{domena}: Crawl-delay {crawl_delay}s")
+        except Exception as e:
+            logging.debug(f"Nie udało się odczytać robots.txt dla {domena}: {e}")
+
+    def close(self):
+        self.session.close()
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+def get_http_client():
+    """Zwraca wspólny dla całej aplikacji klient HTTP (tworzony przy pierwszym użyciu)"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HTTPClient(cache=ResponseCache())
+    return _http_client
+
+def _ms(sekundy):
+    """Czas w milisekundach do raportów ('-' przy braku pomiaru)"""
+    return '-' if sekundy is None else f"{sekundy * 1000:.0f}"
+
+def _opis_bledow(bledy):
+    return "; ".join(f"{klasa}: {liczba}" for klasa, liczba in sorted(bledy.items()))
+
+def zapisz_statystyki(statystyki, nazwa_pliku='statystyki_scrapingu.csv'):
+    """Zapisuje podsumowanie FetchStatistics do CSV (czasy w ms)"""
+    percentyle = [f'{m}_p{p}' for m in FetchStatistics.METRICS for p in FetchStatistics.PERCENTILES]
+    with open(nazwa_pliku, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=[
+            'domena', 'udane', 'nieudane', 'z_cache', 'bajty', 'błędy', 'całkowity_czas'
+        ] + [f'{nazwa}_ms' for nazwa in percentyle])
+        writer.writeheader()
+        for domena, stats in statystyki.items():
+            wiersz = {
+                'domena': domena,
+                'udane': stats['udane'],
+                'nieudane': stats['nieudane'],
+                'z_cache': stats['z_cache'],
+                'bajty': stats['bajty'],
+                'błędy': _opis_bledow(stats['bledy']),
+                'całkowity_czas': f"{stats['czas_calkowity']:.2f}s"
+            }
+            wiersz.update({f'{nazwa}_ms': _ms(stats[nazwa]) for nazwa in percentyle})
+            writer.writerow(wiersz)
+
+# Backendy parsera HTML w kolejności od najszybszego; html.parser jest zawsze dostępny
+PARSERY_HTML = ('lxml', 'html.parser')
+
+@functools.lru_cache(maxsize=None)
+def wybierz_parser(preferowany=None):
+    """Zwraca nazwę backendu BeautifulSoup do parsowania stron.
+
+    Kolejność: argument, zmienna OSINT_HTML_PARSER, pierwszy zainstalowany
+    z PARSERY_HTML. Niedostępny backend jest pomijany z ostrzeżeniem.
+    """
+    from bs4.builder import builder_registry
+    
+    kandydaci = [preferowany, os.environ.get('OSINT_HTML_PARSER')] + list(PARSERY_HTML)
+    for nazwa in kandydaci:
+        if not nazwa:
+            continue
+        if builder_registry.lookup(nazwa):
+            return nazwa
+        logging.warning(f"Parser HTML '{nazwa}' nie jest zainstalowany")
+    return 'html.parser'
+
+def parsuj_html(html, parser=None):
+    """Parsuje dokument HTML wybranym (lub najszybszym dostępnym) backendem"""
+    from bs4 import BeautifulSoup
+    
+    return BeautifulSoup(html, parser or wybierz_parser())
+
+# Elementy bez treści dla czytelnika - pomijane przy zbieraniu luźnego tekstu
+_BEZ_TRESCI = frozenset(('script', 'style', 'noscript', 'template'))
+# Elementy wewnątrz linii - ich tekst dokleja się do luźnego tekstu rodzica;
+# pozostałe (komórki, wiersze, div) zamykają go i tworzą własny blok
+_W_LINII = frozenset((
+    'a', 'abbr', 'b', 'br', 'cite', 'code', 'em', 'font', 'i', 'img', 'mark',
+    'q', 's', 'small', 'span', 'strong', 'sub', 'sup', 'time', 'u'
+))
+
+def _luzny_tekst(luzne):
+    """Skleja zebrany luźny tekst w jeden blok; same odnośniki (menu) pomija"""
+    tekst = ' '.join(' '.join(fragment for fragment, _ in luzne).split())
+    same_odnosniki = all(odnosnik or not fragment.strip() for fragment, odnosnik in luzne)
+    luzne.clear()
+    if tekst and not same_odnosniki:
+        yield tekst
+
+def _bloki_tekstu(korzen, nazwy):
+    """Zwraca bloki tekstu w kolejności dokumentu - najbardziej zewnętrzne elementy
+    o podanych nazwach, a z wnętrza kontenerów także luźny tekst (jako str).
+
+    Drzewo jest przechodzone raz; do wnętrza zwróconego bloku nie schodzimy,
+    więc np. <p> w <li> w <table> nie powtarza tekstu całej tabeli. Tekst
+    potomka nigdy nie jest dłuższy niż tekst bloku, więc pominięcie krótkiego
+    bloku nie gubi dłuższych fragmentów. Wyjątkiem są kontenery: tabela
+    zawierająca inne bloki (układ strony wokół artykułu) i element listy
+    z akapitami nie są blokami - schodzimy do ich wnętrza, a tekst leżący
+    w nich poza blokami (komórka <td> bez <p>, wstęp <li> przed akapitem)
+    wraca jako osobny blok.
+    """
+    from bs4.element import NavigableString
+    
+    wewnatrz = {'table': list(nazwy), 'li': [nazwa for nazwa in nazwy if nazwa != 'li']}
+    # Ramka: (dzieci, czy wewnątrz kontenera, luźny tekst [(fragment, czy odnośnik)])
+    stos = [(iter(korzen.children), False, [])]
+    while stos:
+        dzieci, w_kontenerze, luzne = stos[-1]
+        for element in dzieci:
+            if element.name is None:  # tekst, komentarz
+                if w_kontenerze and type(element) is NavigableString:
+                    luzne.append((str(element), False))
+                continue
+            if element.name in _BEZ_TRESCI:
+                continue
+            kontener = element.name in wewnatrz and element.find(wewnatrz[element.name]) is not None
+            if element.name in nazwy and not kontener:
+                yield from _luzny_tekst(luzne)
+                yield element
+            elif (kontener or not w_kontenerze or element.name not in _W_LINII
+                  or element.find(nazwy) is not None):
+                if element.contents:
+                    yield from _luzny_tekst(luzne)
+                    stos.append((iter(element.children), w_kontenerze or kontener, []))
+                    break
+            else:
+                luzne.append((element.get_text(' '), element.name == 'a'))
+        else:
+            yield from _luzny_tekst(luzne)
+            stos.pop()
+
+def _domena(url):
+    """Zwraca nazwę hosta z adresu URL (małymi literami)"""
+    return (urlparse(url).hostname or '').lower()
+
+def pobierz_wspolbieznie(urls, funkcja, max_workers=8, max_per_domain=2, on_result=None):
+    """Wywołuje funkcja(url) równolegle dla wszystkich adresów.
+
+    Liczba jednoczesnych pobrań jest ograniczona globalnie (max_workers)
+    oraz dla każdej domeny osobno (max_per_domain). Wyniki zwracane są
+    w kolejności wejściowej listy adresów. Opcjonalne on_result(indeks, wynik)
+    jest wywoływane w wątku wywołującym zaraz po zakończeniu każdego pobrania.
+    """
+    wyniki = [None] * len(urls)
+    oczekujace = deque(enumerate(urls))
+    w_toku = defaultdict(int)
+    futures = {}
+
+    # Wątki puli nie dziedziczą kontekstu (przebiegu dla spanów) - przekazujemy go jawnie
+    funkcja_w_kontekscie = w_kontekscie(funkcja)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while oczekujace or futures:
+            # Uruchamiamy wszystko, na co pozwalają limity
+            odlozone = deque()
+            while oczekujace and len(futures) < max_workers:
+                indeks, url = oczekujace.popleft()
+                domena = _domena(url)
+                if w_toku[domena] >= max_per_domain:
+                    odlozone.append((indeks, url))
+                    continue
+                w_toku[domena] += 1
+                futures[executor.submit(funkcja_w_kontekscie, url)] = (indeks, domena)
+            oczekujace.extendleft(reversed(odlozone))
+
+            gotowe, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in gotowe:
+                indeks, domena = futures.pop(future)
+                w_toku[domena] -= 1
+                wyniki[indeks] = future.result()
+                if on_result:
+                    on_result(indeks, wyniki[indeks])
+
+    return wyniki
+
+def pobierz_tresc_artykulu(url, parser=None):
+    try:
+        client = get_http_client()
+        response = client.get_html(url)
+        response.raise_for_status()
+        
+        # Trafienie w cache - pomijamy ponowne parsowanie
+        if response.from_cache:
+            zapisane = client.cache.get_parsed(url, 'pobierz_tresc_artykulu')
+            if zapisane:
+                return zapisane
+        
+        wynik = przetworz_tresc_artykulu(response.text, parser)
+        if client.cache:
+            client.cache.put_parsed(url, 'pobierz_tresc_artykulu', wynik)
+        return wynik
+    except Exception as e:
+        logging.error(f"Nie udało się pobrać treści z {url}: {e}")
+        return None
+
+def przetworz_tresc_artykulu(html, parser=None):
+    """Wyciąga tekst artykułu z pobranego HTML"""
+    soup = parsuj_html(html, parser)
+    for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer']):
+        element.decompose()
+    
+    content = soup.find('article') or soup.find('main') or soup.find('div', class_='content')
+    
+    if content:
+        # Zbieramy paragrafy zachowując strukturę tekstu
+        paragraphs = []
+        for p in content.find_all(['p', 'h1', 'h2', 'h3']):
+            text = p.get_text(strip=True)
+            if text:  # Pomijamy puste paragrafy
+                # Jeśli to nagłówek, dodaj dodatkowy odstęp
+                if p.name in ['h1', 'h2', 'h3']:
+                    paragraphs.append('\n' + text.upper() + '\n')
+                else:
+                    paragraphs.append(text)
+        
+        # Łączymy paragrafy z odpowiednimi odstępami
+        text = '\n\n'.join(paragraphs)
+        
+        # Dodatkowe czyszczenie tekstu
+        text = text.replace('..', '.')  # Usuń podwójne kropki
+        text = ' '.join(text.split())  # Normalizuj spacje
+        text = text.replace(' .', '.')  # Popraw spacje przed kropkami
+        
+        # Dodaj odstępy po kropkach jeśli ich nie ma
+        text = '. '.join(segment.strip() for segment in text.split('.') if segment.strip())
+        text += '.'
+    else:
+        text = ' '.join([p.get_text(strip=True) for p in soup.find_all('p')])
+    
+    return {
+        'tekst': text,
+        'data_publikacji': None,
+        'autorzy': []
+    }
+
+class SearchCache:
+    """Trwały cache wyników SerpApi z TTL.
+
+    Klucz to (q, hl, gl, num, engine) - klucz API nie wpływa na wynik,
+    więc nie jest jego częścią.
+    """
+
+    KLUCZE_ZAPYTANIA = ('q', 'hl', 'gl', 'num', 'engine')
+
+    def __init__(self, sciezka=None, ttl=24 * 3600):
+        if sciezka is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            sciezka = os.path.join(CACHE_DIR, 'search_cache.sqlite')
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(sciezka, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS wyszukiwania (
+                klucz TEXT PRIMARY KEY,
+                parametry TEXT,
+                wyniki TEXT,
+                zapisano REAL
+            )
+        """)
+        self._db.commit()
+
+    def _klucz(self, parametry):
+        czesci = [str(parametry.get(k, 'google' if k == 'engine' else '')) for k in self.KLUCZE_ZAPYTANIA]
+        return hashlib.sha256(json.dumps(czesci, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def get(self, parametry):
+        """Zwraca zapisaną odpowiedź SerpApi, jeśli jest młodsza niż TTL"""
+        with self._lock:
+            wiersz = self._db.execute(
+                "SELECT wyniki, zapisano FROM wyszukiwania WHERE klucz = ?", (self._klucz(parametry),)
+            ).fetchone()
+        if wiersz is None or time.time() - wiersz[1] >= self.ttl:
+            return None
+        return json.loads(wiersz[0])
+
+    def put(self, parametry, wyniki):
+        bez_klucza = {k: v for k, v in parametry.items() if k != 'api_key'}
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO wyszukiwania VALUES (?, ?, ?, ?)",
+                (
+                    self._klucz(parametry),
+                    json.dumps(bez_klucza, ensure_ascii=False),
+                    json.dumps(wyniki, ensure_ascii=False),
+                    time.time()
+                )
+            )
+            self._db.execute("DELETE FROM wyszukiwania WHERE zapisano < ?", (time.time() - self.ttl,))
+            self._db.commit()
+
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+def get_search_cache():
+    """Zwraca wspólny cache wyników wyszukiwania"""
+    global _search_cache
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchCache()
+    return _search_cache
+
+def szukaj_serpapi(parametry, force_refresh=False):
+    """Wykonuje zapytanie SerpApi, korzystając z cache wyników.
+
+    force_refresh=True pomija cache i nadpisuje zapisany wynik.
+    """
+    cache = get_search_cache()
+    if not force_refresh:
+        wyniki = cache.get(parametry)
+        if wyniki is not None:
+            logging.info(f"Wyniki z cache dla zapytania: {parametry.get('q')}")
+            return wyniki
+    
+    from serpapi.google_search import GoogleSearch
+    
+    szukacz = GoogleSearch(parametry)
+    if SERPAPI_URL:
+        szukacz.BACKEND = SERPAPI_URL.rstrip('/')
+    wyniki = szukacz.get_dict()
+    if 'error' not in wyniki:
+        cache.put(parametry, wyniki)
+    return wyniki
+
+def hash_tresci(tresc):
+    """Skrót SHA-256 treści po normalizacji białych znaków"""
+    return hashlib.sha256(' '.join(tresc.split()).encode('utf-8')).hexdigest()
+
+def simhash(tresc, dlugosc_shingla=3):
+    """64-bitowy SimHash treści liczony z shingli słownych"""
+    slowa = tresc.lower().split()
+    shingle = [' '.join(slowa[i:i + dlugosc_shingla])
+               for i in range(max(1, len(slowa) - dlugosc_shingla + 1))]
+    # Skróty sklejone w jeden napis bitów - kolumnę bitu wycina krok [pozycja::64],
+    # więc zliczanie jedynek odbywa się w C zamiast w pętli po bitach
+    bity = ''.join(
+        format(int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big'), '064b')
+        for s in shingle
+    )
+    prog = len(shingle) / 2
+    return sum(
+        1 << (63 - pozycja)
+        for pozycja in range(64)
+        if bity[pozycja::64].count('1') > prog
+    )
+
+def odleglosc_hamminga(a, b):
+    return bin(a ^ b).count('1')
+
+# Maksymalna odległość Hamminga SimHash dla prawie-duplikatów
+PROG_PRAWIE_DUPLIKATU = 3
+# Krótsze teksty porównujemy tylko dokładnym skrótem (SimHash jest dla nich zawodny)
+MIN_SLOW_SIMHASH = 50
+
+def usun_duplikaty(wyniki, prog=PROG_PRAWIE_DUPLIKATU):
+    """Zwija identyczne i prawie identyczne artykuły (przedruki, depesze agencyjne).
+
+    Zostaje pierwszy (najwyżej w rankingu) artykuł z grupy; adresy kopii
+    trafiają do jego listy 'mirrors'. Wyniki bez treści są przepuszczane.
+    SimHash dzielony jest na prog + 1 pasm - prawie-duplikat musi mieć
+    przynajmniej jedno pasmo identyczne, więc porównujemy tylko kandydatów.
+    """
+    pasma = prog + 1
+    szerokosc = 64 // pasma
+    maska = (1 << szerokosc) - 1
+    
+    unikalne = []
+    wg_skrotu = {}
+    indeks_pasm = defaultdict(list)
+    for wynik in wyniki:
+        tresc = wynik.get('content')
+        if not tresc:
+            unikalne.append(wynik)
+            continue
+        
+        skrot = hash_tresci(tresc)
+        kanoniczny = wg_skrotu.get(skrot)
+        odcisk = None
+        if kanoniczny is None and len(tresc.split()) >= MIN_SLOW_SIMHASH:
+            odcisk = simhash(tresc)
+            for nr in range(pasma):
+                for kandydat_odcisk, kandydat in indeks_pasm[(nr, odcisk >> (nr * szerokosc) & maska)]:
+                    if odleglosc_hamminga(odcisk, kandydat_odcisk) <= prog:
+                        kanoniczny = kandydat
+                        break
+                if kanoniczny is not None:
+                    break
+        
+        if kanoniczny is not None:
+            kanoniczny.setdefault('mirrors', []).append(wynik['link'])
+            logging.info(f"Duplikat {wynik['link']} -> {kanoniczny['link']}")
+            continue
+        
+        wg_skrotu[skrot] = wynik
+        if odcisk is not None:
+            for nr in range(pasma):
+                indeks_pasm[(nr, odcisk >> (nr * szerokosc) & maska)].append((odcisk, wynik))
+        unikalne.append(wynik)
+    return unikalne
+
+class ArticleStore:
+    """Trwałe archiwum pobranych artykułów (SQLite z indeksem pełnotekstowym FTS5).
+
+    Artykuły są zapisywane partiami w jednej transakcji i deduplikowane po
+    znormalizowanym URL; ponowne pobranie aktualizuje wpis.
+    """
+
+    def __init__(self, sciezka=None):
+        if sciezka is None:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            sciezka = os.path.join(DATA_DIR, 'artykuly.sqlite')
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(sciezka, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS artykuly (
+                id INTEGER PRIMARY KEY,
+                klucz TEXT UNIQUE,
+                url TEXT,
+                tytul TEXT,
+                data_publikacji TEXT,
+                autor TEXT,
+                slowa_kluczowe TEXT,
+                opis TEXT,
+                jezyk TEXT,
+                liczba_slow INTEGER,
+                tresc TEXT,
+                hash_tresci TEXT,
+                pobrano REAL,
+                zapytanie TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_artykuly_hash ON artykuly(hash_tresci);
+        """)
+        try:
+            self._db.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS artykuly_fts USING fts5(
+                    tytul, opis, tresc,
+                    content='artykuly', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                );
+                CREATE TRIGGER IF NOT EXISTS artykuly_ai AFTER INSERT ON artykuly BEGIN
+                    INSERT INTO artykuly_fts(rowid, tytul, opis, tresc)
+                    VALUES (new.id, new.tytul, new.opis, new.tresc);
+                END;
+                CREATE TRIGGER IF NOT EXISTS artykuly_ad AFTER DELETE ON artykuly BEGIN
+                    INSERT INTO artykuly_fts(artykuly_fts, rowid, tytul, opis, tresc)
+                    VALUES ('delete', old.id, old.tytul, old.opis, old.tresc);
+                END;
+                CREATE TRIGGER IF NOT EXISTS artykuly_au AFTER UPDATE ON artykuly BEGIN
+                    INSERT INTO artykuly_fts(artykuly_fts, rowid, tytul, opis, tresc)
+                    VALUES ('delete', old.id, old.tytul, old.opis, old.tresc);
+                    INSERT INTO artykuly_fts(rowid, tytul, opis, tresc)
+                    VALUES (new.id, new.tytul, new.opis, new.tresc);
+                END;
+            """)
+            self.fts = True
+        except sqlite3.OperationalError as e:
+            # SQLite bez FTS5 - wyszukiwanie przez LIKE
+            logging.warning(f"FTS5 niedostępne, wyszukiwanie będzie wolniejsze: {e}")
+            self.fts = False
+        self._db.commit()
+
+    def zapisz(self, wyniki, zapytanie=None):
+        """Zapisuje udane wyniki GoogleScraper w jednej transakcji. Zwraca liczbę zapisanych."""
+        teraz = time.time()
+        wiersze = []
+        for wynik in wyniki:
+            tresc = wynik.get('content')
+            if not tresc:
+                continue
+            metadata = wynik.get('metadata', {})
+            wiersze.append((
+                normalizuj_url(wynik['link']), wynik['link'],
+                metadata.get('title') or wynik.get('title', ''),
+                metadata.get('date'), metadata.get('author'),
+                json.dumps(metadata.get('keywords', []), ensure_ascii=False),
+                metadata.get('description'), metadata.get('language'),
+                metadata.get('word_count', 0), tresc, hash_tresci(tresc),
+                teraz, zapytanie
+            ))
+        if not wiersze:
+            return 0
+        
+        with self._lock, self._db:
+            self._db.executemany("""
+                INSERT INTO artykuly (klucz, url, tytul, data_publikacji, autor, slowa_kluczowe,
+                                      opis, jezyk, liczba_slow, tresc, hash_tresci, pobrano, zapytanie)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(klucz) DO UPDATE SET
+                    url = excluded.url, tytul = excluded.tytul,
+                    data_publikacji = excluded.data_publikacji, autor = excluded.autor,
+                    slowa_kluczowe = excluded.slowa_kluczowe, opis = excluded.opis,
+                    jezyk = excluded.jezyk, liczba_slow = excluded.liczba_slow,
+                    tresc = excluded.tresc, hash_tresci = excluded.hash_tresci,
+                    pobrano = excluded.pobrano, zapytanie = excluded.zapytanie
+            """, wiersze)
+        return len(wiersze)
+
+    def szukaj(self, fraza, limit=20):
+        """Wyszukiwanie pełnotekstowe we wszystkich zapisanych artykułach"""
+        with self._lock:
+            if self.fts:
+                # Każde słowo jako osobny termin w cudzysłowie - bez składni zapytań FTS
+                zapytanie_fts = ' '.join('"' + slowo.replace('"', '""') + '"' for slowo in fraza.split())
+                wiersze = self._db.execute("""
+                    SELECT a.url, a.tytul, a.data_publikacji, a.pobrano,
+                           snippet(artykuly_fts, 2, '[', ']', '…', 16)
+                    FROM artykuly_fts JOIN artykuly a ON a.id = artykuly_fts.rowid
+                    WHERE artykuly_fts MATCH ?
+                    ORDER BY bm25(artykuly_fts)
+                    LIMIT ?
+                """, (zapytanie_fts, limit)).fetchall()
+            else:
+                wiersze = self._db.execute("""
+                    SELECT url, tytul, data_publikacji, pobrano, substr(tresc, 1, 200)
+                    FROM artykuly WHERE tresc LIKE ? OR tytul LIKE ?
+                    ORDER BY pobrano DESC LIMIT ?
+                """, (f"%{fraza}%", f"%{fraza}%", limit)).fetchall()
+        return [
+            dict(zip(('url', 'tytul', 'data_publikacji', 'pobrano', 'fragment'), wiersz))
+            for wiersz in wiersze
+        ]
+
+    def liczba_artykulow(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM artykuly").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+_article_store = None
+_article_store_lock = threading.Lock()
+
+def get_article_store():
+    """Zwraca wspólne archiwum artykułów"""
+    global _article_store
+    if _article_store is None:
+        with _article_store_lock:
+            if _article_store is None:
+                _article_store = ArticleStore()
+    return _article_store
+
+def polacz_rankingi(wyniki_zapytan, k=60):
+    """Łączy rankingi wielu zapytań metodą Reciprocal Rank Fusion.
+
+    wyniki_zapytan - słownik {zapytanie: lista organic_results}
+    Każdy URL (po normalizacji) występuje w wyniku raz, z sumą 1/(k + pozycja)
+    ze wszystkich zapytań oraz listą zapytań, które go zwróciły.
+    """
+    polaczone = {}
+    for zapytanie, wyniki in wyniki_zapytan.items():
+        for pozycja, wynik in enumerate(wyniki, 1):
+            if not wynik.get('link'):
+                continue
+            klucz = normalizuj_url(wynik['link'])
+            if klucz not in polaczone:
+                polaczone[klucz] = dict(wynik, rrf_score=0.0, queries=[])
+            polaczone[klucz]['rrf_score'] += 1.0 / (k + pozycja)
+            polaczone[klucz]['queries'].append(zapytanie)
+    
+    return sorted(polaczone.values(), key=lambda w: w['rrf_score'], reverse=True)
+
+def wykonaj_wyszukiwanie(zapytanie, api_key, force_refresh=False):
+    parametry_wyszukiwania = {
+        "q": zapytanie,
+        "hl": "pl",
+        "gl": "pl",
+        "api_key": "TWÓJ_KLUCZ_API_SERPAPI",  # Zastąp swoim kluczem API SerpApi
+        "num": 3
+    }
+    
+    try:
+        logging.info(f"Wykonuję zapytanie: {zapytanie}")
+        wyniki = szukaj_serpapi(parametry_wyszukiwania, force_refresh=force_refresh)
+        return wyniki.get('organic_results', [])[:3]  # dodatkowo zabezpieczamy limit
+    except Exception as e:
+        logging.error(f"Błąd podczas wyszukiwania: {e}")
+        return []
+
+def zapisz_raport(wyniki, nazwa_pliku, statystyki, temat="COVID-19 Impact"):
+    # Wyniki z GoogleScraper mają już treść - pobieramy tylko brakujące
+    tresci = [
+        {
+            'tekst': wynik['content'],
+            'data_publikacji': wynik.get('metadata', {}).get('date'),
+            'autorzy': [wynik['metadata']['author']] if wynik.get('metadata', {}).get('author') else []
+        } if wynik.get('content') else None
+        for wynik in wyniki
+    ]
+    do_pobrania = [i for i, wynik in enumerate(wyniki) if 'content' not in wynik]
+    
+    # Pobieramy treści równolegle - limiter pilnuje odstępów w ramach domeny
+    pobrane = pobierz_wspolbieznie(
+        [wyniki[i].get('link', '') for i in do_pobrania],
+        pobierz_tresc_artykulu
+    )
+    for i, tresc in zip(do_pobrania, pobrane):
+        tresci[i] = tresc
+    
+    with open(nazwa_pliku, 'w', encoding='utf-8') as plik:
+        plik.write(f"Szczegółowy Raport OSINT - {temat}\n")
+        plik.write(f"Data wygenerowania: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        plik.write("=" * 100 + "\n\n")
+        
+        # Dodanie podsumowania na początku raportu
+        plik.write("PODSUMOWANIE SCRAPINGU:\n")
+        plik.write("-" * 50 + "\n")
+        for domena, stats in statystyki.items():
+            plik.write(f"Domena: {domena}\n")
+            plik.write(f"Udane pobrania: {stats['udane']} (z cache: {stats['z_cache']})\n")
+            plik.write(f"Nieudane pobrania: {stats['nieudane']}\n")
+            if stats['bledy']:
+                plik.write(f"Błędy: {_opis_bledow(stats['bledy'])}\n")
+            plik.write(f"Pobrane dane: {stats['bajty'] / 1024:.0f} KB\n")
+            plik.write(f"Całkowity czas: {stats['czas_calkowity']:.2f}s\n")
+            for metryka in FetchStatistics.METRICS:
+                plik.write(f"{metryka} p50/p95/p99: " + "/".join(
+                    _ms(stats[f'{metryka}_p{p}']) for p in FetchStatistics.PERCENTILES
+                ) + " ms\n")
+            plik.write("-" * 30 + "\n")
+        plik.write("\nSZCZEGÓŁOWE WYNIKI:\n")
+        plik.write("=" * 100 + "\n\n")
+        
+        for i, (wynik, tresc) in enumerate(zip(wyniki, tresci), 1):
+            plik.write(f"ARTYKUŁ #{i}\n")
+            plik.write("=" * 50 + "\n")
+            plik.write(f"Tytuł: {wynik.get('title', 'Brak tytułu')}\n")
+            plik.write(f"Link: {wynik.get('link', 'Brak linku')}\n\n")
+            if wynik.get('mirrors'):
+                plik.write("Kopie: " + ", ".join(wynik['mirrors']) + "\n\n")
+            
+            if tresc:
+                if tresc['data_publikacji']:
+                    plik.write(f"Data publikacji: {tresc['data_publikacji']}\n")
+                plik.write("\nSTRESZCZENIE Z WYSZUKIWARKI:\n")
+                plik.write(f"{wynik.get('snippet', 'Brak opisu')}\n\n")
+                plik.write("PEŁNA TREŚĆ ARTYKUŁU:\n")
+                plik.write(f"{tresc['tekst']}\n")
+            else:
+                plik.write("\nSTRESZCZENIE Z WYSZUKIWARKI:\n")
+                plik.write(f"{wynik.get('snippet', 'Brak opisu')}\n")
+                plik.write("\nNie udało się pobrać pełnej treści artykułu.\n")
+            
+            plik.write("\n" + "=" * 100 + "\n\n")
+
+# Rozbudowane predefiniowane tematy OSINT
+OSINT_TOPICS = {
+    "COVID-19 Biznes": {
+        "queries": [
+            "Tomasz Biernacki Dino Polska pandemia COVID-19 rozwój",
+            "Dino Polska wyniki finansowe 2020 2021 2022",
+            "Tomasz Biernacki majątek wzrost pandemia",
+            "Dino Polska strategia rozwój COVID-19",
+            "Tomasz Biernacki wywiad pandemia biznes"
+        ],
+        "sources": ["biznes", "finanse", "gospodarka"]
+    },
+    "Blockchain Startupy": {
+        "queries": [
+            "blockchain startupy Polska rozwój inwestycje",
+            "polski blockchain innowacje technologie",
+            "kryptowaluty startupy finansowanie Polska",
+            "blockchain inwestorzy venture capital Polska",
+            "polska technologia blockchain rozwój projekty"
+        ],
+        "sources": ["technologia", "biznes", "startupy"]
+    },
+    "Elon Musk Relacje": {
+        "queries": [
+            "Elon Musk SpaceX Tesla współpraca partnerstwa",
+            "Musk inwestycje projekty technologiczne",
+            "Tesla SpaceX partnerzy strategiczni",
+            "Elon Musk relacje biznesowe technologia",
+            "Musk współpraca firmy technologiczne"
+        ],
+        "sources": ["technologia", "biznes", "innowacje"]
+    },
+    "E-sport Polska": {
+        "queries": [
+            "e-sport Polska rozwój turnieje gaming",
+            "polski e-sport inwestycje sponsoring",
+            "e-sport organizacje turnieje Polska",
+            "gaming zawodowy rozwój Polska",
+            "e-sport polska liga profesjonalna"
+        ],
+        "sources": ["gaming", "sport", "technologia"]
+    },
+    "Jack Ma Aktywność": {
+        "queries": [
+            "Jack Ma działalność publiczna Chiny",
+            "Alibaba Jack Ma zarządzanie zmiany",
+            "Jack Ma konflikt rząd chiński biznes",
+            "Jack Ma obecność medialna aktywność",
+            "Alibaba Group kierownictwo zmiany"
+        ],
+        "sources": ["biznes", "polityka", "technologia"]
+    },
+    "5G Dezinformacja": {
+        "queries": [
+            "5G Polska dezinformacja fake news",
+            "technologia 5G mity Polska",
+            "5G zagrożenia prawda fałsz",
+            "dezinformacja 5G źródła Polska",
+            "5G teorie spiskowe analiza"
+        ],
+        "sources": ["technologia", "media", "bezpieczeństwo"]
+    },
+    "Fintech Cyberbezpieczeństwo": {
+        "queries": [
+            "fintech cyberbezpieczeństwo zagrożenia Polska",
+            "sektor finansowy cyberataki trendy",
+            "fintech bezpieczeństwo technologie",
+            "cyberbezpieczeństwo bankowość cyfrowa",
+            "fintech ryzyko cyberzagrożenia"
+        ],
+        "sources": ["technologia", "finanse", "bezpieczeństwo"]
+    },
+    "AI Healthcare": {
+        "queries": [
+            "sztuczna inteligencja medycyna Polska rozwój",
+            "AI healthcare startupy innowacje",
+            "medtech sztuczna inteligencja projekty",
+            "AI służba zdrowia technologie",
+            "healthcare innowacje technologiczne Polska"
+        ],
+        "sources": ["medycyna", "technologia", "innowacje"]
+    }
+}
+
+# Domyślny szablon raportu AI
+DOMYSLNY_SZABLON = """Jesteś doświadczonym analitykiem OSINT specjalizującym się w szczegółowych analizach. 
+Twoim zadaniem jest stworzenie bardzo szczegółowego raportu zawierającego:
+
+1. PODSUMOWANIE WYKONAWCZE (min. 500 słów)
+   - Kluczowe ustalenia z analizy
+   - Najważniejsze wnioski i implikacje
+   - Krytyczne punkty wymagające uwagi
+
+2. SZCZEGÓŁOWA ANALIZA (min. 1000 słów)
+   - Dogłębna analiza głównych tematów
+   - Szczegółowe omówienie trendów i wzorców
+   - Analiza kluczowych podmiotów i ich roli
+   - Analiza danych ilościowych i jakościowych
+
+3. KONTEKST I POWIĄZANIA (min. 500 słów)
+   - Szeroki kontekst geopolityczny i ekonomiczny
+   - Szczegółowe powiązania między informacjami
+   - Analiza historyczna i prognozy
+
+4. WNIOSKI I REKOMENDACJE (min. 500 słów)
+   - Szczegółowe wnioski z analizy
+   - Konkretne rekomendacje działań
+   - Analiza potencjalnych ryzyk i szans
+   - Plan działania i następne kroki
+
+Używaj konkretnych danych, liczb i przykładów. Twórz szczegółowe podpunkty i rozbudowane wyjaśnienia."""
+
+def utworz_klienta_openai(api_key=None, timeout=30.0):
+    """Tworzy klienta OpenAI (klucz z argumentu albo OPENAI_API_KEY)"""
+    from openai import OpenAI
+    
+    return OpenAI(
+        api_key=api_key or os.environ.get('OPENAI_API_KEY', ":)"),
+        timeout=timeout
+    )
+
+# Budżety tokenów dla etapów raportu AI (map-reduce)
+BUDZETY_AI = {
+    'fragment': 3000,       # wejście jednego wywołania "map"
+    'streszczenie': 500,    # odpowiedź "map" (streszczenie fragmentu)
+    'wejscie_raportu': None,  # wejście "reduce"; None - reszta okna kontekstu (zob. ustal_budzety)
+    'raport': 2000          # odpowiedź "reduce" (raport końcowy)
+}
+
+# Okna kontekstu modeli (wejście + odpowiedź), dopasowanie po najdłuższym prefiksie nazwy
+KONTEKST_MODELI = {
+    'gpt-3.5-turbo': 16385,
+    'gpt-4': 8192,
+    'gpt-4-32k': 32768,
+    'gpt-4-turbo': 128000,
+    'gpt-4o': 128000
+}
+# Zapas na narzut formatu wiadomości i błąd szacowania tokenów
+ZAPAS_KONTEKSTU = 300
+
+# Liczba równoległych wywołań "map"
+WSPOLBIEZNOSC_AI = 4
+# Maksymalna liczba kolejnych etapów streszczania
+MAKS_ETAPOW_AI = 3
+
+PROMPT_STRESZCZENIA = """Jesteś analitykiem OSINT. Streść poniższe artykuły na potrzeby późniejszego raportu.
+Zachowaj konkretne fakty, liczby, daty, nazwy podmiotów i źródła (tytuły, adresy).
+Pomiń treści powtarzające się i niezwiązane z tematem. Pisz zwięźle, w punktach."""
+
+# Polski tekst to ok. 2-3 znaki na token - bez tokenizera liczymy ostrożnie
+ZNAKI_NA_TOKEN = 2
+
+_TIKTOKEN = importlib.util.find_spec('tiktoken') is not None
+
+@functools.lru_cache(maxsize=None)
+def _koder_tokenow(model):
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+def policz_tokeny(tekst, model="gpt-4"):
+    """Liczba tokenów (tiktoken, jeśli zainstalowany - inaczej przybliżenie)"""
+    if _TIKTOKEN:
+        return len(_koder_tokenow(model).encode(tekst, disallowed_special=()))
+    return len(tekst) // ZNAKI_NA_TOKEN + 1
+
+def kontekst_modelu(model):
+    """Okno kontekstu modelu w tokenach (nieznane modele jak gpt-4)"""
+    pasujace = [nazwa for nazwa in KONTEKST_MODELI if model.startswith(nazwa)]
+    return KONTEKST_MODELI[max(pasujace, key=len)] if pasujace else KONTEKST_MODELI['gpt-4']
+
+def ustal_budzety(budzety, model, system_prompt):
+    """Uzupełnia budżety domyślnymi i sprawdza, czy wywołania mieszczą się w kontekście.
+
+    Bez jawnego 'wejscie_raportu' wejście "reduce" to okno kontekstu minus
+    odpowiedź ('raport'), prompt systemowy i ZAPAS_KONTEKSTU. Budżety, które
+    nie mieszczą się w kontekście modelu, kończą się ValueError.
+    """
+    budzety = dict(BUDZETY_AI, **(budzety or {}))
+    kontekst = kontekst_modelu(model)
+    wolne_map = (kontekst - budzety['streszczenie'] - policz_tokeny(PROMPT_STRESZCZENIA, model)
+                 - ZAPAS_KONTEKSTU)
+    if budzety['fragment'] > wolne_map:
+        raise ValueError(f"Budżety 'fragment' i 'streszczenie' przekraczają kontekst modelu {model} "
+                         f"({kontekst} tokenów, na fragment zostaje {wolne_map})")
+    wolne_reduce = kontekst - budzety['raport'] - policz_tokeny(system_prompt, model) - ZAPAS_KONTEKSTU
+    if budzety['wejscie_raportu'] is None:
+        budzety['wejscie_raportu'] = wolne_reduce
+    elif budzety['wejscie_raportu'] > wolne_reduce:
+        raise ValueError(f"Budżety 'wejscie_raportu' i 'raport' przekraczają kontekst modelu {model} "
+                         f"({kontekst} tokenów, na wejście raportu zostaje {wolne_reduce})")
+    if budzety['wejscie_raportu'] < budzety['streszczenie']:
+        raise ValueError(f"Budżet 'raport' i szablon nie zostawiają w kontekście modelu {model} "
+                         f"miejsca na streszczenia ({budzety['wejscie_raportu']} tokenów)")
+    return budzety
+
+def podziel_na_fragmenty(teksty, budzet, model="gpt-4"):
+    """Pakuje teksty (artykuły) we fragmenty mieszczące się w budżecie tokenów.
+
+    Artykuły nie są dzielone, chyba że sam artykuł przekracza budżet -
+    wtedy jest cięty na granicach akapitów (a akapit zbyt długi - twardo).
+    """
+    czesci = []
+    for tekst in teksty:
+        if policz_tokeny(tekst, model) <= budzet:
+            czesci.append(tekst)
+            continue
+        for akapit in tekst.split('\n\n'):
+            while policz_tokeny(akapit, model) > budzet:
+                # Cięcie wg przybliżenia znaków, z zapasem na niedoszacowanie
+                granica = budzet * ZNAKI_NA_TOKEN // 2
+                czesci.append(akapit[:granica])
+                akapit = akapit[granica:]
+            if akapit.strip():
+                czesci.append(akapit)
+    
+    fragmenty = []
+    biezacy, tokeny = [], 0
+    for czesc in czesci:
+        ile = policz_tokeny(czesc, model)
+        if biezacy and tokeny + ile > budzet:
+            fragmenty.append('\n\n'.join(biezacy))
+            biezacy, tokeny = [], 0
+        biezacy.append(czesc)
+        tokeny += ile
+    if biezacy:
+        fragmenty.append('\n\n'.join(biezacy))
+    return fragmenty
+
+def teksty_artykulow(wyniki):
+    """Teksty artykułów do raportu AI (tytuł, link i treść albo snippet)"""
+    return [
+        f"{w.get('title', '')}\n{w.get('link', '')}\n{w.get('content') or w.get('snippet', '')}"
+        for w in wyniki
+    ]
+
+# Parametry próbkowania wywołań modelu (część klucza cache odpowiedzi)
+PARAMETRY_PROBKOWANIA = {
+    'temperature': 0.7,
+    'presence_penalty': 0.3,
+    'frequency_penalty': 0.3
+}
+
+class ReportCancelled(Exception):
+    """Generowanie raportu AI zostało anulowane"""
+
+class CompletionCache:
+    """Trwały cache odpowiedzi modelu językowego.
+
+    Klucz to (model, prompt systemowy, parametry próbkowania, skrót treści),
+    więc ta sama treść z tym samym szablonem nie jest wysyłana ponownie.
+    Wpisy starsze niż ttl są pomijane, a po przekroczeniu max_bytes usuwane
+    są najdawniej używane.
+    """
+
+    def __init__(self, sciezka=None, ttl=30 * 24 * 3600, max_bytes=50 * 1024 * 1024):
+        if sciezka is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            sciezka = os.path.join(CACHE_DIR, 'completion_cache.sqlite')
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(sciezka, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS odpowiedzi_ai (
+                klucz TEXT PRIMARY KEY,
+                model TEXT,
+                odpowiedz TEXT,
+                rozmiar INTEGER,
+                zapisano REAL,
+                uzyto REAL
+            )
+        """)
+        self._db.commit()
+
+    @staticmethod
+    def klucz(model, system_prompt, parametry, tresc):
+        czesci = [
+            model,
+            hashlib.sha256(system_prompt.encode('utf-8')).hexdigest(),
+            sorted(parametry.items()),
+            hashlib.sha256(tresc.encode('utf-8')).hexdigest()
+        ]
+        return hashlib.sha256(json.dumps(czesci).encode('utf-8')).hexdigest()
+
+    def get(self, klucz):
+        """Zwraca zapisaną odpowiedź, jeśli jest młodsza niż TTL"""
+        with self._lock:
+            wiersz = self._db.execute(
+                "SELECT odpowiedz, zapisano FROM odpowiedzi_ai WHERE klucz = ?", (klucz,)
+            ).fetchone()
+            if wiersz is None or time.time() - wiersz[1] >= self.ttl:
+                return None
+            self._db.execute("UPDATE odpowiedzi_ai SET uzyto = ? WHERE klucz = ?", (time.time(), klucz))
+            self._db.commit()
+        return wiersz[0]
+
+    def put(self, klucz, model, odpowiedz):
+        teraz = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO odpowiedzi_ai VALUES (?, ?, ?, ?, ?, ?)",
+                (klucz, model, odpowiedz, len(odpowiedz.encode('utf-8')), teraz, teraz)
+            )
+            self._db.execute("DELETE FROM odpowiedzi_ai WHERE zapisano < ?", (teraz - self.ttl,))
+            _usun_najstarsze(self._db, 'odpowiedzi_ai', self.max_bytes)
+            self._db.commit()
+
+_completion_cache = None
+_completion_cache_lock = threading.Lock()
+
+def get_completion_cache():
+    """Zwraca wspólny cache odpowiedzi modelu"""
+    global _completion_cache
+    if _completion_cache is None:
+        with _completion_cache_lock:
+            if _completion_cache is None:
+                _completion_cache = CompletionCache()
+    return _completion_cache
+
+def _zapytaj_model(client, model, system_prompt, tresc, max_tokens, use_cache=True,
+                   on_token=None, metryki=None, cancel_event=None):
+    """Jedno wywołanie modelu. use_cache=False pomija cache, ale zapisuje nową odpowiedź.
+
+    Z on_token odpowiedź jest strumieniowana - on_token(fragment) dostaje
+    kolejne fragmenty tekstu, a słownik metryki czas do pierwszego tokenu
+    (ttft) i szybkość generowania (tokeny_na_s).
+    """
+    parametry = dict(PARAMETRY_PROBKOWANIA, max_tokens=max_tokens)
+    cache = get_completion_cache()
+    klucz = cache.klucz(model, system_prompt, parametry, tresc)
+    if use_cache:
+        odpowiedz = cache.get(klucz)
+        if odpowiedz is not None:
+            logging.info("Odpowiedź modelu z cache")
+            if on_token:
+                on_token(odpowiedz)
+            if metryki is not None:
+                metryki.update(z_cache=True, ttft=0.0, czas=0.0, tokeny=policz_tokeny(odpowiedz, model))
+            return odpowiedz
+    
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": tresc}
+    ]
+    if on_token is None:
+        with get_tracer().span('openai', model=model, max_tokens=max_tokens):
+            response = client.chat.completions.create(model=model, messages=messages, **parametry)
+        if response and response.choices and response.choices[0].message.content:
+            odpowiedz = response.choices[0].message.content
+            cache.put(klucz, model, odpowiedz)
+            return odpowiedz
+        return None
+    
+    start = time.perf_counter()
+    ttft = None
+    czesci = []
+    with get_tracer().span('openai', model=model, max_tokens=max_tokens, stream=True):
+        strumien = client.chat.completions.create(model=model, messages=messages, stream=True, **parametry)
+        for chunk in strumien:
+            if cancel_event is not None and cancel_event.is_set():
+                strumien.close()
+                raise ReportCancelled()
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            czesci.append(chunk.choices[0].delta.content)
+            on_token(chunk.choices[0].delta.content)
+    czas = time.perf_counter() - start
+    
+    odpowiedz = ''.join(czesci)
+    if not odpowiedz:
+        return None
+    tokeny = policz_tokeny(odpowiedz, model)
+    tokeny_na_s = tokeny / (czas - ttft) if czas > ttft else 0.0
+    logging.info(f"Odpowiedź strumieniowa: pierwszy token po {ttft:.2f} s, {tokeny} tokenów, {tokeny_na_s:.1f} tokenów/s")
+    if metryki is not None:
+        metryki.update(z_cache=False, ttft=ttft, czas=czas, tokeny=tokeny, tokeny_na_s=tokeny_na_s)
+    cache.put(klucz, model, odpowiedz)
+    return odpowiedz
+
+def generuj_raport_ai(client, system_prompt, tresc, model="gpt-4", budzety=None,
+                      max_workers=WSPOLBIEZNOSC_AI, on_progress=None, use_cache=True,
+                      cancel_event=None, on_token=None, metryki=None):
+    """Generuje raport AI z zebranej treści. Zwraca tekst raportu albo None.
+
+    tresc to tekst albo lista tekstów artykułów. Jeśli całość nie mieści się
+    w budżecie jednego wywołania, fragmenty są najpierw streszczane równolegle
+    ("map"), a raport powstaje ze streszczeń przy użyciu szablonu ("reduce").
+    on_progress(komunikat) informuje o postępie etapów. Odpowiedzi modelu są
+    zapisywane w CompletionCache; use_cache=False wymusza nowe wywołania.
+    Ustawienie cancel_event (threading.Event) przerywa generowanie przed
+    kolejnym wywołaniem modelu wyjątkiem ReportCancelled. on_token i metryki
+    włączają strumieniowanie raportu końcowego (zob. _zapytaj_model).
+    """
+    def sprawdz_anulowanie():
+        if cancel_event is not None and cancel_event.is_set():
+            raise ReportCancelled()
+    
+    budzety = ustal_budzety(budzety, model, system_prompt)
+    teksty = [tresc] if isinstance(tresc, str) else list(tresc)
+    postep = on_progress or (lambda komunikat: None)
+    
+    for etap in range(1, MAKS_ETAPOW_AI + 1):
+        if sum(policz_tokeny(t, model) for t in teksty) <= budzety['wejscie_raportu']:
+            break
+        fragmenty = podziel_na_fragmenty(teksty, budzety['fragment'], model)
+        postep(f"Streszczanie {len(fragmenty)} fragmentów (etap {etap})...")
+        
+        def streszczenie(fragment):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            try:
+                with get_tracer().span('ai_map', etap=etap):
+                    return _zapytaj_model(client, model, PROMPT_STRESZCZENIA, fragment, budzety['streszczenie'],
+                                          use_cache=use_cache)
+            except Exception as e:
+                logging.error(f"Błąd streszczania fragmentu: {str(e)}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(fragmenty)))) as executor:
+            streszczenia = [s for s in executor.map(w_kontekscie(streszczenie), fragmenty) if s]
+        sprawdz_anulowanie()
+        if not streszczenia:
+            raise RuntimeError("Nie udało się streścić żadnego fragmentu treści")
+        teksty = streszczenia
+    else:
+        if sum(policz_tokeny(t, model) for t in teksty) > budzety['wejscie_raportu']:
+            logging.warning(f"Streszczenia po {MAKS_ETAPOW_AI} etapach przekraczają budżet - skracam")
+            teksty = podziel_na_fragmenty(teksty, budzety['wejscie_raportu'], model)[:1]
+    
+    sprawdz_anulowanie()
+    postep("Generowanie raportu końcowego...")
+    with get_tracer().span('ai_reduce'):
+        return _zapytaj_model(client, model, system_prompt, '\n\n'.join(teksty), budzety['raport'],
+                              use_cache=use_cache, on_token=on_token, metryki=metryki,
+                              cancel_event=cancel_event)
+
+class GPTReportGenerator:
+    def __init__(self):
+        self.api_key = "TWÓJ_KLUCZ_API_OPENAI"  # Zastąp swoim kluczem API OpenAI
+        try:
+            self.client = utworz_klienta_openai(
+                api_key=self.api_key,
+                timeout=30.0  # Zwiększamy timeout
+            )
+            logging.info("Klient OpenAI zainicjalizowany")
+        except Exception as e:
+            logging.error(f"Błąd inicjalizacji klienta OpenAI: {str(e)}")
+            raise
+
+    def generate_ai_report(self):
+        try:
+            if not self.openai_client:
+                self.log_message("Klient OpenAI nie jest zainicjalizowany. Sprawdź klucz API.", 'ERROR')
+                return
+            
+            self.log_message("Inicjalizacja generowania raportu AI...", 'PROCESS')
+            
+            system_prompt = getattr(self, 'current_template', self.default_template)
+            template_name = getattr(self, 'current_template_name', 'Domyślny szablon')
+            self.log_message(f"Używam szablonu: {template_name}", 'INFO')
+            
+            self.status_var.set("Generowanie raportu AI...")
+            
+            # Pobierz tekst i ogranicz jego długość
+            scraped_content = self.scraping_text.get("1.0", tk.END)
+            max_chars = 4000  # Zmniejszamy maksymalną długość tekstu
+            if len(scraped_content) > max_chars:
+                scraped_content = scraped_content[:max_chars] + "...[treść skrócona]"
+            
+            response = self.openai_client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": scraped_content}
+                ],
+                temperature=0.7,
+                max_tokens=4000,
+                presence_penalty=0.3,
+                frequency_penalty=0.3
+            )
+
+            if response.choices and response.choices[0].message.content:
+                report = response.choices[0].message.content
+                self.display_ai_report(report)
+                self.log_message("Raport AI wygenerowany pomyślnie", 'SUCCESS')
+            else:
+                self.log_message("Nie udało się wygenerować raportu", 'ERROR')
+
+        except Exception as e:
+            self.log_message(f"Błąd podczas generowania raportu: {str(e)}", 'ERROR')
+            self.display_ai_report("Wystąpił błąd podczas generowania raportu.")
+
+    def test_api(self):
+        """Metoda do testowania połączenia z API"""
+        try:
+            logging.info("Test połączenia z API...")
+            response = self.client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "Test."}],
+                max_tokens=1
+            )
+            logging.info("Test API udany")
+            return True, "Połączenie z API działa poprawnie"
+        except Exception as e:
+            logging.error(f"Test API nieudany: {str(e)}")
+            return False, f"Błąd połączenia: {str(e)}"
+
+class GoogleScraper:
+    def __init__(self, max_workers=8, max_per_domain=2, http_client=None, parser=None, api_key=None,
+                 article_store=None, deduplicate=True):
+        self.api_key = api_key or os.environ.get('SERPAPI_API_KEY', ":)")
+        # Statystyki pobrań tego scrapera (per domena)
+        self.statystyki = FetchStatistics()
+        self.duplicates_removed = 0
+        # Przebieg (run_id) ostatniego scrape/scrape_topic - do podsumowania spanów
+        self.last_run_id = None
+        # Limity równoległego pobierania artykułów
+        self.max_workers = max_workers
+        self.max_per_domain = max_per_domain
+        self.http = http_client or get_http_client()
+        # Backend BeautifulSoup (lxml, jeśli zainstalowany)
+        self.parser = wybierz_parser(parser)
+        # Archiwum artykułów: None - wspólne ArticleStore, False - bez zapisu
+        self.article_store = article_store
+        # Zwijanie przedruków przed analizą
+        self.deduplicate = deduplicate
+
+    def scrape_article(self, url):
+        """Ulepszona funkcja scrapowania artykułu z metadanymi"""
+        try:
+            tracer = get_tracer()
+            with tracer.span('fetch', url=url):
+                response = self.http.get_html(url, stats=self.statystyki)
+            response.raise_for_status()
+            
+            # Trafienie w cache - pomijamy ponowne parsowanie
+            if response.from_cache:
+                zapisane = self.http.cache.get_parsed(url, 'scrape_article')
+                if zapisane:
+                    return zapisane['metadata'], zapisane['content']
+            
+            with tracer.span('decode', url=url):
+                html = response.text
+            metadata, content = self.parse_article(url, html)
+            
+            if self.http.cache:
+                self.http.cache.put_parsed(url, 'scrape_article', {'metadata': metadata, 'content': content})
+            
+            return metadata, content
+            
+        except Exception as e:
+            return {
+                "url": url,
+                "scraping_success": False,
+                "error": str(e)
+            }, ""
+
+    def parse_article(self, url, html):
+        """Wyciąga metadane i treść z pobranego HTML"""
+        tracer = get_tracer()
+        with tracer.span('parse', url=url, parser=self.parser):
+            soup = parsuj_html(html, self.parser)
+        
+        # Metadane - wszystkie ekstraktory czytają z jednego indeksu
+        with tracer.span('metadata', url=url):
+            meta = self._build_meta_index(soup)
+        metadata = {
+            "url": url,
+            "title": self._extract_title(meta),
+            "date": self._extract_date(meta),
+            "author": self._extract_author(meta),
+            "keywords": self._extract_keywords(meta),
+            "description": self._extract_description(meta),
+            "language": self._detect_language(meta),
+            "word_count": 0,
+            "scraping_success": True,
+            "error": None
+        }
+        
+        # Treść
+        with tracer.span('extract', url=url):
+            content = self._extract_content(soup)
+        if not content:
+            metadata["scraping_success"] = False
+            metadata["error"] = "Nie udało się pobrać treści"
+        else:
+            metadata["word_count"] = len(content.split())
+        
+        return metadata, content
+
+    def _build_meta_index(self, soup):
+        """Buduje indeks metadanych w jednym przejściu po <head>.
+
+        Znaczniki meta są indeksowane po property/name/itemprop (małymi literami,
+        wygrywa pierwsze wystąpienie). Dodatkowo: <title>, <html lang> i pola
+        datePublished/author z JSON-LD.
+        """
+        index = {'meta': {}, 'title': '', 'lang': None, 'jsonld': {}}
+        
+        if soup.html is not None:
+            index['lang'] = soup.html.get('lang')
+        
+        head = soup.head or soup
+        jsonld_scripts = []
+        for element in head.find_all(['meta', 'title', 'script']):
+            if element.name == 'meta':
+                key = element.get('property') or element.get('name') or element.get('itemprop')
+                if key and element.get('content') is not None:
+                    index['meta'].setdefault(key.strip().lower(), element['content'])
+            elif element.name == 'title':
+                if not index['title'] and element.string:
+                    index['title'] = element.string
+            elif element.get('type') == 'application/ld+json':
+                jsonld_scripts.append(element)
+        
+        # JSON-LD bywa też w <body> - szukamy tam tylko, gdy brakuje danych z <head>
+        if soup.head is not None and not jsonld_scripts and not (
+            'article:published_time' in index['meta'] and
+            ('article:author' in index['meta'] or 'author' in index['meta'])
+        ):
+            jsonld_scripts = soup.find_all('script', type='application/ld+json')
+        
+        for script in jsonld_scripts:
+            try:
+                self._collect_jsonld(json.loads(script.string or ''), index['jsonld'])
+            except ValueError:
+                continue
+        
+        return index
+
+    def _collect_jsonld(self, data, found):
+        """Zbiera pierwsze wystąpienia datePublished i author z danych JSON-LD"""
+        if isinstance(data, list):
+            for item in data:
+                self._collect_jsonld(item, found)
+        elif isinstance(data, dict):
+            for key in ('datePublished', 'author'):
+                if key in data and key not in found:
+                    found[key] = data[key]
+            for value in data.values():
+                if isinstance(value, (list, dict)):
+                    self._collect_jsonld(value, found)
+
+    def _extract_title(self, meta):
+        """Ekstrakcja tytułu"""
+        title = meta['meta'].get('og:title') or meta['title']
+        return title.strip() if title else ""
+
+    def _extract_date(self, meta):
+        """Ekstrakcja daty"""
+        date = meta['meta'].get('article:published_time') or meta['jsonld'].get('datePublished')
+        return date if isinstance(date, str) else None
+
+    def _extract_author(self, meta):
+        """Ekstrakcja autora"""
+        author = meta['meta'].get('article:author') or meta['meta'].get('author')
+        if author:
+            return author
+        
+        author = meta['jsonld'].get('author')
+        authors = author if isinstance(author, list) else [author]
+        names = [a.get('name') if isinstance(a, dict) else a for a in authors]
+        names = [n for n in names if isinstance(n, str) and n]
+        return ", ".join(names) if names else None
+
+    def _extract_keywords(self, meta):
+        """Ekstrakcja słów kluczowych"""
+        keywords = meta['meta'].get('keywords')
+        if keywords:
+            return [k.strip() for k in keywords.split(",") if k.strip()]
+        return []
+
+    def _extract_description(self, meta):
+        """Ekstrakcja opisu"""
+        return meta['meta'].get('description') or meta['meta'].get('og:description')
+
+    def _detect_language(self, meta):
+        """Ekstrakcja języka"""
+        lang = meta['meta'].get('og:locale') or meta['lang']
+        if lang:
+            return re.split(r'[-_]', lang.strip())[0].lower()
+        return None
+
+    def _extract_content(self, soup):
+        """Ekstrakcja treści artykułu"""
+        parts = []
+        
+        # Próbujemy różne selektory dla różnych stron
+        main_content = soup.find('article') or \
+                      soup.find('main') or \
+                      soup.find(class_=['content', 'article-content', 'post-content']) or \
+                      soup.find(id=['content', 'main-content', 'article-content'])
+        
+        if main_content:
+            # Pobieramy paragrafy i nagłówki - każdy blok tylko raz
+            for element in _bloki_tekstu(main_content, ('p', 'h1', 'h2', 'h3', 'h4', 'li', 'table')):
+                if isinstance(element, str):  # luźny tekst z komórki tabeli albo elementu listy
+                    nazwa, text = 'p', element
+                else:
+                    nazwa, text = element.name, element.get_text(' ', strip=True)
+                if text and len(text) > 20:  # Filtrujemy krótkie fragmenty
+                    if nazwa.startswith('h'):
+                        parts.append(f"\n### {text}\n")
+                    elif nazwa == 'table':
+                        # Tabela danych - wiersz po wierszu, komórki rozdzielone |
+                        wiersze = [
+                            "| " + " | ".join(k.get_text(' ', strip=True) for k in wiersz.find_all(['td', 'th'])) + " |"
+                            for wiersz in element.find_all('tr')
+                        ]
+                        parts.append("\n" + "\n".join(wiersze or [text]) + "\n\n")
+                    else:
+                        parts.append(f"{text}\n\n")
+        
+        # Jeśli nie znaleźliśmy głównej treści, próbujemy pobrać wszystkie znaczące fragmenty
+        if not parts:
+            for element in _bloki_tekstu(soup, ('p', 'h1', 'h2', 'h3', 'h4', 'li')):
+                text = element if isinstance(element, str) else element.get_text(' ', strip=True)
+                if text and len(text) > 30:  # Dłuższy próg dla tekstu bez kontekstu
+                    parts.append(f"{text}\n\n")
+        
+        return "".join(parts).strip()
+
+    def search(self, query, num_results=3, force_refresh=False):
+        """Zwraca organic_results z SerpApi (z cache, o ile nie wymuszono odświeżenia)"""
+        with get_tracer().span('search', query=query):
+            wyniki = szukaj_serpapi({
+                "q": query,
+                "hl": "pl",
+                "gl": "pl",
+                "api_key": self.api_key,
+                "num": num_results,
+                "engine": "google"
+            }, force_refresh=force_refresh)
+        return wyniki.get('organic_results', [])
+
+    @staticmethod
+    def _build_result(result, metadata, full_content):
+        processed = {
+            'title': result.get('title', ''),
+            'link': result['link'],
+            'snippet': result.get('snippet', ''),
+            'content': full_content,
+            'metadata': metadata
+        }
+        # Wyniki z wielu zapytań niosą ocenę fuzji rankingów
+        if 'rrf_score' in result:
+            processed['rrf_score'] = result['rrf_score']
+            processed['queries'] = result['queries']
+        return processed
+
+    def fetch_results(self, organic_results, on_result=None, query=None):
+        """Pobiera treść artykułów dla wyników wyszukiwania, zachowując ich kolejność.
+
+        on_result(indeks, liczba_wszystkich, wynik) pozwala odbierać artykuły
+        strumieniowo, w kolejności ukończenia pobierania.
+        """
+        results_with_link = [r for r in organic_results if r.get('link')]
+        
+        def article_done(index, article):
+            metadata, full_content = article
+            on_result(index, len(results_with_link),
+                      self._build_result(results_with_link[index], metadata, full_content))
+        
+        tracer = get_tracer()
+        # Pobierz pełną treść artykułów równolegle (kolejność wg rankingu)
+        with tracer.span('fetch_all', articles=len(results_with_link)):
+            articles = pobierz_wspolbieznie(
+                [r['link'] for r in results_with_link],
+                self.scrape_article,
+                max_workers=self.max_workers,
+                max_per_domain=self.max_per_domain,
+                on_result=article_done if on_result else None
+            )
+        
+        processed_results = [
+            self._build_result(result, metadata, full_content)
+            for result, (metadata, full_content) in zip(results_with_link, articles)
+        ]
+        with tracer.span('store'):
+            self._store_results(processed_results, query)
+        
+        if self.deduplicate:
+            with tracer.span('dedup'):
+                unique_results = usun_duplikaty(processed_results)
+            self.duplicates_removed += len(processed_results) - len(unique_results)
+            processed_results = unique_results
+        return processed_results
+
+    def _store_results(self, processed_results, query=None):
+        """Zapisuje wyniki do archiwum jedną transakcją"""
+        if self.article_store is False:
+            return
+        try:
+            store = self.article_store or get_article_store()
+            saved = store.zapisz(processed_results, zapytanie=query)
+            logging.info(f"Zapisano {saved} artykułów w archiwum")
+        except Exception as e:
+            logging.error(f"Błąd zapisu do archiwum artykułów: {str(e)}")
+
+    def scrape(self, query, num_results=3, force_refresh=False, on_result=None):
+        tracer = get_tracer()
+        try:
+            logging.info(f"Rozpoczynam wyszukiwanie dla: {query}")
+            
+            with tracer.run() as self.last_run_id, tracer.span('scrape', query=query):
+                organic_results = self.search(query, num_results, force_refresh=force_refresh)
+                return self.fetch_results(organic_results, on_result=on_result, query=query)
+            
+        except Exception as e:
+            logging.error(f"Błąd podczas scrapowania: {str(e)}")
+            raise e
+
+    def scrape_topic(self, queries, num_results=3, force_refresh=False, on_result=None):
+        """Wykonuje wszystkie zapytania tematu równolegle.
+
+        Rankingi są łączone (RRF), a zduplikowane adresy pobierane tylko raz.
+        """
+        def search_safe(query):
+            try:
+                return self.search(query, num_results, force_refresh=force_refresh)
+            except Exception as e:
+                logging.error(f"Błąd wyszukiwania dla '{query}': {str(e)}")
+                return []
+        
+        logging.info(f"Rozpoczynam wyszukiwanie {len(queries)} zapytań tematu")
+        tracer = get_tracer()
+        with tracer.run() as self.last_run_id, tracer.span('scrape_topic', queries=len(queries)):
+            with ThreadPoolExecutor(max_workers=max(1, len(queries))) as executor:
+                rankings = dict(zip(queries, executor.map(w_kontekscie(search_safe), queries)))
+            
+            fused = polacz_rankingi(rankings)
+            logging.info(
+                f"Połączono {sum(len(r) for r in rankings.values())} wyników w {len(fused)} unikalnych adresów"
+            )
+            return self.fetch_results(fused, on_result=on_result, query=" | ".join(queries))
+
+    def get_statistics(self):
+        """Zwraca statystyki pobrań per domena (zob. FetchStatistics.podsumowanie)"""
+        return self.statystyki.podsumowanie()
+
+class OSINTUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("OSINT Report Generator")
+        self.root.geometry("1200x900")
+        
+        # Klient OpenAI powstaje przy pierwszym użyciu (patrz openai_client)
+        self._openai_client = None
+            
+        # Dodajemy konfigurację
+        self.CONFIG = {
+            'MAX_RETRIES': 3,
+            'RETRY_DELAY': 2,
+            'MAX_TOKENS': 2000,  # Zmniejszamy z 4000 na 2000
+            'AI_BUDGETS': dict(BUDZETY_AI),  # budżety tokenów etapów map-reduce
+            'QUEUE_CHECK_INTERVAL': 50,  # odświeżanie przy aktywnych zadaniach (ms)
+            'QUEUE_IDLE_INTERVAL': 500,  # maksymalny odstęp w bezczynności (ms)
+            'QUEUE_BATCH_LIMIT': 1000,   # komunikatów na jedno odświeżenie
+            'RESULTS_PAGE_SIZE': 50      # wierszy na stronie listy wyników
+        }
+        # Długość raportu końcowego wyznacza MAX_TOKENS
+        self.CONFIG['AI_BUDGETS']['raport'] = self.CONFIG['MAX_TOKENS']
+        
+        # Rozbudowane predefiniowane tematy OSINT
+        self.OSINT_TOPICS = OSINT_TOPICS
+        
+        # Style
+        self.style = ttk.Style()
+        self.style.configure('Header.TLabel', font=('Segoe UI', 12, 'bold'))
+        self.style.configure('Info.TLabel', font=('Segoe UI', 10))
+        self.style.configure('Action.TButton', padding=8)
+        
+        # Inicjalizacja zmiennych
+        self.topic_var = tk.StringVar()
+        self.custom_search_var = tk.StringVar()  # do przechowywania wartości
+        self.search_mode = tk.StringVar(value="preset")
+        self.status_var = tk.StringVar(value="Gotowy do rozpoczęcia")
+        self.articles_var = tk.StringVar(value="3")
+        self.force_refresh_var = tk.BooleanVar(value=False)
+        self.force_ai_refresh_var = tk.BooleanVar(value=False)
+        self.ai_status_var = tk.StringVar(value="")
+        # Zadanie raportu AI w tle: zdarzenie anulowania albo None
+        self.ai_job = None
+        self.progress_var = tk.StringVar(value="")
+        self.streamed_count = 0
+        # Wyniki w widoku listy (pełna treść wczytywana dopiero po zaznaczeniu)
+        self.displayed_results = []
+        self.results_page = 0
+        self.page_var = tk.StringVar(value="")
+        self.archive_query_var = tk.StringVar()
+        # Wyniki ostatnich wyszukiwań - kluczem jest zapytanie lub nazwa tematu
+        self.results_cache = {}
+        # Komunikaty wątków roboczych: (id zadania, typ, dane)
+        self.queue = queue.Queue()
+        # Zadania w tle: id -> obsługa komunikatów (zwraca True po zakończeniu zadania)
+        self.jobs = {}
+        self._job_counter = 0
+        # Scrapowanie, którego wyniki są aktualnie wyświetlane
+        self.scrape_job = None
+        # Przebieg (spany) ostatnio uruchomionego scrapowania
+        self.last_run_id = None
+        self._dispatch_delay = self.CONFIG['QUEUE_CHECK_INTERVAL']
+        self._dispatch_after = None
+        
+        # Dodaj domyślny szablon
+        self.default_template = DOMYSLNY_SZABLON
+        
+        # Tworzenie menu
+        self.create_menu()
+        
+        # Tworzenie interfejsu
+        self.create_main_interface()
+        
+        # Inicjalizacja loggera
+        self.logger = Logger(self.log_text)
+        
+        # Dyspozytor komunikatów z wątków roboczych
+        self._dispatch_after = self.root.after(self._dispatch_delay, self.dispatch_queue)
+        
+        # Dodaj w __init__:
+        self.search_mode.trace('w', lambda *args: self.toggle_search_mode())
+
+    @property
+    def openai_client(self):
+        """Klient OpenAI - import openai jest kosztowny, więc nie opóźnia startu okna"""
+        if self._openai_client is None:
+            try:
+                self._openai_client = utworz_klienta_openai(api_key=":)")
+                self.log_message("Klient OpenAI zainicjalizowany pomyślnie", 'SUCCESS')
+            except Exception as e:
+                self.log_message(f"Błąd inicjalizacji klienta OpenAI: {str(e)}", 'ERROR')
+        return self._openai_client
+
+    def create_menu(self):
+        """Tworzy menu główne aplikacji"""
+        menubar = tk.Menu(self.root)
+        self.root.config(menu=menubar)
+        
+        # Menu Plik
+        file_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Plik", menu=file_menu)
+        file_menu.add_command(label="Zapisz raport", command=self.save_report)
+        file_menu.add_command(label="Eksportuj logi", command=self.export_logs)
+        file_menu.add_separator()
+        file_menu.add_command(label="Wyjście", command=self.root.quit)
+        
+        # Menu Narzędzia
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Narzędzia", menu=tools_menu)
+        tools_menu.add_command(label="Ustawienia", command=self.show_settings)
+        tools_menu.add_command(label="Test API", command=self.test_api_connection)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Podsumowanie etapów", command=self.show_trace_summary)
+        tools_menu.add_command(label="Eksportuj trace (Chrome)", command=self.export_trace)
+        
+        # Menu Pomoc
+        help_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Pomoc", menu=help_menu)
+        help_menu.add_command(label="Dokumentacja", command=self.show_docs)
+        help_menu.add_command(label="O programie", command=self.show_about)
+    
+    def create_main_interface(self):
+        """Tworzy główny interfejs aplikacji"""
+        # Notebook (zakładki)
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        # Panel główny
+        main_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(main_frame, text="Panel główny")
+        
+        # Panel wyszukiwania
+        search_frame = ttk.LabelFrame(main_frame, text="Opcje wyszukiwania", padding="10")
+        search_frame.pack(fill='x', pady=(0, 10))
+        
+        # Wybór tematu
+        ttk.Label(
+            search_frame,
+            text="Wybierz predefiniowany temat:",
+            style='Info.TLabel'
+        ).pack(anchor='w', pady=(0, 5))
+        
+        self.topic_combo = ttk.Combobox(
+            search_frame,
+            textvariable=self.topic_var,
+            values=list(self.OSINT_TOPICS.keys()),
+            state='readonly',
+            width=50
+        )
+        self.topic_combo.pack(fill='x', pady=(0, 10))
+        
+        # Własne wyszukiwanie
+        ttk.Label(
+            search_frame,
+            text="Lub wprowadź własne zapytanie:",
+            style='Info.TLabel'
+        ).pack(anchor='w', pady=(0, 5))
+        
+        ttk.Entry(
+            search_frame,
+            textvariable=self.custom_search_var,
+            width=50
+        ).pack(fill='x', pady=(0, 10))
+        
+        # Opcje scrapowania
+        options_frame = ttk.LabelFrame(main_frame, text="Opcje scrapowania", padding="10")
+        options_frame.pack(fill='x', pady=(0, 10))
+        
+        ttk.Label(
+            options_frame,
+            text="Liczba artykułów:",
+            style='Info.TLabel'
+        ).pack(side='left', padx=(0, 10))
+        
+        ttk.Spinbox(
+            options_frame,
+            from_=1,
+            to=10,
+            width=5,
+            textvariable=self.articles_var
+        ).pack(side='left')
+        
+        ttk.Checkbutton(
+            options_frame,
+            text="Wymuś odświeżenie wyników wyszukiwania",
+            variable=self.force_refresh_var
+        ).pack(side='left', padx=(20, 0))
+        
+        ttk.Checkbutton(
+            options_frame,
+            text="Nowy raport AI (pomiń cache)",
+            variable=self.force_ai_refresh_var
+        ).pack(side='left', padx=(20, 0))
+        
+        # Przyciski akcji
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill='x', pady=(0, 10))
+        
+        ttk.Button(
+            button_frame,
+            text="Rozpocznij scrapowanie",
+            command=self.start_scraping,
+            style='Action.TButton'
+        ).pack(side='left', padx=5)
+        
+        ttk.Button(
+            button_frame,
+            text="Generuj raport AI",
+            command=self.generate_ai_report,
+            style='Action.TButton'
+        ).pack(side='left', padx=5)
+        
+        self.cancel_ai_button = ttk.Button(
+            button_frame,
+            text="Anuluj raport AI",
+            command=self.cancel_ai_report,
+            state='disabled'
+        )
+        self.cancel_ai_button.pack(side='left', padx=5)
+        
+        # Dodaj po przycisku "Generuj raport AI"
+        ttk.Button(
+            button_frame,
+            text="Wybierz szablon raportu",
+            command=self.show_template_window
+        ).pack(side='left', padx=5)
+        
+        # Licznik postępu pobierania
+        ttk.Label(
+            button_frame,
+            textvariable=self.progress_var,
+            style='Info.TLabel'
+        ).pack(side='right', padx=5)
+        
+        # Obszar wyników
+        results_frame = ttk.Frame(main_frame)
+        results_frame.pack(fill='both', expand=True)
+        
+        # Logi
+        self.log_text = scrolledtext.ScrolledText(
+            results_frame,
+            height=10,
+            font=('Consolas', 9)
+        )
+        self.log_text.pack(fill='x', pady=(0, 10))
+        
+        # Wyniki scrapowania: lista artykułów + treść zaznaczonego artykułu
+        results_pane = ttk.PanedWindow(results_frame, orient='vertical')
+        results_pane.pack(fill='both', expand=True)
+        
+        list_frame = ttk.Frame(results_pane)
+        results_pane.add(list_frame, weight=1)
+        
+        columns = ('nr', 'title', 'domain', 'words', 'date')
+        self.results_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=8)
+        for column, heading, width, stretch in (
+            ('nr', "#", 40, False),
+            ('title', "Tytuł", 420, True),
+            ('domain', "Domena", 180, False),
+            ('words', "Słowa", 70, False),
+            ('date', "Data publikacji", 150, False)
+        ):
+            self.results_tree.heading(column, text=heading)
+            self.results_tree.column(column, width=width, stretch=stretch)
+        tree_scroll = ttk.Scrollbar(list_frame, orient='vertical', command=self.results_tree.yview)
+        self.results_tree.configure(yscrollcommand=tree_scroll.set)
+        self.results_tree.bind('<<TreeviewSelect>>', self.show_selected_article)
+        
+        page_frame = ttk.Frame(list_frame)
+        page_frame.pack(side='bottom', fill='x')
+        ttk.Button(page_frame, text="< Poprzednia", command=lambda: self.show_results_page(self.results_page - 1)).pack(side='left')
+        ttk.Label(page_frame, textvariable=self.page_var, style='Info.TLabel').pack(side='left', padx=10)
+        ttk.Button(page_frame, text="Następna >", command=lambda: self.show_results_page(self.results_page + 1)).pack(side='left')
+        
+        tree_scroll.pack(side='right', fill='y')
+        self.results_tree.pack(fill='both', expand=True)
+        
+        detail_frame = ttk.Frame(results_pane)
+        results_pane.add(detail_frame, weight=2)
+        
+        self.scraping_text = scrolledtext.ScrolledText(
+            detail_frame,
+            height=14,
+            font=('Segoe UI', 10)
+        )
+        self.scraping_text.pack(fill='both', expand=True)
+
+        # Dodajemy zakładkę dla raportu AI
+        self.ai_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(self.ai_frame, text="Raport AI")
+        
+        # Postęp generowania raportu w tle
+        ttk.Label(
+            self.ai_frame,
+            textvariable=self.ai_status_var,
+            style='Info.TLabel'
+        ).pack(fill='x', pady=(0, 5))
+        
+        # Dodajemy pole tekstowe dla raportu AI
+        self.ai_text = scrolledtext.ScrolledText(
+            self.ai_frame,
+            height=30,
+            font=('Segoe UI', 10),
+            wrap=tk.WORD
+        )
+        self.ai_text.pack(fill='both', expand=True)
+        
+        # Zakładka archiwum - wyszukiwanie w artykułach z poprzednich uruchomień
+        archive_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(archive_frame, text="Archiwum")
+        
+        archive_search_frame = ttk.Frame(archive_frame)
+        archive_search_frame.pack(fill='x', pady=(0, 10))
+        
+        archive_entry = ttk.Entry(
+            archive_search_frame,
+            textvariable=self.archive_query_var,
+            width=50
+        )
+        archive_entry.pack(side='left', fill='x', expand=True)
+        archive_entry.bind('<Return>', lambda event: self.search_archive())
+        
+        ttk.Button(
+            archive_search_frame,
+            text="Szukaj w archiwum",
+            command=self.search_archive
+        ).pack(side='left', padx=5)
+        
+        self.archive_text = scrolledtext.ScrolledText(
+            archive_frame,
+            height=30,
+            font=('Segoe UI', 10),
+            wrap=tk.WORD
+        )
+        self.archive_text.pack(fill='both', expand=True)
+        
+        # Zakładka statystyk pobrań (wspólny klient HTTP, cała sesja)
+        stats_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(stats_frame, text="Statystyki")
+        
+        stats_buttons = ttk.Frame(stats_frame)
+        stats_buttons.pack(fill='x', pady=(0, 10))
+        ttk.Button(stats_buttons, text="Odśwież", command=self.refresh_statistics).pack(side='left')
+        ttk.Button(stats_buttons, text="Eksportuj CSV", command=self.export_statistics).pack(side='left', padx=5)
+        
+        stats_columns = (
+            ('domain', "Domena", 180),
+            ('ok', "Udane", 60),
+            ('failed', "Nieudane", 70),
+            ('cached', "Z cache", 60),
+            ('kb', "KB", 70),
+            ('connect', "connect p50/p95/p99 ms", 150),
+            ('ttfb', "TTFB p50/p95/p99 ms", 150),
+            ('total', "total p50/p95/p99 ms", 150),
+            ('errors', "Błędy", 220)
+        )
+        self.stats_tree = ttk.Treeview(stats_frame, columns=[c[0] for c in stats_columns], show='headings')
+        for column, heading, width in stats_columns:
+            self.stats_tree.heading(column, text=heading)
+            self.stats_tree.column(column, width=width, stretch=column in ('domain', 'errors'))
+        self.stats_tree.pack(fill='both', expand=True)
+
+        # Dodaj po utworzeniu search_frame:
+        search_mode_frame = ttk.Frame(search_frame)
+        search_mode_frame.pack(fill='x', pady=(0, 10))
+
+        ttk.Radiobutton(
+            search_mode_frame,
+            text="Predefiniowany temat",
+            variable=self.search_mode,
+            value="preset"
+        ).pack(side='left', padx=(0, 10))
+
+        ttk.Radiobutton(
+            search_mode_frame,
+            text="Własne zapytanie",
+            variable=self.search_mode,
+            value="custom"
+        ).pack(side='left')
+
+    def start_job(self, handler):
+        """Rejestruje zadanie w tle. Zwraca id, z którym wątek roboczy wysyła komunikaty."""
+        self._job_counter += 1
+        self.jobs[self._job_counter] = handler
+        self.wake_dispatcher()
+        return self._job_counter
+
+    def post(self, job_id, msg_type, data=None):
+        """Wysyła komunikat z wątku roboczego do wątku Tk"""
+        self.queue.put((job_id, msg_type, data))
+
+    def wake_dispatcher(self):
+        """Przywraca częste odświeżanie (np. po uruchomieniu zadania)"""
+        self._dispatch_delay = self.CONFIG['QUEUE_CHECK_INTERVAL']
+        if self._dispatch_after is not None:
+            self.root.after_cancel(self._dispatch_after)
+        self._dispatch_after = self.root.after(self._dispatch_delay, self.dispatch_queue)
+
+    def dispatch_queue(self):
+        """Rozdziela wszystkie oczekujące komunikaty do zadań, które je wysłały.
+
+        Serie komunikatów są łączone (_coalesce), a komunikaty zakończonych
+        lub nieznanych zadań pomijane. W bezczynności odstęp między
+        odświeżeniami rośnie dwukrotnie aż do QUEUE_IDLE_INTERVAL.
+        """
+        messages = []
+        while len(messages) < self.CONFIG['QUEUE_BATCH_LIMIT']:
+            try:
+                messages.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        for job_id, msg_type, data in self._coalesce(messages):
+            handler = self.jobs.get(job_id)
+            if handler is None:
+                continue
+            try:
+                if handler(msg_type, data):
+                    del self.jobs[job_id]
+            except Exception as e:
+                self.log_message(f"Błąd obsługi komunikatu '{msg_type}': {str(e)}", 'ERROR')
+        
+        if messages:
+            self._dispatch_delay = self.CONFIG['QUEUE_CHECK_INTERVAL']
+        else:
+            self._dispatch_delay = min(self._dispatch_delay * 2, self.CONFIG['QUEUE_IDLE_INTERVAL'])
+        self._dispatch_after = self.root.after(self._dispatch_delay, self.dispatch_queue)
+
+    @staticmethod
+    def _coalesce(messages):
+        """Łączy kolejne komunikaty tego samego zadania i typu.
+
+        'token' - teksty są sklejane, 'article' - dane trafiają do jednej
+        listy, 'progress' - zostaje ostatni. Pozostałe typy bez zmian.
+        """
+        coalesced = []
+        for job_id, msg_type, data in messages:
+            previous = coalesced[-1] if coalesced else None
+            mergeable = previous is not None and previous[0] == job_id and previous[1] == msg_type
+            if msg_type in ('token', 'article'):
+                if mergeable:
+                    previous[2].append(data)
+                else:
+                    coalesced.append([job_id, msg_type, [data]])
+            elif msg_type == 'progress' and mergeable:
+                previous[2] = data
+            else:
+                coalesced.append([job_id, msg_type, data])
+        
+        for message in coalesced:
+            if message[1] == 'token':
+                message[2] = "".join(message[2])
+        return coalesced
+
+    def start_scraping(self):
+        try:
+            if not self.validate_input():
+                self.log_message("Nieprawidłowe dane wejściowe", 'ERROR')
+                return
+                
+            # Czyszczenie poprzednich wyników
+            self.log_message("Czyszczenie poprzednich wyników...", 'PROCESS')
+            self.clear_results_view()
+            # Raport AI generowany w tle dopisuje się dalej - nie czyścimy go w trakcie
+            if self.ai_job is None:
+                self.ai_text.delete(1.0, tk.END)
+            
+            # Wybór zapytania na podstawie trybu
+            if self.search_mode.get() == "custom":
+                query = self.custom_search_var.get().strip()
+                if not query:
+                    self.log_message("Wprowadź własne zapytanie", 'WARNING')
+                    return
+            else:
+                selected_topic = self.topic_var.get()
+                if not selected_topic:
+                    self.log_message("Wybierz predefiniowany temat", 'WARNING')
+                    return
+                query = None
+            
+            if query:
+                self.log_message(f"Rozpoczynam proces OSINT dla zapytania: {query}", 'PROCESS')
+            else:
+                self.log_message(f"Rozpoczynam proces OSINT dla tematu: {selected_topic}", 'PROCESS')
+            num_articles = int(self.articles_var.get())
+            force_refresh = self.force_refresh_var.get()
+            
+            self.log_message(f"Liczba artykułów do pobrania: {num_articles}", 'INFO')
+            self.status_var.set("Scrapowanie w toku...")
+            self.progress_var.set("")
+            results_key = self._results_key()
+            
+            # Nagłówek od razu - artykuły będą dopisywane do listy w miarę pobierania
+            self.scraping_text.insert(tk.END, self._results_header())
+            self.streamed_count = 0
+            
+            def handle_message(msg_type, data):
+                # Wyniki porzuconego scrapowania trafiają tylko do results_cache
+                current = self.scrape_job == job_id
+                if msg_type == "article":
+                    if current:
+                        self.display_articles(data)
+                    return False
+                
+                self.refresh_statistics()
+                if msg_type == "results":
+                    self.results_cache[results_key] = data
+                    if current:
+                        self.log_message(f"Znaleziono {len(data)} wyników", 'SUCCESS')
+                        # Lista w kolejności rankingu i po usunięciu duplikatów
+                        self.display_results(data)
+                        self.status_var.set("Scrapowanie zakończone")
+                elif msg_type == "error":
+                    self.log_message(f"Błąd podczas scrapowania: {data}", 'ERROR')
+                    if current:
+                        self.status_var.set(f"Błąd: {data}")
+                return True
+            
+            job_id = self.start_job(handle_message)
+            self.scrape_job = job_id
+            
+            def stream_article(index, total, result):
+                self.post(job_id, "article", (index, total, result))
+            
+            def scrape_thread():
+                with get_tracer().run(job_id=job_id) as self.last_run_id:
+                    run_scrape()
+            
+            def run_scrape():
+                try:
+                    scraper = GoogleScraper()
+                    self.log_message("Inicjalizacja scrapera...", 'INFO')
+                    self.log_message("Łączenie z API SerpApi...", 'INFO')
+                    if query:
+                        results = scraper.scrape(
+                            query, num_results=num_articles, force_refresh=force_refresh,
+                            on_result=stream_article
+                        )
+                    else:
+                        results = self.perform_search(
+                            selected_topic, num_articles, force_refresh=force_refresh,
+                            scraper=scraper, on_result=stream_article
+                        )
+                    
+                    if results:
+                        self.log_message(f"Pobrano {len(results)} artykułów pomyślnie", 'SUCCESS')
+                    else:
+                        self.log_message("Nie znaleziono żadnych wyników", 'WARNING')
+                    self.post(job_id, "results", results)
+                        
+                except Exception as e:
+                    error_msg = str(e)
+                    self.post(job_id, "error", error_msg)
+            
+            # Uruchom scrapowanie w osobnym wątku
+            self.log_message("Uruchamiam wątek scrapowania...", 'INFO')
+            threading.Thread(target=scrape_thread, daemon=True).start()
+            
+        except Exception as e:
+            error_msg = str(e)
+            self.log_message(f"Błąd podczas inicjalizacji scrapowania: {error_msg}", 'ERROR')
+            self.status_var.set("Błąd podczas scrapowania")
+
+    def validate_input(self):
+        try:
+            num_articles = int(self.articles_var.get())
+            if num_articles < 1 or num_articles > 10:
+                self.log_message("Liczba artykułów musi być między 1 a 10", 'WARNING')
+                return False
+                
+            # Sprawdzanie odpowiedniego pola w zależności od trybu
+            if self.search_mode.get() == "custom":
+                if not self.custom_search_var.get().strip():
+                    self.log_message("Wprowadź własne zapytanie", 'WARNING')
+                    return False
+            else:
+                if not self.topic_var.get():
+                    self.log_message("Wybierz predefiniowany temat", 'WARNING')
+                    return False
+                
+            return True
+        except ValueError:
+            self.log_message("Nieprawidłowa wartość liczby artykułów", 'ERROR')
+            return False
+
+    def clear_results_view(self):
+        self.displayed_results = []
+        self.results_page = 0
+        self.results_tree.delete(*self.results_tree.get_children())
+        self.page_var.set("")
+        self.scraping_text.delete(1.0, tk.END)
+
+    def display_results(self, results):
+        """Wyświetla listę wyników; pełna treść artykułu dopiero po zaznaczeniu"""
+        try:
+            self.clear_results_view()
+            self.scraping_text.insert(tk.END, self._results_header())
+            
+            if not results:
+                self.scraping_text.insert(tk.END, "Nie znaleziono wyników\n")
+                self.log_message("Brak wyników do wyświetlenia", 'WARNING')
+                return
+            
+            self.displayed_results = list(results)
+            self.show_results_page(0)
+            self.scraping_text.insert(tk.END, "Wybierz artykuł z listy, aby zobaczyć jego treść\n")
+            
+        except Exception as e:
+            error_msg = f"Błąd podczas wyświetlania wyników: {str(e)}"
+            self.log_message(error_msg, 'ERROR')
+            self.scraping_text.insert(tk.END, f"\nBŁĄD: {error_msg}\n")
+
+    def show_results_page(self, page):
+        """Wstawia do listy tylko wiersze jednej strony wyników"""
+        page_size = self.CONFIG['RESULTS_PAGE_SIZE']
+        pages = max(1, -(-len(self.displayed_results) // page_size))
+        self.results_page = min(max(page, 0), pages - 1)
+        
+        self.results_tree.delete(*self.results_tree.get_children())
+        start = self.results_page * page_size
+        for index, result in enumerate(self.displayed_results[start:start + page_size], start):
+            metadata = result.get('metadata', {})
+            self.results_tree.insert('', 'end', iid=str(index), values=(
+                index + 1,
+                result.get('title') or metadata.get('title') or 'Brak tytułu',
+                _domena(result.get('link', '')),
+                metadata.get('word_count', 0),
+                metadata.get('date') or ''
+            ))
+        self.page_var.set(
+            f"Strona {self.results_page + 1}/{pages} ({len(self.displayed_results)} artykułów)"
+        )
+
+    def show_selected_article(self, event=None):
+        """Wczytuje do panelu treść zaznaczonego artykułu"""
+        selection = self.results_tree.selection()
+        if not selection:
+            return
+        index = int(selection[0])
+        self.scraping_text.delete(1.0, tk.END)
+        self.scraping_text.insert(tk.END, self._format_article(index + 1, self.displayed_results[index]))
+
+    def refresh_statistics(self):
+        """Odświeża tabelę statystyk pobrań per domena"""
+        self.stats_tree.delete(*self.stats_tree.get_children())
+        for domain, stats in get_http_client().stats.podsumowanie().items():
+            self.stats_tree.insert('', 'end', values=(
+                domain,
+                stats['udane'],
+                stats['nieudane'],
+                stats['z_cache'],
+                f"{stats['bajty'] / 1024:.0f}",
+                *("/".join(_ms(stats[f'{metryka}_p{p}']) for p in FetchStatistics.PERCENTILES)
+                  for metryka in FetchStatistics.METRICS),
+                _opis_bledow(stats['bledy'])
+            ))
+
+    def show_trace_summary(self):
+        """Wypisuje w logach czasy etapów ostatniego scrapowania i całej sesji"""
+        tracer = get_tracer()
+        if self.last_run_id:
+            self.log_message(f"Etapy przebiegu {self.last_run_id}:\n" + tracer.summary_table(self.last_run_id), 'INFO')
+        self.log_message("Etapy (cała sesja):\n" + tracer.summary_table(), 'INFO')
+
+    def export_trace(self):
+        """Zapisuje spany sesji jako Chrome trace (oraz profile etapów) w katalogu roboczym"""
+        try:
+            file_name = f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            for path in zapisz_trace(file_name):
+                self.log_message(f"Zapisano {path}", 'SUCCESS')
+        except Exception as e:
+            self.log_message(f"Błąd eksportu trace: {str(e)}", 'ERROR')
+
+    def export_statistics(self):
+        """Zapisuje statystyki pobrań sesji do CSV w katalogu roboczym"""
+        try:
+            file_name = f"statystyki_scrapingu_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            zapisz_statystyki(get_http_client().stats.podsumowanie(), file_name)
+            self.log_message(f"Statystyki zapisane do {file_name}", 'SUCCESS')
+        except Exception as e:
+            self.log_message(f"Błąd zapisu statystyk: {str(e)}", 'ERROR')
+
+    def _results_key(self):
+        """Klucz results_cache: własne zapytanie albo nazwa tematu"""
+        if self.search_mode.get() == "custom":
+            return self.custom_search_var.get().strip()
+        return self.topic_var.get()
+
+    def search_archive(self):
+        """Wyszukiwanie pełnotekstowe w archiwum artykułów ze wszystkich uruchomień"""
+        fraza = self.archive_query_var.get().strip()
+        self.archive_text.delete(1.0, tk.END)
+        if not fraza:
+            return
+        try:
+            wyniki = get_article_store().szukaj(fraza, limit=50)
+        except Exception as e:
+            self.log_message(f"Błąd wyszukiwania w archiwum: {str(e)}", 'ERROR')
+            return
+        
+        if not wyniki:
+            self.archive_text.insert(tk.END, "Brak wyników w archiwum\n")
+            return
+        self.archive_text.insert(tk.END, "".join(
+            f"{w['tytul'] or 'Brak tytułu'}\n{w['url']}\n"
+            f"Pobrano: {datetime.fromtimestamp(w['pobrano']).strftime('%Y-%m-%d %H:%M')}\n"
+            f"{w['fragment']}\n{'-' * 80}\n"
+            for w in wyniki
+        ))
+
+    def display_articles(self, articles):
+        """Dopisuje do listy artykuły pobrane od ostatniego odświeżenia.
+
+        articles to lista (indeks, liczba_wszystkich, wynik) w kolejności
+        ukończenia pobierania; kolejność rankingu przywraca display_results.
+        """
+        self.streamed_count += len(articles)
+        self.progress_var.set(f"Pobrano {self.streamed_count}/{articles[-1][1]} artykułów")
+        self.displayed_results.extend(result for index, total, result in articles)
+        # Odśwież tylko niepełną stronę - zaznaczenie na pełnych stronach zostaje
+        if len(self.results_tree.get_children()) < self.CONFIG['RESULTS_PAGE_SIZE']:
+            self.show_results_page(self.results_page)
+
+    def _results_header(self):
+        """Nagłówek widoku wyników dla bieżącego tematu lub zapytania"""
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Pobierz aktualny temat lub własne zapytanie
+        if self.search_mode.get() == "custom":
+            current_query = self.custom_search_var.get().strip()
+            header = f"Szczegółowy Raport OSINT - Własne zapytanie: {current_query}\n"
+        else:
+            current_topic = self.topic_var.get()
+            header = f"Szczegółowy Raport OSINT - {current_topic}\n"
+        
+        header += f"Data wygenerowania: {current_time}\n"
+        header += "=" * 100 + "\n\n"
+        return header
+
+    @staticmethod
+    def _format_mirrors(result):
+        if not result.get('mirrors'):
+            return ""
+        return "Kopie: " + ", ".join(result['mirrors']) + "\n\n"
+
+    @staticmethod
+    def _format_article(i, result):
+        return f"""ARTYKUŁ #{i}
+{'=' * 50}
+Tytuł: {result.get('title', 'Brak tytułu')}
+Link: {result.get('link', 'Brak linku')}\n{OSINTUI._format_mirrors(result)}
+STRESZCZENIE Z WYSZUKIWARKI:
+{result.get('snippet', 'Brak streszczenia')}\n
+PEŁNA TREŚĆ:
+{result.get('content', 'Brak treści')}\n
+{'=' * 100}\n\n"""
+
+    def log_message(self, message, level='INFO'):
+        """Wrapper dla loggera"""
+        if hasattr(self, 'logger'):
+            self.logger.log(message, level)
+        else:
+            print(f"[{level}] {message}")
+            
+    def generate_ai_report(self):
+        """Uruchamia generowanie raportu AI w tle - okno pozostaje responsywne"""
+        if self.ai_job is not None:
+            self.log_message("Raport AI jest już generowany", 'WARNING')
+            return
+        try:
+            if not self.openai_client:
+                self.log_message("Klient OpenAI nie jest zainicjalizowany. Sprawdź klucz API.", 'ERROR')
+                return
+                
+            self.log_message("Inicjalizacja generowania raportu AI...", 'PROCESS')
+            
+            system_prompt = getattr(self, 'current_template', self.default_template)
+            template_name = getattr(self, 'current_template_name', 'Domyślny szablon')
+            self.log_message(f"Używam szablonu: {template_name}", 'INFO')
+            
+            # Rekordy z ostatniego wyszukiwania (albo z listy wyników)
+            results = self.results_cache.get(self._results_key()) or self.displayed_results
+            if not results:
+                self.log_message("Brak wyników do analizy - najpierw uruchom scrapowanie", 'WARNING')
+                return
+            scraped_content = teksty_artykulow(results)
+            
+            client = self.openai_client
+            budgets = self.CONFIG['AI_BUDGETS']
+            use_cache = not self.force_ai_refresh_var.get()
+            cancel_event = threading.Event()
+            
+            def report_thread():
+                tracer = get_tracer()
+                with tracer.run(job_id=job_id), tracer.span('ai_report', template=template_name):
+                    run_report()
+            
+            def run_report():
+                metrics = {}
+                try:
+                    report = generuj_raport_ai(
+                        client, system_prompt, scraped_content,
+                        budzety=budgets,
+                        on_progress=lambda message: self.post(job_id, "progress", message),
+                        use_cache=use_cache,
+                        cancel_event=cancel_event,
+                        on_token=lambda text: self.post(job_id, "token", text),
+                        metryki=metrics
+                    )
+                    self.post(job_id, "report", (report, metrics))
+                except ReportCancelled:
+                    self.post(job_id, "cancelled")
+                except Exception as e:
+                    self.post(job_id, "error", str(e))
+            
+            self.ai_job = cancel_event
+            self.ai_text.delete(1.0, tk.END)
+            self.ai_status_var.set("Generowanie raportu AI...")
+            self.cancel_ai_button.config(state='normal')
+            job_id = self.start_job(self.handle_ai_message)
+            threading.Thread(target=report_thread, daemon=True).start()
+                
+        except Exception as e:
+            error_msg = str(e)
+            self.log_message(f"Błąd podczas generowania raportu: {error_msg}", 'ERROR')
+            self.ai_status_var.set(f"Błąd generowania raportu AI: {error_msg}")
+
+    def cancel_ai_report(self):
+        """Anuluje raport AI przed kolejnym wywołaniem modelu"""
+        if self.ai_job is not None:
+            self.ai_job.set()
+            self.ai_status_var.set("Anulowanie raportu AI...")
+            self.log_message("Anulowanie raportu AI...", 'WARNING')
+
+    def handle_ai_message(self, msg_type, data):
+        """Obsługa komunikatów zadania raportu AI (wątek Tk)"""
+        if msg_type == "token":
+            # Tokeny z jednego odświeżenia przychodzą sklejone (_coalesce)
+            self.ai_text.insert(tk.END, data)
+            self.ai_text.see(tk.END)
+            return False
+        if msg_type == "progress":
+            self.ai_status_var.set(data)
+            self.log_message(data, 'PROCESS')
+            return False
+        
+        report, metrics = data if msg_type == "report" else (None, {})
+        if msg_type == "report" and report:
+            # Tekst przyszedł strumieniowo - podmień na pełną odpowiedź na wszelki wypadek
+            self.ai_text.delete(1.0, tk.END)
+            self.ai_text.insert(tk.END, report)
+            self.ai_status_var.set("Raport AI gotowy" + self._format_ai_metrics(metrics))
+            self.log_message("Raport AI wygenerowany pomyślnie" + self._format_ai_metrics(metrics), 'SUCCESS')
+        elif msg_type == "report":
+            self.ai_status_var.set("Nie udało się wygenerować raportu")
+            self.log_message("Nie udało się wygenerować raportu", 'ERROR')
+        elif msg_type == "cancelled":
+            self.ai_status_var.set("Raport AI anulowany")
+            self.log_message("Raport AI anulowany", 'WARNING')
+        elif msg_type == "error":
+            self.ai_status_var.set(f"Błąd generowania raportu AI: {data}")
+            self.log_message(f"Błąd podczas generowania raportu: {data}", 'ERROR')
+        self.ai_job = None
+        self.cancel_ai_button.config(state='disabled')
+        return True
+
+    @staticmethod
+    def _format_ai_metrics(metrics):
+        if not metrics:
+            return ""
+        if metrics.get('z_cache'):
+            return " (z cache)"
+        return (f" (pierwszy token po {metrics['ttft']:.1f} s, "
+                f"{metrics['tokeny_na_s']:.1f} tokenów/s, łącznie {metrics['czas']:.1f} s)")
+
+    def display_report(self, report_content):
+        """Wyświetla wygenerowany raport AI"""
+        self.ai_text.delete(1.0, tk.END)
+        self.ai_text.insert(tk.END, report_content)
+        self.notebook.select(self.ai_frame)
+
+    def update_topic_description(self, event=None):
+        """Aktualizuje opis wybranego tematu"""
+        selected = self.topic_var.get()
+        if selected in self.OSINT_TOPICS:
+            self.topic_description.config(
+                text=f"Zapytania: {', '.join(self.OSINT_TOPICS[selected]['queries'])}"
+            )
+
+    def save_report(self):
+        """Zapisuje raport do pliku"""
+        # Implementacja zapisu raportu
+        pass
+
+    def export_logs(self):
+        """Eksportuje logi do pliku"""
+        # Implementacja eksportu logów
+        pass
+
+    def show_settings(self):
+        """Pokazuje okno ustawień"""
+        # Implementacja okna ustawień
+        pass
+
+    def test_api_connection(self):
+        """Testuje połączenie z API"""
+        # Implementacja testu API
+        pass
+
+    def show_docs(self):
+        """Pokazuje dokumentację"""
+        # Implementacja wyświetlania dokumentacji
+        pass
+
+    def show_about(self):
+        """Pokazuje informacje o programie"""
+        # Implementacja okna "O programie"
+        pass
+
+    def toggle_search_mode(self, event=None):
+        """Przełącza tryb wyszukiwania"""
+        mode = self.search_mode.get()
+        
+        # Znajdź widget Entry w interfejsie
+        entry_widget = None
+        for widget in self.root.winfo_children():
+            if isinstance(widget, ttk.Entry):
+                entry_widget = widget
+                break
+            
+        if mode == "preset":
+            self.topic_combo.config(state='readonly')
+            if entry_widget:
+                entry_widget.config(state='disabled')
+        else:
+            self.topic_combo.config(state='disabled')
+            if entry_widget:
+                entry_widget.config(state='normal')
+
+    def show_template_window(self):
+        template_window = ReportTemplateWindow(self.root)
+        template_window.callback = self.apply_template
+        
+    def apply_template(self, template_content, template_name):
+        """Aplikuje wybrany szablon"""
+        self.current_template = template_content
+        self.current_template_name = template_name
+        self.log_message(f"Aktywowano szablon: {template_name}", 'SUCCESS')
+
+    def save_custom_instructions(self):
+        custom_text = self.template_editor.get("1.0", tk.END).strip()
+        if custom_text:
+            self.templates["Własny szablon"]["prompt"] = custom_text
+            messagebox.showinfo(
+                "Sukces",
+                "Własne instrukcje zostały zapisane jako szablon"
+            )
+            # Aktualizuj podgląd
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(tk.END, custom_text)
+        else:
+            messagebox.showwarning(
+                "Pusty szablon",
+                "Proszę wprowadzić treść własnych instrukcji"
+            )
+
+    def use_template(self):
+        selected = self.template_var.get()
+        if selected == "Własny szablon":
+            custom_text = self.template_editor.get("1.0", tk.END).strip()
+            if not custom_text or custom_text == "Wprowadź własne instrukcje dla AI...":
+                messagebox.showwarning(
+                    "Pusty szablon",
+                    "Proszę wprowadzić własne instrukcje przed zatwierdzeniem"
+                )
+                return
+            template_content = custom_text
+        else:
+            template_content = self.templates[selected]["prompt"]
+        
+        # Przekaż szablon do głównego okna
+        self.callback(template_content, selected)
+        self.log_message(f"Załadowano szablon: {selected}", 'SUCCESS')
+        self.window.destroy()
+
+    def perform_search(self, topic, num_results=3, force_refresh=False, scraper=None, on_result=None):
+        """Wykonuje wyszukiwanie OSINT dla wybranego tematu"""
+        scraper = scraper or GoogleScraper()
+        if topic in self.OSINT_TOPICS:
+            queries = self.OSINT_TOPICS[topic]["queries"]
+            for query in queries:
+                self.log_message(f"Wyszukiwanie: {query}", 'INFO')
+            
+            # Zapytania idą równolegle, wyniki są łączone i deduplikowane
+            return scraper.scrape_topic(
+                queries, num_results=num_results, force_refresh=force_refresh, on_result=on_result
+            )
+        else:
+            return scraper.scrape(
+                topic, num_results=num_results, force_refresh=force_refresh, on_result=on_result
+            )
+
+class Logger:
+    """Panel logów UI.
+
+    log() można wołać z dowolnego wątku - wpis trafia do ograniczonego bufora
+    i do modułu logging (plik). Wątek Tk co interval ms wstawia zebrane wpisy
+    jednym wywołaniem, a panel przechowuje najwyżej max_lines ostatnich linii.
+    """
+
+    # Poziomy panelu odwzorowane na poziomy modułu logging
+    LOGGING_LEVELS = {
+        'SUCCESS': logging.INFO,
+        'PROCESS': logging.INFO,
+        'WARNING': logging.WARNING,
+        'ERROR': logging.ERROR
+    }
+
+    def __init__(self, text_widget, max_lines=2000, interval=100):
+        self.text_widget = text_widget
+        self.colors = {
+            'INFO': '#0066cc',      # Niebieski
+            'SUCCESS': '#00cc66',   # Zielony
+            'WARNING': '#ff9900',   # Pomarańczowy
+            'ERROR': '#cc0000',     # Czerwony
+            'PROCESS': '#6600cc'    # Fioletowy
+        }
+        for level, color in self.colors.items():
+            self.text_widget.tag_config(level, foreground=color)
+        self.max_lines = max_lines
+        self.interval = interval
+        # Bufor cykliczny - przy zablokowanym UI najstarsze wpisy są odrzucane
+        self.pending = deque(maxlen=max_lines)
+        self.file_logger = logging.getLogger('osint.ui')
+        self.text_widget.after(self.interval, self.flush)
+
+    def log(self, message, level='INFO'):
+        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+        icon = {
+            'INFO': '🔵',
+            'SUCCESS': '✅',
+            'WARNING': '⚠️',
+            'ERROR': '❌',
+            'PROCESS': '⚙️'
+        }.get(level, '📝')
+        
+        self.pending.append((f"[{timestamp}] {icon} {message}\n", level))
+        self.file_logger.log(self.LOGGING_LEVELS.get(level, logging.INFO), message)
+
+    def flush(self):
+        """Wstawia zebrane wpisy do panelu (wątek Tk)"""
+        batch = []
+        while self.pending:
+            batch.append(self.pending.popleft())
+        
+        if batch:
+            # insert(indeks, tekst, tagi, tekst, tagi, ...) - jedna operacja na partię
+            args = [item for line, level in batch for item in (line, level)]
+            self.text_widget.insert(tk.END, *args)
+            excess = int(self.text_widget.index('end-1c').split('.')[0]) - 1 - self.max_lines
+            if excess > 0:
+                self.text_widget.delete('1.0', f'{excess + 1}.0')
+            self.text_widget.see(tk.END)
+        
+        self.text_widget.after(self.interval, self.flush)
+
+class ReportTemplateWindow:
+    def __init__(self, parent):
+        self.window = tk.Toplevel(parent)
+        self.window.title("Szablony Raportów OSINT")
+        # Zwiększamy rozmiar okna z 800x600 na 1000x800
+        self.window.geometry("1000x800")
+        
+        # Dodajemy minimalny rozmiar okna, żeby nie można było go za bardzo zmniejszyć
+        self.window.minsize(900, 700)
+        
+        # Opcjonalnie: wyśrodkowanie okna na ekranie
+        self.window.update_idletasks()
+        width = self.window.winfo_width()
+        height = self.window.winfo_height()
+        x = (self.window.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.window.winfo_screenheight() // 2) - (height // 2)
+        self.window.geometry(f'+{x}+{y}')
+        
+        # Ulepszone szablony OSINT
+        self.templates = {
+            "Własny szablon": {
+                "prompt": "Wprowadź własne instrukcje dla AI..."
+            },
+            "Analiza Biznesowa OSINT": {
+                "prompt": """Jesteś ekspertem OSINT (Open Source Intelligence) specjalizującym się w analizie biznesowej. 
+Przeanalizuj dostarczone dane i stwórz szczegółowy raport zawierający:
+
+1. PODSUMOWANIE WYKONAWCZE
+   - Kluczowe ustalenia i wnioski
+   - Najważniejsze trendy i wzorce
+   - Krytyczne informacje biznesowe
+
+2. ANALIZA PODMIOTU
+   - Struktura organizacyjna i własność
+   - Historia i rozwój
+   - Kluczowe osoby (zarząd, kierownictwo)
+   - Lokalizacje i zasięg działania
+
+3. ANALIZA RYNKOWA
+   - Pozycja rynkowa i udział w rynku
+   - Główni konkurenci i ich działania
+   - Przewagi konkurencyjne
+   - Trendy rynkowe wpływające na podmiot
+
+4. ANALIZA FINANSOWA
+   - Źródła finansowania
+   - Inwestycje i przejęcia
+   - Wskaźniki finansowe
+   - Potencjalne ryzyka finansowe
+
+5. RELACJE I POWIĄZANIA
+   - Kluczowi partnerzy biznesowi
+   - Powiązania kapitałowe
+   - Relacje z interesariuszami
+   - Sieci wpływów
+
+6. REPUTACJA I WIZERUNEK
+   - Obecność w mediach
+   - Opinie klientów i partnerów
+   - Kontrowersje i problemy wizerunkowe
+   - Działania CSR i PR
+
+7. ANALIZA RYZYK
+   - Ryzyka operacyjne
+   - Ryzyka prawne i regulacyjne
+   - Ryzyka reputacyjne
+   - Potencjalne zagrożenia
+
+8. REKOMENDACJE
+   - Kluczowe obszary wymagające uwagi
+   - Sugerowane działania
+   - Możliwości rozwoju
+   - Strategie minimalizacji ryzyk
+
+Użyj konkretnych danych i przykładów z dostarczonych materiałów. Zachowaj obiektywizm i profesjonalizm w analizie."""
+            },
+            "Analiza Technologiczna OSINT": {
+                "prompt": """Jesteś ekspertem OSINT specjalizującym się w analizie technologicznej.
+Przeanalizuj dostarczone dane i stwórz szczegółowy raport technologiczny zawierający:
+
+1. PODSUMOWANIE TECHNICZNE
+   - Główne odkrycia technologiczne
+   - Kluczowe technologie i rozwiązania
+   - Krytyczne aspekty techniczne
+
+2. INFRASTRUKTURA TECHNICZNA
+   - Architektura systemów
+   - Używane technologie i narzędzia
+   - Infrastruktura sieciowa
+   - Centra danych i hostingi
+
+3. ROZWÓJ TECHNOLOGICZNY
+   - Roadmapa technologiczna
+   - Innowacje i patenty
+   - Projekty R&D
+   - Kierunki rozwoju technologicznego
+
+4. BEZPIECZEŃSTWO
+   - Polityki bezpieczeństwa
+   - Certyfikacje i zgodność
+   - Potencjalne luki i zagrożenia
+   - Incydenty bezpieczeństwa
+
+5. ZESPÓŁ TECHNICZNY
+   - Struktura zespołów
+   - Kluczowe kompetencje
+   - Rekrutacje i trendy zatrudnienia
+   - Współpraca z zewnętrznymi ekspertami
+
+6. ANALIZA KONKURENCYJNA
+   - Porównanie technologii konkurencji
+   - Przewagi technologiczne
+   - Luki technologiczne
+   - Trendy rynkowe
+
+7. RYZYKA TECHNOLOGICZNE
+   - Długoterminowa stabilność
+   - Skalowalność rozwiązań
+   - Zależności technologiczne
+   - Przestarzałe technologie
+
+8. REKOMENDACJE TECHNICZNE
+   - Sugerowane ulepszenia
+   - Priorytety rozwojowe
+   - Strategia modernizacji
+   - Plan minimalizacji ryzyk
+
+Wykorzystaj konkretne informacje z dostarczonych materiałów. Zachowaj techniczny profesjonalizm."""
+            },
+            "Analiza Zagrożeń OSINT": {
+                "prompt": """Jesteś ekspertem OSINT specjalizującym się w analizie zagrożeń i bezpieczeństwa.
+Przeanalizuj dostarczone dane i stwórz szczegółowy raport bezpieczeństwa zawierający:
+
+1. PODSUMOWANIE ZAGROŻEŃ
+   - Krytyczne zagrożenia
+   - Poziomy ryzyka
+   - Priorytety bezpieczeństwa
+
+2. ANALIZA ŚRODOWISKA ZAGROŻEŃ
+   - Aktualne zagrożenia
+   - Trendy w cyberbezpieczeństwie
+   - Geopolityczne czynniki ryzyka
+   - Zagrożenia sektorowe
+
+3. PODATNOŚCI I SŁABE PUNKTY
+   - Zidentyfikowane podatności
+   - Potencjalne wektory ataku
+   - Luki w zabezpieczeniach
+   - Słabości organizacyjne
+
+4. ANALIZA INCYDENTÓW
+   - Historia incydentów
+   - Wzorce ataków
+   - Skuteczność odpowiedzi
+   - Wyciągnięte wnioski
+
+5. OCENA ZABEZPIECZEŃ
+   - Istniejące kontrole
+   - Skuteczność zabezpieczeń
+   - Zgodność z regulacjami
+   - Luki w ochronie
+
+6. ANALIZA WPŁYWU
+   - Potencjalne skutki ataków
+   - Wpływ na działalność
+   - Straty finansowe
+   - Szkody reputacyjne
+
+7. PRZECIWDZIAŁANIE ZAGROŻENIOM
+   - Strategie obronne
+   - Plany reagowania
+   - Procedury bezpieczeństwa
+   - Szkolenia i świadomość
+
+8. REKOMENDACJE BEZPIECZEŃSTWA
+   - Priorytetowe działania
+   - Ulepszenia zabezpieczeń
+   - Plan wdrożenia
+   - Monitoring i ewaluacja
+
+Wykorzystaj konkretne przykłady z dostarczonych materiałów. Zachowaj profesjonalizm w analizie bezpieczeństwa."""
+            }
+        }
+        
+        # Zmienna do przechowywania wybranego szablonu
+        self.template_var = tk.StringVar(value="Własny szablon")
+        self.template_var.trace('w', lambda *args: self.update_preview())
+        
+        self.create_widgets()
+        
+    def create_widgets(self):
+        # Panel wyboru szablonu
+        template_frame = ttk.LabelFrame(self.window, text="Wybierz szablon raportu", padding=10)
+        template_frame.pack(fill='x', padx=10, pady=5)
+        
+        # Przyciski - przenosimy na górę
+        button_frame = ttk.Frame(self.window)
+        button_frame.pack(fill='x', padx=10, pady=5)
+        
+        ttk.Button(
+            button_frame,
+            text="Zatwierdź własny szablon",
+            command=self.save_and_use_template,
+            style='Action.TButton'
+        ).pack(side='right', padx=5)
+        
+        ttk.Button(
+            button_frame,
+            text="Anuluj",
+            command=self.window.destroy,
+            style='Secondary.TButton'
+        ).pack(side='right')
+        
+        # Dodanie variable do RadioButton
+        for template_name in self.templates.keys():
+            ttk.Radiobutton(
+                template_frame,
+                text=template_name,
+                value=template_name,
+                variable=self.template_var,
+                command=self.update_preview
+            ).pack(anchor='w', pady=2)
+            
+        # Panel podglądu
+        preview_frame = ttk.LabelFrame(self.window, text="Podgląd szablonu", padding=10)
+        preview_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        self.preview_text = scrolledtext.ScrolledText(
+            preview_frame,
+            wrap=tk.WORD,
+            font=('Segoe UI', 10)
+        )
+        self.preview_text.pack(fill='both', expand=True)
+        
+        # Panel edycji własnego szablonu
+        self.custom_template_frame = ttk.LabelFrame(self.window, text="Edycja własnego szablonu", padding=10)
+        self.custom_template_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        self.template_editor = scrolledtext.ScrolledText(
+            self.custom_template_frame,
+            wrap=tk.WORD,
+            font=('Segoe UI', 10),
+            height=10
+        )
+        self.template_editor.pack(fill='both', expand=True)
+
+    def update_preview(self):
+        selected = self.template_var.get()
+        if selected == "Własny szablon":
+            # Pokaż pole edycji
+            self.custom_template_frame.pack(fill='both', expand=True, padx=10, pady=5)
+            self.preview_text.delete(1.0, tk.END)
+            if "prompt" in self.templates["Własny szablon"] and self.templates["Własny szablon"]["prompt"] != "Wpisz własne instrukcje dla AI...":
+                self.preview_text.insert(tk.END, self.templates["Własny szablon"]["prompt"])
+                self.template_editor.delete(1.0, tk.END)
+                self.template_editor.insert(tk.END, self.templates["Własny szablon"]["prompt"])
+            else:
+                self.preview_text.insert(tk.END, "Wprowadź własny szablon poniżej i zatwierdź go...")
+        else:
+            # Ukryj pole edycji
+            self.custom_template_frame.pack_forget()
+            if selected in self.templates:
+                self.preview_text.delete(1.0, tk.END)
+                self.preview_text.insert(tk.END, self.templates[selected]["prompt"])
+
+    def save_and_use_template(self):
+        """Metoda łącząca zapisanie i użycie własnego szablonu"""
+        selected = self.template_var.get()
+        if selected == "Własny szablon":
+            custom_text = self.template_editor.get("1.0", tk.END).strip()
+            if custom_text:
+                self.templates["Własny szablon"]["prompt"] = custom_text
+                self.callback(custom_text, "Własny szablon")
+                self.window.destroy()
+            else:
+                messagebox.showwarning(
+                    "Pusty szablon",
+                    "Proszę wprowadzić treść własnego szablonu"
+                )
+        else:
+            self.callback(self.templates[selected]["prompt"], selected)
+            self.window.destroy()
+
+def _nazwa_pliku(tekst):
+    """Zamienia nazwę tematu na bezpieczną nazwę pliku"""
+    return re.sub(r'[^\w-]+', '_', tekst, flags=re.UNICODE).strip('_').lower() or 'temat'
+
+def zapisz_json(temat, zapytania, wyniki, raport_ai, nazwa_pliku):
+    with open(nazwa_pliku, 'w', encoding='utf-8') as plik:
+        json.dump({
+            'temat': temat,
+            'zapytania': zapytania,
+            'data_wygenerowania': datetime.now().isoformat(timespec='seconds'),
+            'raport_ai': raport_ai,
+            'wyniki': wyniki
+        }, plik, ensure_ascii=False, indent=2)
+
+def zapisz_markdown(temat, zapytania, wyniki, raport_ai, nazwa_pliku):
+    with open(nazwa_pliku, 'w', encoding='utf-8') as plik:
+        plik.write(f"# Raport OSINT - {temat}\n\n")
+        plik.write(f"_Data wygenerowania: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}_\n\n")
+        plik.write("**Zapytania:** " + "; ".join(zapytania) + "\n\n")
+        
+        if raport_ai:
+            plik.write("## Raport AI\n\n")
+            plik.write(raport_ai.strip() + "\n\n")
+        
+        plik.write("## Artykuły\n\n")
+        for i, wynik in enumerate(wyniki, 1):
+            metadata = wynik.get('metadata', {})
+            plik.write(f"### {i}. [{wynik.get('title') or 'Brak tytułu'}]({wynik.get('link', '')})\n\n")
+            if metadata.get('date'):
+                plik.write(f"- Data publikacji: {metadata['date']}\n")
+            if metadata.get('author'):
+                plik.write(f"- Autor: {metadata['author']}\n")
+            if wynik.get('mirrors'):
+                plik.write("- Kopie: " + ", ".join(wynik['mirrors']) + "\n")
+            plik.write(f"- Liczba słów: {metadata.get('word_count', 0)}\n\n")
+            if wynik.get('snippet'):
+                plik.write(f"> {wynik['snippet']}\n\n")
+            plik.write((wynik.get('content') or "_Nie udało się pobrać treści artykułu._") + "\n\n")
+
+def uruchom_zadanie_wsadowe(sciezka_zadania, formaty=None, katalog=None, ai=None):
+    """Wykonuje zadanie z pliku JSON bez interfejsu graficznego.
+
+    Przykładowy plik zadania:
+        {
+            "katalog": "raporty",
+            "formaty": ["txt", "json", "md"],
+            "liczba_wynikow": 3,
+            "wymus_odswiezenie": false,
+            "ai": {"wlaczone": true, "model": "gpt-4", "szablon": "szablon.txt",
+                   "budzety": {"fragment": 3000, "raport": 2000}, "pomin_cache": false},
+            "tematy": ["AI Healthcare", {"nazwa": "Własny", "zapytania": ["..."]}]
+        }
+    Tematy podane samą nazwą są brane z OSINT_TOPICS. Argumenty funkcji
+    nadpisują ustawienia z pliku. Zwraca listę zapisanych plików.
+    """
+    with open(sciezka_zadania, encoding='utf-8') as f:
+        zadanie = json.load(f)
+    
+    formaty = formaty or zadanie.get('formaty', ['txt', 'json', 'md'])
+    katalog = katalog or zadanie.get('katalog', 'raporty')
+    ustawienia_ai = zadanie.get('ai', {})
+    ai = ustawienia_ai.get('wlaczone', False) if ai is None else ai
+    liczba_wynikow = zadanie.get('liczba_wynikow', 3)
+    wymus_odswiezenie = zadanie.get('wymus_odswiezenie', False)
+    os.makedirs(katalog, exist_ok=True)
+    
+    system_prompt = DOMYSLNY_SZABLON
+    szablon = ustawienia_ai.get('szablon')
+    if szablon:
+        if os.path.isfile(szablon):
+            with open(szablon, encoding='utf-8') as f:
+                system_prompt = f.read()
+        else:
+            system_prompt = szablon
+    klient_ai = utworz_klienta_openai() if ai else None
+    
+    # Statystyki w raporcie tematu dotyczą tylko jego pobrań, dlatego scraper
+    # powstaje dla każdego tematu; pula połączeń (get_http_client) jest wspólna
+    tracer = get_tracer()
+    zapisane = []
+    znacznik_czasu = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    for temat in zadanie.get('tematy', []):
+        if isinstance(temat, str):
+            nazwa = temat
+            if nazwa not in OSINT_TOPICS:
+                logging.error(f"Nieznany temat: {nazwa}")
+                continue
+            zapytania = OSINT_TOPICS[nazwa]["queries"]
+        else:
+            nazwa = temat.get('nazwa') or temat['zapytania'][0]
+            zapytania = temat['zapytania']
+        
+        logging.info(f"Temat: {nazwa} ({len(zapytania)} zapytań)")
+        scraper = GoogleScraper()
+        try:
+            if len(zapytania) == 1:
+                wyniki = scraper.scrape(zapytania[0], num_results=liczba_wynikow, force_refresh=wymus_odswiezenie)
+            else:
+                wyniki = scraper.scrape_topic(zapytania, num_results=liczba_wynikow, force_refresh=wymus_odswiezenie)
+        except Exception as e:
+            logging.error(f"Błąd podczas scrapowania tematu {nazwa}: {e}")
+            continue
+        
+        raport_ai = None
+        if klient_ai and wyniki:
+            try:
+                # Raport AI w tym samym przebiegu co scrapowanie tematu
+                with tracer.run(scraper.last_run_id), tracer.span('ai_report'):
+                    raport_ai = generuj_raport_ai(
+                        klient_ai, system_prompt, teksty_artykulow(wyniki),
+                        model=ustawienia_ai.get('model', 'gpt-4'),
+                        budzety=ustawienia_ai.get('budzety'),
+                        use_cache=not ustawienia_ai.get('pomin_cache', False)
+                    )
+            except Exception as e:
+                logging.error(f"Błąd generowania raportu AI dla {nazwa}: {e}")
+        logging.info(f"Etapy tematu {nazwa} (przebieg {scraper.last_run_id}):\n"
+                     + tracer.summary_table(scraper.last_run_id))
+        
+        baza = os.path.join(katalog, f"raport_{_nazwa_pliku(nazwa)}_{znacznik_czasu}")
+        if 'txt' in formaty:
+            zapisz_raport(wyniki, baza + '.txt', scraper.get_statistics(), temat=nazwa)
+            zapisane.append(baza + '.txt')
+        if 'json' in formaty:
+            zapisz_json(nazwa, zapytania, wyniki, raport_ai, baza + '.json')
+            zapisane.append(baza + '.json')
+        if 'md' in formaty:
+            zapisz_markdown(nazwa, zapytania, wyniki, raport_ai, baza + '.md')
+            zapisane.append(baza + '.md')
+        logging.info(f"Zapisano raport tematu {nazwa} ({len(wyniki)} artykułów)")
+    
+    # CSV zbiera pobrania wszystkich tematów (statystyki wspólnego klienta HTTP)
+    sciezka_statystyk = os.path.join(katalog, f"statystyki_scrapingu_{znacznik_czasu}.csv")
+    zapisz_statystyki(get_http_client().stats.podsumowanie(), sciezka_statystyk)
+    zapisane.append(sciezka_statystyk)
+    return zapisane
+
+def zapisz_trace(sciezka):
+    """Eksportuje spany jako Chrome trace; profile etapów (OSINT_PROFILE) obok, jako .prof"""
+    tracer = get_tracer()
+    tracer.export_chrome(sciezka)
+    zapisane = [sciezka]
+    for etap in sorted(tracer.profile_stages):
+        sciezka_profilu = f"{os.path.splitext(sciezka)[0]}.{etap}.prof"
+        if tracer.dump_profile(sciezka_profilu, etap):
+            zapisane.append(sciezka_profilu)
+    logging.info("Etapy (cała sesja):\n" + tracer.summary_table())
+    return zapisane
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OSINT Report Generator")
+    parser.add_argument('--batch', metavar='ZADANIE', help="plik JSON z zadaniem wsadowym (bez interfejsu graficznego)")
+    parser.add_argument('--format', help="formaty wyjściowe, np. json,md,txt (nadpisuje plik zadania)")
+    parser.add_argument('--katalog', help="katalog na raporty (nadpisuje plik zadania)")
+    parser.add_argument('--ai', action='store_true', default=None, help="generuj raport AI dla każdego tematu")
+    parser.add_argument('--szukaj', metavar='FRAZA', help="przeszukaj archiwum artykułów ze wszystkich uruchomień")
+    parser.add_argument('--trace', metavar='PLIK', help="zapisz spany etapów trybu wsadowego jako Chrome trace (JSON)")
+    args = parser.parse_args(argv)
+    skonfiguruj_logowanie()
+    
+    if args.szukaj:
+        for wynik in get_article_store().szukaj(args.szukaj):
+            print(f"{wynik['tytul']}\n  {wynik['url']}\n  {wynik['fragment']}\n")
+        return
+    
+    if args.batch:
+        formaty = args.format.split(',') if args.format else None
+        for sciezka in uruchom_zadanie_wsadowe(args.batch, formaty=formaty, katalog=args.katalog, ai=args.ai):
+            print(sciezka)
+        if args.trace:
+            zapisz_trace(args.trace)
+            print(args.trace)
+        return
+    
+    _zaladuj_tkinter()
+    root = tk.Tk()
+    app = OSINTUI(root)
+    root.mainloop()
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file